@@ -0,0 +1,70 @@
+"""
+Benchmark de memória por tabela: representação antiga (datas como objetos `date` e
+categorias como strings) x dtypes atuais (`datetime64[ns]` e `category`).
+
+Uso:
+    python -m benchmarks.benchmark_memoria_dtypes
+"""
+import io
+
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+from src.data.generate_fake_data import FakeData
+from src.schemas.dominios import CATEGORIAS, COLUNAS_DATA
+
+LOTES = {'pocos': 1_000, 'equipamentos': 10_000, 'producao': 200_000, 'incidentes': 20_000}
+
+
+def representacao_antiga(df: pd.DataFrame) -> pd.DataFrame:
+    """Converte o DataFrame de volta para objetos `date` e strings, como era gerado antes."""
+    df = df.copy()
+    for coluna in df.columns:
+        if coluna in COLUNAS_DATA:
+            df[coluna] = pd.Series(df[coluna].dt.date, index=df.index, dtype=object)
+        elif coluna in CATEGORIAS:
+            df[coluna] = pd.Series(df[coluna].astype(str), index=df.index, dtype=object)
+    return df
+
+
+def bytes_por_linha(df: pd.DataFrame) -> float:
+    """Memória total (deep) dividida pelo número de linhas."""
+    return df.memory_usage(deep=True).sum() / len(df)
+
+
+def main():
+    """Gera as quatro tabelas e compara bytes/linha nas duas representações."""
+    gerador = FakeData(usar_banco=False, seed=42)
+    with redirect_stdout(io.StringIO()):
+        df_pocos = gerador.generate_pocos_table(tamanho_lote=LOTES['pocos'])
+        df_equipamentos = gerador.generate_equipamentos_table(
+            tamanho_lote=LOTES['equipamentos'], df_pocos=df_pocos
+        )
+        df_producao = gerador.generate_producao_table(
+            tamanho_lote=LOTES['producao'], df_pocos=df_pocos, vetorizado=True
+        )
+        df_incidentes = gerador.generate_incidentes_table(
+            tamanho_lote=LOTES['incidentes'], df_equipamentos=df_equipamentos,
+            df_producao=df_producao, vetorizado=True
+        )
+
+    tabelas = {
+        'raw_pocos': df_pocos,
+        'raw_equipamentos': df_equipamentos,
+        'raw_producao': df_producao,
+        'raw_incidentes': df_incidentes,
+    }
+
+    print(f"{'tabela':>18} | {'linhas':>7} | {'antigo (B/linha)':>16} | {'atual (B/linha)':>15} | {'redução':>7}")
+    for nome_tabela, df in tabelas.items():
+        antigo = bytes_por_linha(representacao_antiga(df))
+        atual = bytes_por_linha(df)
+        print(
+            f"{nome_tabela:>18} | {len(df):>7} | {antigo:>16.0f} | {atual:>15.0f} | "
+            f"{antigo / atual:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
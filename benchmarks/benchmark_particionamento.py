@@ -0,0 +1,82 @@
+"""
+Benchmark de consultas de agregação mensal: raw_producao particionada x cópia sem partições.
+
+Precisa de um Banco de Dados com `raw_producao` já carregada. O script cria uma cópia
+comum da tabela (`raw_producao__bench_heap`), executa as mesmas consultas nas duas
+com `EXPLAIN ANALYZE` e remove a cópia no final.
+
+Uso:
+    python -m benchmarks.benchmark_particionamento
+"""
+import json
+
+from sqlalchemy import text
+
+from src.database.db_connection import GasDataBase
+
+TABELA = 'raw_producao'
+TABELA_HEAP = 'raw_producao__bench_heap'
+REPETICOES = 5
+
+CONSULTAS = {
+    'um mês por poço': """
+        SELECT cod_poco, sum(petroleo_barris_dia), avg(pressao_bar)
+          FROM {tabela}
+         WHERE data_producao >= :inicio AND data_producao < :inicio + interval '1 month'
+         GROUP BY cod_poco
+    """,
+    'últimos 3 meses por mês': """
+        SELECT date_trunc('month', data_producao) AS mes, sum(petroleo_barris_dia), sum(agua_produzida_m3)
+          FROM {tabela}
+         WHERE data_producao >= :inicio - interval '2 month' AND data_producao < :inicio + interval '1 month'
+         GROUP BY 1
+    """,
+}
+
+
+def medir(conn, sql: str, parametros: dict) -> float:
+    """Executa a consulta com EXPLAIN ANALYZE e retorna o menor tempo de execução (ms)."""
+    tempos = []
+    for _ in range(REPETICOES):
+        plano = conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"), parametros).scalar()
+        plano = json.loads(plano) if isinstance(plano, str) else plano
+        tempos.append(plano[0]['Execution Time'])
+    return min(tempos)
+
+
+def main():
+    """Compara as consultas mensais na tabela particionada e na cópia sem partições."""
+    db = GasDataBase()
+
+    with db.engine.begin() as conn:
+        inicio = conn.execute(text(
+            f"SELECT date_trunc('month', max(data_producao)) FROM {TABELA}"
+        )).scalar()
+        if inicio is None:
+            print(f"{TABELA} está vazia, carregue dados antes de rodar o benchmark.")
+            return
+
+        print(f"Criando cópia sem partições ({TABELA_HEAP})...")
+        conn.execute(text(f"DROP TABLE IF EXISTS {TABELA_HEAP}"))
+        conn.execute(text(f"CREATE TABLE {TABELA_HEAP} AS SELECT * FROM {TABELA}"))
+        conn.execute(text(f"ANALYZE {TABELA_HEAP}"))
+        conn.execute(text(f"ANALYZE {TABELA}"))
+
+    try:
+        print(f"{'consulta':>24} | {'sem partição (ms)':>17} | {'particionada (ms)':>17} | {'ganho':>7}")
+        with db.engine.connect() as conn:
+            for nome, sql in CONSULTAS.items():
+                tempo_heap = medir(conn, sql.format(tabela=TABELA_HEAP), {'inicio': inicio})
+                tempo_particionada = medir(conn, sql.format(tabela=TABELA), {'inicio': inicio})
+                print(
+                    f"{nome:>24} | {tempo_heap:>17,.1f} | {tempo_particionada:>17,.1f} | "
+                    f"{tempo_heap / tempo_particionada:>6.1f}x"
+                )
+
+    finally:
+        with db.engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {TABELA_HEAP}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Mede bytes por linha e tamanho dos índices de raw_producao antes e depois da
+conversão para os tipos compactos (`GasDataBase.migrate_compact_types`).
+
+Atenção: o script executa a migração no Banco de Dados configurado.
+
+Uso:
+    python -m benchmarks.benchmark_tamanho_linhas
+"""
+from sqlalchemy import text
+
+from src.database.db_connection import GasDataBase
+
+TABELA = 'raw_producao'
+
+
+def medir(db: GasDataBase) -> dict:
+    """Retorna linhas, largura média da tupla e tamanhos (somando as partições) da tabela."""
+    with db.engine.begin() as conn:
+        conn.execute(text(f"ANALYZE {TABELA}"))
+        linhas, largura = conn.execute(text(
+            f"SELECT count(*), COALESCE(avg(pg_column_size(t.*)), 0) FROM {TABELA} t"
+        )).one()
+        tabela, indices = conn.execute(text(
+            "SELECT COALESCE(sum(pg_table_size(relid)), 0), COALESCE(sum(pg_indexes_size(relid)), 0) "
+            "FROM pg_partition_tree(CAST(:tabela AS regclass)) WHERE isleaf"
+        ), {'tabela': TABELA}).one()
+
+    return {
+        'linhas': int(linhas),
+        'largura_tupla': float(largura),
+        'bytes_por_linha': tabela / linhas if linhas else 0.0,
+        'indices_mb': indices / 1024 ** 2,
+        'tabela_mb': tabela / 1024 ** 2,
+    }
+
+
+def main():
+    """Mede a tabela, converte as colunas para os tipos compactos e mede novamente."""
+    db = GasDataBase()
+
+    antes = medir(db)
+    if not antes['linhas']:
+        print(f"{TABELA} está vazia, carregue dados antes de rodar o benchmark.")
+        return
+
+    db.migrate_compact_types([TABELA])
+    depois = medir(db)
+
+    print(f"\n{TABELA}: {antes['linhas']} registros")
+    print(f"{'métrica':>16} | {'antes':>12} | {'depois':>12} | {'redução':>8}")
+    for metrica in ('largura_tupla', 'bytes_por_linha', 'tabela_mb', 'indices_mb'):
+        reducao = 1 - depois[metrica] / antes[metrica] if antes[metrica] else 0.0
+        print(f"{metrica:>16} | {antes[metrica]:>12,.1f} | {depois[metrica]:>12,.1f} | {reducao:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
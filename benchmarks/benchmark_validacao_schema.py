@@ -0,0 +1,60 @@
+"""
+Benchmark do custo de validação por chunk: schema montado a cada chamada x schema
+reaproveitado (`ValidateSchema.SCHEMAS`).
+
+Uso:
+    python -m benchmarks.benchmark_validacao_schema
+"""
+import io
+import time
+
+from contextlib import redirect_stdout
+
+from src.data.generate_fake_data import FakeData
+from src.schemas.schema_validacao import ValidateSchema, build_schemas
+
+TAMANHO_CHUNK = 1_000
+REPETICOES = 200
+
+
+def medir(chunk, nome_tabela: str, reaproveitar: bool) -> float:
+    """Valida o mesmo chunk `REPETICOES` vezes e retorna o tempo médio por chunk em ms."""
+    inicio = time.perf_counter()
+    for _ in range(REPETICOES):
+        schema = ValidateSchema.SCHEMAS[nome_tabela] if reaproveitar else build_schemas()[nome_tabela]
+        schema.validate(chunk, lazy=True)
+    return (time.perf_counter() - inicio) / REPETICOES * 1_000
+
+
+def main():
+    """Compara as duas formas para chunks de 1k registros de cada tabela."""
+    gerador = FakeData(usar_banco=False, seed=42)
+    with redirect_stdout(io.StringIO()):
+        df_pocos = gerador.generate_pocos_table(tamanho_lote=100)
+        df_equipamentos = gerador.generate_equipamentos_table(tamanho_lote=TAMANHO_CHUNK, df_pocos=df_pocos)
+        df_producao = gerador.generate_producao_table(
+            tamanho_lote=TAMANHO_CHUNK, df_pocos=df_pocos, vetorizado=True
+        )
+        df_incidentes = gerador.generate_incidentes_table(
+            tamanho_lote=TAMANHO_CHUNK, df_equipamentos=df_equipamentos, df_producao=df_producao, vetorizado=True
+        )
+
+    chunks = {
+        'raw_pocos': df_pocos,
+        'raw_equipamentos': df_equipamentos,
+        'raw_producao': df_producao,
+        'raw_incidentes': df_incidentes,
+    }
+
+    print(f"{'tabela':>18} | {'linhas':>6} | {'montando (ms)':>13} | {'cache (ms)':>10} | {'ganho':>7}")
+    for nome_tabela, chunk in chunks.items():
+        montando = medir(chunk, nome_tabela, reaproveitar=False)
+        cache = medir(chunk, nome_tabela, reaproveitar=True)
+        print(
+            f"{nome_tabela:>18} | {len(chunk):>6} | {montando:>13.2f} | {cache:>10.2f} | "
+            f"{montando / cache:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,24 @@
-from typing import Optional, Dict
+import asyncio
+import multiprocessing
+import queue
+import threading
+import time
+
+from typing import Optional, Dict, Iterator, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 from sqlalchemy import text
 
 from src.database.db_connection import GasDataBase
+from src.database.parallel_loader import ParallelLoader
+from src.database.shadow_loader import ShadowTableLoader
+from src.data.code_allocator import CodeAllocator
 from src.data.generate_fake_data import FakeData
+from src.data.sharded_generation import ShardedFakeData
 from src.schemas.schema_validacao import ValidateSchema
 
 class PipelineController():
@@ -18,15 +31,24 @@ class PipelineController():
     3. Inserção no Banco de Dados
     4. Relatórios de Execução.
     """
-    def __init__(self, db_connection: Optional[GasDataBase] = None):
+    DEFAULT_LOTES = {
+        'pocos': 100,
+        'equipamentos': 500,
+        'producao': 2000,
+        'incidentes': 250
+    }
+
+    def __init__(self, db_connection: Optional[GasDataBase] = None, seed: Optional[int] = None):
         """
         Inicializa o controller do Pipeline.
 
         Args:
             db_connection: Conexão com o Banco de Dados. Se none, cria uma nova.
+            seed: Semente da geração de dados, para execuções reproduzíveis.
         """
         self.db = db_connection if db_connection else GasDataBase()
-        self.generator = FakeData(db_connection=self.db)
+        self.seed = seed
+        self.generator = FakeData(db_connection=self.db, seed=seed)
         self.validador = ValidateSchema()
 
         self.execution_log = {
@@ -36,13 +58,29 @@ class PipelineController():
             'tables_generated': {},
             'tables_verified': {},
             'tables_inserted': {},
+            'tables_skipped': {},
+            'validation_sampling': {},
+            'tables_quarantined': {},
+            'memory_report': {},
             'errors': []
         }
 
     def run_full_pipeline(
         self,
         lotes: Optional[Dict[str, int]] = None,
-        skip_validation: bool = False
+        skip_validation: bool = False,
+        vetorizado: bool = False,
+        n_workers: Optional[int] = None,
+        metodo_insercao: str = 'orm',
+        n_conexoes: Optional[int] = None,
+        adiar_indices: bool = False,
+        assincrono: bool = False,
+        run_id: Optional[str] = None,
+        tamanho_commit: int = 100_000,
+        full_refresh: bool = False,
+        n_workers_validacao: Optional[int] = None,
+        amostra_validacao: Optional[int] = None,
+        quarentena: bool = False,
     ) -> Dict[str, any]:
         """
         Executa o pipeline completo: gerar dados -> validar dados -> inserir dados.
@@ -51,10 +89,47 @@ class PipelineController():
             lotes (Optional[Dict[str, any]]): Dicionário com os tamanhos de lote por tabela.
                                               Se None, usa os valores padrões.
             skip_validation: Se True, pula validação Pandera (não recomendado).
+            vetorizado: Se True, gera produção e incidentes no modo vetorizado (NumPy).
+            n_workers: Se informado, gera os dados em shards em um pool com essa quantidade
+                       de processos (resultado determinístico para o mesmo `seed`).
+            metodo_insercao: 'orm' (padrão), 'copy' (COPY FROM STDIN, para cargas grandes) ou
+                             'merge' (staging + ON CONFLICT DO NOTHING, idempotente).
+            n_conexoes: Se informado, carrega tabelas independentes em paralelo (respeitando
+                        as FKs) usando até essa quantidade de conexões, com commit por chunk.
+            adiar_indices: Se True, remove os índices não únicos durante a carga e os
+                           recria no final (recomendado para cargas muito grandes).
+            assincrono: Se True, insere com o `AsyncGasDataBase`, sobrepondo a carga das
+                        tabelas independentes ('orm' ou 'copy').
+            run_id: Se informado, a carga é retomável: commit a cada `tamanho_commit` linhas
+                    com checkpoint em `pipeline_checkpoints`. Rodar de novo com o mesmo
+                    `run_id` regenera os mesmos dados (mesma semente e códigos) e continua
+                    do último chunk commitado ('orm' ou 'copy').
+            tamanho_commit: Quantidade de linhas por commit no modo retomável.
+            full_refresh: Se True, substitui o conteúdo das tabelas: carrega cópias sombra
+                          UNLOGGED e troca pelas vivas com renomeações em uma transação curta,
+                          sem janela com tabelas vazias ('orm' ou 'copy').
+            n_workers_validacao: Se informado, valida cada tabela em chunks de linhas em um
+                                 pool com essa quantidade de processos (mesmo relatório de erros).
+            amostra_validacao: Se informado, valida em camadas: invariantes vetorizadas em todas
+                               as linhas e Pandera completo em uma amostra desse tamanho. O
+                               tamanho da amostra e a taxa de falhas ficam em
+                               `execution_log['validation_sampling']`.
+            quarentena: Se True, linhas reprovadas (no schema ou nas checagens entre tabelas)
+                        vão para as tabelas `quarantine_*` com os motivos, e as válidas
+                        seguem para a inserção, em vez de a execução inteira falhar. A
+                        quarentena sempre valida todas as linhas em um único processo.
 
         Returns:
             Dict com relatório de Execução.
 
+        Raises:
+            ValueError: Se forem combinados modos de inserção incompatíveis (`full_refresh`,
+                        `n_conexoes`, `assincrono` e `run_id` são exclusivos entre si, só
+                        aceitam 'orm' ou 'copy', e `adiar_indices` não se aplica ao
+                        `full_refresh`) ou de validação
+                        (`skip_validation`, `quarentena`, `n_workers_validacao` e
+                        `amostra_validacao` são exclusivos entre si).
+
         Example:
             >>> controller = PipelineController()
             >>> resultado = controller.run_full_pipeline(lotes={
@@ -64,19 +139,58 @@ class PipelineController():
             ...     'incidentes': 250
             ... })
         """
+        self._validar_modos_insercao(
+            metodo_insercao=metodo_insercao,
+            full_refresh=full_refresh,
+            n_conexoes=n_conexoes,
+            assincrono=assincrono,
+            run_id=run_id,
+            adiar_indices=adiar_indices,
+        )
+        self._validar_modos_validacao(
+            skip_validation=skip_validation,
+            quarentena=quarentena,
+            n_workers_validacao=n_workers_validacao,
+            amostra_validacao=amostra_validacao,
+        )
+
         try:
             self._log_start()
 
-            df = self._generate_data(lotes)
+            if run_id:
+                self._preparar_execucao_retomavel(run_id)
+
+            if n_workers:
+                df = self._generate_data_sharded(lotes, vetorizado=vetorizado, n_workers=n_workers)
+            else:
+                df = self._generate_data(lotes, vetorizado=vetorizado)
             if not df:
                 raise ValueError("Nenhum dado foi gerado.")
+            self._registrar_memoria(df)
             
-            if not skip_validation:
-                df = self._validate_data(df)
-            else:
+            if skip_validation:
                 print(f"Validação Pulada (skip_validation=True)")
+            elif quarentena:
+                df, rejeitados = self._validate_with_quarantine(df)
+                if rejeitados:
+                    self.execution_log['tables_quarantined'] = self.db.insert_quarantine(rejeitados)
+            else:
+                df = self._validate_data(
+                    df,
+                    n_workers=n_workers_validacao,
+                    tamanho_amostra=amostra_validacao,
+                )
 
-            resultado_insercao = self._insert_data(df)
+            resultado_insercao = self._insert_data(
+                df,
+                metodo=metodo_insercao,
+                n_conexoes=n_conexoes,
+                adiar_indices=adiar_indices,
+                assincrono=assincrono,
+                run_id=run_id,
+                tamanho_commit=tamanho_commit,
+                full_refresh=full_refresh,
+            )
             self._log_end(status='success')
             self._print_summary()
 
@@ -87,24 +201,323 @@ class PipelineController():
             print(f"Pipeline falhou: {e}")
             raise
 
-    def _generate_data(self, lotes: Optional[Dict[str, int]] = None) -> Dict[str, pd.DataFrame]:
+    def run_streaming_pipeline(
+        self,
+        lotes: Optional[Dict[str, int]] = None,
+        chunk_size: int = 100_000,
+        skip_validation: bool = False,
+        vetorizado: bool = True,
+        metodo_insercao: str = 'copy',
+        adiar_indices: bool = False,
+    ) -> Dict[str, any]:
+        """
+        Executa o pipeline em streaming: cada chunk é gerado, validado e inserido antes do próximo.
+
+        O pico de memória fica limitado ao tamanho do chunk. Apenas o mínimo necessário
+        para as FKs é mantido entre as tabelas: poços (código, tipo e data de perfuração),
+        equipamentos (código e poço) e a primeira data de produção de cada poço.
+
+        Args:
+            lotes (Optional[Dict[str, int]]): Dicionário com os tamanhos de lote por tabela.
+                                              Se None, usa os valores padrões.
+            chunk_size (int): Quantidade de registros por chunk.
+            skip_validation (bool): Se True, pula validação Pandera (não recomendado).
+            vetorizado (bool): Se True, gera produção e incidentes no modo vetorizado (NumPy).
+            metodo_insercao (str): 'copy' (padrão), 'orm' ou 'merge'.
+            adiar_indices (bool): Se True, remove os índices não únicos antes do primeiro
+                chunk e os recria depois do último.
+
+        Returns:
+            Dict com relatório de Execução.
+
+        Example:
+            >>> controller = PipelineController()
+            >>> controller.run_streaming_pipeline(lotes={
+            ...     'pocos': 1_000,
+            ...     'equipamentos': 5_000,
+            ...     'producao': 50_000_000,
+            ...     'incidentes': 100_000
+            ... }, chunk_size=200_000)
+        """
+        lotes = {**self.DEFAULT_LOTES, **(lotes or {})}
+        self._validar_modos_insercao(metodo_insercao=metodo_insercao)
+
+        try:
+            self._log_start()
+
+            adiamento = self.db.deferred_indexes() if adiar_indices else nullcontext()
+            with adiamento:
+                for nome_tabela, chunk in self._iter_chunks_em_ordem(lotes, chunk_size, vetorizado):
+                    self._process_chunk(nome_tabela, chunk, skip_validation, metodo_insercao)
+
+            self._log_end(status='success')
+            self._print_summary()
+
+            return self.execution_log
+
+        except Exception as e:
+            self._log_end(status='failed', error=str(e))
+            print(f"Pipeline falhou: {e}")
+            raise
+
+    def run_pipelined(
+        self,
+        lotes: Optional[Dict[str, int]] = None,
+        chunk_size: int = 100_000,
+        skip_validation: bool = False,
+        vetorizado: bool = True,
+        metodo_insercao: str = 'copy',
+        adiar_indices: bool = False,
+        tamanho_fila: int = 2,
+        n_workers_validacao: Optional[int] = None,
+    ) -> Dict[str, any]:
+        """
+        Executa o pipeline em streaming com as etapas sobrepostas.
+
+        Geração, validação e inserção rodam ao mesmo tempo, ligadas por filas limitadas:
+        a geração roda numa thread, a validação em outra e a inserção na thread principal.
+        Enquanto o Postgres ingere um chunk, os próximos já estão sendo gerados e validados,
+        e o tempo total se aproxima do da etapa mais lenta em vez da soma das três.
+
+        Os chunks entram nas filas na ordem das FKs (poços, equipamentos, produção,
+        incidentes) e são inseridos nessa mesma ordem. Quando uma fila enche, a etapa
+        anterior espera (backpressure), então no máximo `2 * tamanho_fila + 3` chunks
+        ficam em memória. Uma falha em qualquer etapa interrompe as outras e é relançada.
+
+        Args:
+            lotes (Optional[Dict[str, int]]): Dicionário com os tamanhos de lote por tabela.
+                                              Se None, usa os valores padrões.
+            chunk_size (int): Quantidade de registros por chunk.
+            skip_validation (bool): Se True, pula validação Pandera (não recomendado).
+            vetorizado (bool): Se True, gera produção e incidentes no modo vetorizado (NumPy).
+            metodo_insercao (str): 'copy' (padrão), 'orm' ou 'merge'.
+            adiar_indices (bool): Se True, remove os índices não únicos antes do primeiro
+                chunk e os recria depois do último.
+            tamanho_fila (int): Quantidade máxima de chunks esperando em cada fila.
+            n_workers_validacao (Optional[int]): Se informado, cada chunk é dividido entre os
+                                                 processos de um pool `forkserver`, criado uma vez
+                                                 antes das threads (um `fork` com threads ativas
+                                                 pode travar). Só compensa com chunks grandes.
+
+        Returns:
+            Dict com relatório de Execução. O tempo ocupado de cada etapa fica em
+            `execution_log['pipeline_stages']`.
+
+        Example:
+            >>> controller = PipelineController()
+            >>> controller.run_pipelined(lotes={
+            ...     'pocos': 1_000,
+            ...     'equipamentos': 5_000,
+            ...     'producao': 50_000_000,
+            ...     'incidentes': 100_000
+            ... }, chunk_size=200_000, n_workers_validacao=4)
+        """
+        lotes = {**self.DEFAULT_LOTES, **(lotes or {})}
+        self._validar_modos_insercao(metodo_insercao=metodo_insercao)
+        fila_validacao = queue.Queue(maxsize=tamanho_fila)
+        fila_insercao = queue.Queue(maxsize=tamanho_fila)
+        parar = threading.Event()
+        falhas = []
+        tempos = {'geracao': 0.0, 'validacao': 0.0, 'insercao': 0.0}
+
+        def gerar():
+            try:
+                chunks = self._iter_chunks_em_ordem(lotes, chunk_size, vetorizado)
+                while True:
+                    inicio = time.perf_counter()
+                    item = next(chunks, None)
+                    tempos['geracao'] += time.perf_counter() - inicio
+                    if item is None or not self._enfileirar(fila_validacao, item, parar):
+                        break
+            except Exception as e:
+                falhas.append(e)
+                parar.set()
+            finally:
+                self._enfileirar(fila_validacao, None, parar)
+
+        def validar():
+            try:
+                while True:
+                    item = self._desenfileirar(fila_validacao, parar)
+                    if item is None:
+                        break
+                    nome_tabela, chunk = item
+                    inicio = time.perf_counter()
+                    chunk = self._validate_chunk(
+                        nome_tabela, chunk, skip_validation, n_workers_validacao, executor=pool_validacao
+                    )
+                    tempos['validacao'] += time.perf_counter() - inicio
+                    if not self._enfileirar(fila_insercao, (nome_tabela, chunk), parar):
+                        break
+            except Exception as e:
+                falhas.append(e)
+                parar.set()
+            finally:
+                self._enfileirar(fila_insercao, None, parar)
+
+        pool_validacao = None
+
+        try:
+            self._log_start()
+
+            if n_workers_validacao and not skip_validation:
+                pool_validacao = ProcessPoolExecutor(
+                    max_workers=n_workers_validacao,
+                    mp_context=multiprocessing.get_context('forkserver'),
+                )
+
+            etapas = [
+                threading.Thread(target=gerar, name='pipeline-geracao', daemon=True),
+                threading.Thread(target=validar, name='pipeline-validacao', daemon=True),
+            ]
+            adiamento = self.db.deferred_indexes() if adiar_indices else nullcontext()
+            with adiamento:
+                for etapa in etapas:
+                    etapa.start()
+                try:
+                    while True:
+                        item = self._desenfileirar(fila_insercao, parar)
+                        if item is None:
+                            break
+                        nome_tabela, chunk = item
+                        inicio = time.perf_counter()
+                        self._insert_chunk(nome_tabela, chunk, metodo_insercao)
+                        tempos['insercao'] += time.perf_counter() - inicio
+                except Exception as e:
+                    falhas.append(e)
+                    parar.set()
+                finally:
+                    for etapa in etapas:
+                        etapa.join()
+
+                if falhas:
+                    raise falhas[0]
+
+            self.execution_log['pipeline_stages'] = tempos
+            self._log_end(status='success')
+            self._print_summary()
+
+            return self.execution_log
+
+        except Exception as e:
+            self.execution_log['pipeline_stages'] = tempos
+            self._log_end(status='failed', error=str(e))
+            print(f"Pipeline falhou: {e}")
+            raise
+
+        finally:
+            if pool_validacao is not None:
+                pool_validacao.shutdown()
+
+    @staticmethod
+    def _enfileirar(fila: queue.Queue, item, parar: threading.Event) -> bool:
+        """Coloca o item na fila esperando vaga; desiste (False) se o pipeline foi interrompido."""
+        while not parar.is_set():
+            try:
+                fila.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _desenfileirar(fila: queue.Queue, parar: threading.Event):
+        """Retira o próximo item da fila; retorna None no fim da fila ou se o pipeline foi interrompido."""
+        while not parar.is_set():
+            try:
+                return fila.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def _iter_chunks_em_ordem(
+        self,
+        lotes: Dict[str, int],
+        chunk_size: int,
+        vetorizado: bool = True,
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Gera os chunks das quatro tabelas na ordem das FKs, como pares (nome_tabela, chunk).
+
+        Apenas o mínimo necessário para as FKs é mantido entre as tabelas: poços (código,
+        tipo e data de perfuração), equipamentos (código e poço) e a primeira data de
+        produção de cada poço.
+
+        Args:
+            lotes (Dict[str, int]): Tamanhos de lote por tabela.
+            chunk_size (int): Quantidade de registros por chunk.
+            vetorizado (bool): Se True, gera produção e incidentes no modo vetorizado (NumPy).
+
+        Raises:
+            ValueError: Se alguma tabela não gerar nenhum chunk.
+        """
+        pocos = []
+        for chunk in self.generator.iter_pocos_chunks(
+            tamanho_lote=lotes['pocos'],
+            chunk_size=chunk_size,
+        ):
+            pocos.append(chunk[['codigo_poco', 'tipo_poco', 'data_perfuracao']])
+            yield 'raw_pocos', chunk
+
+        if not pocos:
+            raise ValueError("Falha ao gerar poços")
+        df_pocos = pd.concat(pocos, ignore_index=True)
+
+        equipamentos = []
+        for chunk in self.generator.iter_equipamentos_chunks(
+            tamanho_lote=lotes['equipamentos'],
+            df_pocos=df_pocos,
+            chunk_size=chunk_size,
+        ):
+            equipamentos.append(chunk[['cod_equipamento', 'cod_poco']])
+            yield 'raw_equipamentos', chunk
+
+        if not equipamentos:
+            raise ValueError("Falha ao gerar equipamentos")
+        df_equipamentos = pd.concat(equipamentos, ignore_index=True)
+
+        primeira_producao = None
+        for chunk in self.generator.iter_producao_chunks(
+            tamanho_lote=lotes['producao'],
+            df_pocos=df_pocos,
+            chunk_size=chunk_size,
+            vetorizado=vetorizado,
+        ):
+            minimo_chunk = chunk.groupby('cod_poco', sort=False, observed=True)['data_producao'].min()
+            primeira_producao = (
+                minimo_chunk if primeira_producao is None
+                else pd.concat([primeira_producao, minimo_chunk]).groupby(level=0).min()
+            )
+            yield 'raw_producao', chunk
+
+        if primeira_producao is None:
+            raise ValueError("Falha ao gerar registros de produção.")
+
+        for chunk in self.generator.iter_incidentes_chunks(
+            tamanho_lote=lotes['incidentes'],
+            df_equipamentos=df_equipamentos,
+            df_producao=primeira_producao.reset_index(),
+            chunk_size=chunk_size,
+            vetorizado=vetorizado,
+        ):
+            yield 'raw_incidentes', chunk
+
+    def _generate_data(
+        self,
+        lotes: Optional[Dict[str, int]] = None,
+        vetorizado: bool = False,
+    ) -> Dict[str, pd.DataFrame]:
         """
         Gera dados fake para todas as tabelas.
 
         Args:
             lotes (Optional[Dict[str, int]]): Tamanho de lote personalizados.
+            vetorizado (bool): Se True, usa a geração vetorizada de produção e incidentes.
 
         Returns:
             Dict com DataFrames gerados.
         """
-        default_lotes = {
-            'pocos': 100,
-            'equipamentos': 500,
-            'producao': 2000,
-            'incidentes': 250
-        }
-
-        lotes = lotes if lotes else default_lotes
+        lotes = lotes if lotes else self.DEFAULT_LOTES
         df = {}
 
         try:
@@ -134,7 +547,8 @@ class PipelineController():
             print(f"\nGerando {lotes.get('producao', 2000)} registros de produção...")
             df_producao = self.generator.generate_producao_table(
                 tamanho_lote=lotes.get('producao', 2000),
-                df_pocos=df_pocos
+                df_pocos=df_pocos,
+                vetorizado=vetorizado,
             )
 
             if df_producao.empty:
@@ -147,7 +561,8 @@ class PipelineController():
             df_incidentes = self.generator.generate_incidentes_table(
                 tamanho_lote=lotes.get('incidentes', 250),
                 df_equipamentos=df_equipamentos,
-                df_producao=df_producao
+                df_producao=df_producao,
+                vetorizado=vetorizado,
             )
 
             if df_incidentes.empty:
@@ -165,45 +580,175 @@ class PipelineController():
             self.execution_log['errors'].append(f"Erro na geração:{e}")
             raise
 
-    def _validate_data(self, df: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    def _preparar_execucao_retomavel(self, run_id: str) -> None:
+        """
+        Fixa a semente e o primeiro código de cada tabela da execução `run_id`.
+
+        Na primeira vez, registra a semente (sorteada se não informada) e a posição atual
+        dos códigos. Ao retomar, restaura os dois, para que a geração produza os mesmos
+        registros e códigos da execução interrompida (as datas relativas a "hoje" podem
+        mudar se a retomada for em outro dia; códigos e FKs continuam os mesmos).
+
+        Args:
+            run_id (str): Identificador da execução.
+        """
+        checkpoints = self.db.get_checkpoints(run_id)
+
+        if checkpoints:
+            self.seed = next(iter(checkpoints.values()))['seed']
+            self.generator = FakeData(db_connection=self.db, seed=self.seed)
+            for tabela, checkpoint in checkpoints.items():
+                _, prefixo, _ = FakeData.CODIGOS[tabela]
+                self.generator.alocadores[tabela] = CodeAllocator(
+                    prefixo=prefixo,
+                    inicio=checkpoint['codigo_inicial'],
+                    limite=self.generator.limite_codigos,
+                )
+            print(f"Retomando execução {run_id} (seed={self.seed})")
+            return
+
+        if self.seed is None:
+            self.seed = int(np.random.SeedSequence().entropy % 2**63)
+            self.generator = FakeData(db_connection=self.db, seed=self.seed)
+
+        codigos_iniciais = {
+            tabela: self.generator._get_alocador(tabela).proximo for tabela in FakeData.CODIGOS
+        }
+        self.db.start_checkpoints(run_id, self.seed, codigos_iniciais)
+        print(f"Execução retomável {run_id} registrada (seed={self.seed})")
+
+    def _generate_data_sharded(
+        self,
+        lotes: Optional[Dict[str, int]] = None,
+        vetorizado: bool = True,
+        n_workers: Optional[int] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Gera dados fake para todas as tabelas em shards, usando um pool de processos.
+
+        Args:
+            lotes (Optional[Dict[str, int]]): Tamanho de lote personalizados.
+            vetorizado (bool): Se True, usa a geração vetorizada de produção e incidentes.
+            n_workers (Optional[int]): Quantidade de processos do pool.
+
+        Returns:
+            Dict com DataFrames gerados.
+        """
+        lotes = {**self.DEFAULT_LOTES, **(lotes or {})}
+
+        try:
+            sharded = ShardedFakeData(
+                db_connection=self.db,
+                seed=self.seed,
+                n_workers=n_workers,
+                vetorizado=vetorizado,
+            )
+            # Compartilha os alocadores já posicionados (ex.: retomada de uma execução).
+            sharded.gerador.alocadores = self.generator.alocadores
+            df = sharded.generate_all(lotes)
+
+            for tabela, dados in df.items():
+                self.execution_log['tables_generated'][tabela] = len(dados)
+
+            total_gerado = sum(len(dfs) for dfs in df.values())
+            print(f"GERAÇÃO CONCLUÍDA: {total_gerado} registros no total")
+
+            return df
+
+        except Exception as e:
+            self.execution_log['errors'].append(f"Erro na geração:{e}")
+            raise
+
+    def _registrar_memoria(self, df: Dict[str, pd.DataFrame]) -> None:
+        """Registra em `execution_log['memory_report']` o tamanho em memória de cada DataFrame gerado."""
+        for nome_tabela, dados in df.items():
+            tamanho = int(dados.memory_usage(deep=True).sum())
+            self.execution_log['memory_report'][nome_tabela] = {
+                'linhas': len(dados),
+                'bytes': tamanho,
+                'bytes_por_linha': tamanho / len(dados) if len(dados) else 0.0,
+            }
+
+    def _validate_data(
+        self,
+        df: Dict[str, pd.DataFrame],
+        n_workers: Optional[int] = None,
+        tamanho_amostra: Optional[int] = None,
+    ) -> Dict[str, pd.DataFrame]:
         """
-        Valida todos os DataFrames com Pandera.
+        Valida todos os DataFrames com Pandera e, em seguida, as FKs e a ordem das datas
+        entre as tabelas (`ValidateSchema.validate_relationships`), antes de qualquer
+        acesso ao Banco de Dados.
 
         Args:
             df (Dict[str, DataFrame]): DataFrames para validar.
+            n_workers (Optional[int]): Se informado, usa `ValidateSchema.validate_table_parallel`
+                com essa quantidade de processos.
+            tamanho_amostra (Optional[int]): Se informado, usa `ValidateSchema.validate_sampled`
+                com uma amostra desse tamanho por tabela.
 
         Returns:
             DataFrames validados com Pandera.
+
+        Raises:
+            SchemaErrors: Se alguma tabela for reprovada no Pandera.
+            ValueError: Se alguma linha referenciar um código inexistente na carga ou tiver
+                data anterior à do registro referenciado.
         """
         validated = {}
         try:
-            if 'raw_pocos' in df:
-                print(f"\nValidando poços...")
-                validated['raw_pocos'] = self.validador.validate_pocos_table(
-                    df_pocos=df['raw_pocos']
-                )
-                self.execution_log['tables_verified']['raw_pocos'] = len(validated['raw_pocos'])
+            if tamanho_amostra:
+                for nome_tabela, dados in df.items():
+                    print(f"\nValidando {nome_tabela} (invariantes + amostra)...")
+                    validated[nome_tabela], relatorio = self.validador.validate_sampled(
+                        nome_tabela, dados, tamanho_amostra=tamanho_amostra, seed=self.seed
+                    )
+                    self.execution_log['validation_sampling'][nome_tabela] = relatorio
+                    self.execution_log['tables_verified'][nome_tabela] = len(validated[nome_tabela])
 
-            if 'raw_equipamentos' in df:
-                print(f"\nValidando equipamentos...")
-                validated['raw_equipamentos'] = self.validador.validate_equipamentos_table(
-                    df['raw_equipamentos']
-                )
-                self.execution_log['tables_verified']['raw_equipamentos'] = len(validated['raw_equipamentos'])
+            elif n_workers:
+                for nome_tabela, dados in df.items():
+                    print(f"\nValidando {nome_tabela} em paralelo ({n_workers} processos)...")
+                    validated[nome_tabela] = self.validador.validate_table_parallel(
+                        nome_tabela, dados, n_workers=n_workers
+                    )
+                    self.execution_log['tables_verified'][nome_tabela] = len(validated[nome_tabela])
 
-            if 'raw_producao' in df:
-                print(f"\nValidando registros de produção...")
-                validated['raw_producao'] = self.validador.validate_producao_table(
-                    df['raw_producao']
-                )
-                self.execution_log['tables_verified']['raw_producao'] = len(validated['raw_producao'])
+            else:
+                if 'raw_pocos' in df:
+                    print(f"\nValidando poços...")
+                    validated['raw_pocos'] = self.validador.validate_pocos_table(
+                        df_pocos=df['raw_pocos']
+                    )
+                    self.execution_log['tables_verified']['raw_pocos'] = len(validated['raw_pocos'])
 
-            if 'raw_incidentes' in df:
-                print(f"\nValidando registros de incidentes...")
-                validated['raw_incidentes'] = self.validador.validate_incidentes_table(
-                    df['raw_incidentes']
-                )
-                self.execution_log['tables_verified']['raw_incidentes'] = len(validated['raw_incidentes'])
+                if 'raw_equipamentos' in df:
+                    print(f"\nValidando equipamentos...")
+                    validated['raw_equipamentos'] = self.validador.validate_equipamentos_table(
+                        df['raw_equipamentos']
+                    )
+                    self.execution_log['tables_verified']['raw_equipamentos'] = len(validated['raw_equipamentos'])
+
+                if 'raw_producao' in df:
+                    print(f"\nValidando registros de produção...")
+                    validated['raw_producao'] = self.validador.validate_producao_table(
+                        df['raw_producao']
+                    )
+                    self.execution_log['tables_verified']['raw_producao'] = len(validated['raw_producao'])
+
+                if 'raw_incidentes' in df:
+                    print(f"\nValidando registros de incidentes...")
+                    validated['raw_incidentes'] = self.validador.validate_incidentes_table(
+                        df['raw_incidentes']
+                    )
+                    self.execution_log['tables_verified']['raw_incidentes'] = len(validated['raw_incidentes'])
+
+            print(f"\nValidando relacionamentos entre as tabelas...")
+            falhas = self.validador.validate_relationships(validated)
+            if not falhas.empty:
+                resumo = falhas.groupby(['tabela', 'check']).size()
+                detalhes = "\n".join(f"  {tabela} | {check}: {quantidade} linha(s)" for (tabela, check), quantidade in resumo.items())
+                raise ValueError(f"Falha nas checagens entre tabelas:\n{detalhes}")
 
             total_validado = sum(len(dfs) for dfs in validated.values())
             print(f"\nVALIDAÇÃO CONCLUÍDA: {total_validado} registros validados.")
@@ -214,18 +759,198 @@ class PipelineController():
             self.execution_log['errors'].append(f"Erro na validação: {e}")
             raise
 
-    def _insert_data(self, df: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+    def _validate_with_quarantine(
+        self,
+        df: Dict[str, pd.DataFrame],
+    ) -> Tuple[Dict[str, pd.DataFrame], Dict[str, pd.DataFrame]]:
+        """
+        Valida os DataFrames separando as linhas válidas das reprovadas.
+
+        Cada tabela é dividida com `ValidateSchema.split_valid_invalid`. Em seguida, as
+        checagens entre tabelas rodam sobre as linhas válidas e as que falham também vão
+        para a quarentena; isso se repete até estabilizar, porque rejeitar um equipamento
+        pode deixar incidentes sem referência.
+
+        Args:
+            df (Dict[str, DataFrame]): DataFrames para validar.
+
+        Returns:
+            Tuple[Dict, Dict]: (válidos, rejeitados com a coluna `motivos`) por tabela.
+        """
+        validated, rejeitados = {}, {}
+        try:
+            for nome_tabela, dados in df.items():
+                print(f"\nValidando {nome_tabela} (com quarentena)...")
+                validated[nome_tabela], rejeitados[nome_tabela] = self.validador.split_valid_invalid(nome_tabela, dados)
+
+            for _ in range(len(validated)):
+                falhas = self.validador.validate_relationships(validated)
+                if falhas.empty:
+                    break
+
+                for nome_tabela, casos in falhas.groupby('tabela', sort=False):
+                    motivos = pd.Series(
+                        [f"{coluna}: {check} ({caso})" for coluna, check, caso
+                         in zip(casos['column'], casos['check'], casos['failure_case'])],
+                        index=casos['index'],
+                    ).groupby(level=0).agg(list)
+
+                    dados = validated[nome_tabela]
+                    reprovadas = dados.index.isin(motivos.index)
+                    rejeitados[nome_tabela] = pd.concat([
+                        rejeitados[nome_tabela],
+                        dados[reprovadas].assign(motivos=motivos),
+                    ])
+                    validated[nome_tabela] = dados[~reprovadas]
+                    print(f"{nome_tabela}: {int(reprovadas.sum())} registro(s) reprovado(s) nas checagens entre tabelas")
+
+            for nome_tabela, dados in validated.items():
+                self.execution_log['tables_verified'][nome_tabela] = len(dados)
+
+            rejeitados = {nome: dados for nome, dados in rejeitados.items() if not dados.empty}
+            total_validado = sum(len(dfs) for dfs in validated.values())
+            total_rejeitado = sum(len(dfs) for dfs in rejeitados.values())
+            print(f"\nVALIDAÇÃO CONCLUÍDA: {total_validado} registros válidos, {total_rejeitado} em quarentena.")
+
+            return validated, rejeitados
+
+        except Exception as e:
+            self.execution_log['errors'].append(f"Erro na validação: {e}")
+            raise
+
+    @staticmethod
+    def _validar_modos_validacao(
+        skip_validation: bool = False,
+        quarentena: bool = False,
+        n_workers_validacao: Optional[int] = None,
+        amostra_validacao: Optional[int] = None,
+    ) -> None:
+        """
+        Rejeita combinações de modos de validação que o `run_full_pipeline` não consegue atender juntas.
+
+        A quarentena usa a própria validação (`ValidateSchema.split_valid_invalid`, em todas
+        as linhas e em um único processo), então não combina com a validação paralela nem
+        com a validação por amostra; estas duas também são alternativas entre si.
+
+        Raises:
+            ValueError: Se mais de um modo de validação for informado.
+        """
+        modos = {
+            'skip_validation': bool(skip_validation),
+            'quarentena': bool(quarentena),
+            'n_workers_validacao': bool(n_workers_validacao),
+            'amostra_validacao': bool(amostra_validacao),
+        }
+        escolhidos = [modo for modo, ativo in modos.items() if ativo]
+        if len(escolhidos) > 1:
+            raise ValueError(f"Modos de validação incompatíveis: {', '.join(escolhidos)}. Escolha apenas um.")
+
+    @staticmethod
+    def _validar_modos_insercao(
+        metodo_insercao: str = 'orm',
+        full_refresh: bool = False,
+        n_conexoes: Optional[int] = None,
+        assincrono: bool = False,
+        run_id: Optional[str] = None,
+        adiar_indices: bool = False,
+    ) -> None:
+        """
+        Rejeita combinações de modos de inserção que o `_insert_data` não consegue atender juntas.
+
+        Cada modo usa um carregador próprio, então só um deles pode ser escolhido por
+        execução. Sem essa checagem, um modo venceria o outro em silêncio: um `run_id`
+        combinado com `full_refresh` registraria checkpoints que a carga nunca usaria,
+        e uma nova execução com o mesmo `run_id` duplicaria os dados em vez de retomar.
+
+        O método também é conferido aqui, antes da geração: esses modos só aceitam
+        'orm' ou 'copy', e sem a checagem um 'merge' (ou um nome errado) só seria
+        rejeitado pelo carregador depois de gerar e validar tudo.
+
+        Raises:
+            ValueError: Se o método for inválido ou não suportado pelo modo escolhido, se
+                        mais de um modo for informado, ou `adiar_indices` com `full_refresh`.
+        """
+        if metodo_insercao not in ('orm', 'copy', 'merge'):
+            raise ValueError(f"Método de inserção inválido: {metodo_insercao}. Use 'orm', 'copy' ou 'merge'.")
+
+        modos = {
+            'full_refresh': bool(full_refresh),
+            'n_conexoes': bool(n_conexoes),
+            'assincrono': bool(assincrono),
+            'run_id': bool(run_id),
+        }
+        escolhidos = [modo for modo, ativo in modos.items() if ativo]
+        if len(escolhidos) > 1:
+            raise ValueError(f"Modos de inserção incompatíveis: {', '.join(escolhidos)}. Escolha apenas um.")
+
+        if escolhidos and metodo_insercao not in ('orm', 'copy'):
+            raise ValueError(
+                f"O modo {escolhidos[0]} aceita apenas os métodos 'orm' ou 'copy' (recebido: {metodo_insercao})."
+            )
+
+        if full_refresh and adiar_indices:
+            raise ValueError(
+                "adiar_indices não se aplica ao full_refresh: as tabelas sombra já são "
+                "carregadas sem índices e indexadas depois da carga."
+            )
+
+    def _insert_data(
+        self,
+        df: Dict[str, pd.DataFrame],
+        metodo: str = 'orm',
+        n_conexoes: Optional[int] = None,
+        adiar_indices: bool = False,
+        assincrono: bool = False,
+        run_id: Optional[str] = None,
+        tamanho_commit: int = 100_000,
+        full_refresh: bool = False,
+    ) -> Dict[str, int]:
         """
         Insere DataFrames no Banco de Dados.
 
         Args:
             df (Dict[str, DataFrame]): DataFrames validados para inserção.
+            metodo (str): 'orm', 'copy' ou 'merge'.
+            n_conexoes (Optional[int]): Se informado, usa o `ParallelLoader` ('orm' ou 'copy').
+            adiar_indices (bool): Se True, recria os índices não únicos só depois da carga.
+            assincrono (bool): Se True, usa o `AsyncGasDataBase` ('orm' ou 'copy').
+            run_id (Optional[str]): Se informado, usa a inserção retomável com checkpoints.
+            tamanho_commit (int): Linhas por commit na inserção retomável.
+            full_refresh (bool): Se True, substitui as tabelas com o `ShadowTableLoader`.
 
         Returns:
             Dict com a quantidade inserida por tabela.
         """
         try:
-            resultado = self.db.insert_values_into_db(data=df)
+            if full_refresh:
+                resultado = ShadowTableLoader(
+                    db_connection=self.db,
+                    metodo=metodo,
+                    chunk_size=tamanho_commit,
+                ).load(df)
+            elif n_conexoes:
+                loader = ParallelLoader(
+                    db_connection=self.db,
+                    max_workers=n_conexoes,
+                    metodo=metodo,
+                    adiar_indices=adiar_indices,
+                )
+                resultado = loader.load(df)
+                self.execution_log['load_throughput'] = loader.metricas
+            else:
+                adiamento = self.db.deferred_indexes(list(df.keys())) if adiar_indices else nullcontext()
+                with adiamento:
+                    if run_id:
+                        resultado = self.db.insert_values_in_chunks(
+                            df,
+                            run_id=run_id,
+                            chunk_size=tamanho_commit,
+                            metodo=metodo,
+                        )
+                    elif assincrono:
+                        resultado = asyncio.run(self._insert_data_async(df, metodo=metodo))
+                    else:
+                        resultado = self._load(data=df, metodo=metodo)
 
             self.execution_log['tables_inserted'] = resultado
 
@@ -238,6 +963,151 @@ class PipelineController():
             self.execution_log['errors'].append(f"Erro na inserção: {e}")
             raise
 
+    async def _insert_data_async(self, df: Dict[str, pd.DataFrame], metodo: str = 'orm') -> Dict[str, int]:
+        """
+        Insere os DataFrames com o `AsyncGasDataBase`, sobrepondo tabelas do mesmo nível de FK.
+
+        Args:
+            df (Dict[str, DataFrame]): DataFrames validados para inserção.
+            metodo (str): 'orm' ou 'copy'.
+
+        Returns:
+            Dict com a quantidade inserida por tabela.
+        """
+        # Import tardio: a API assíncrona depende de asyncpg e greenlet, opcionais no pipeline síncrono.
+        from src.database.db_async import AsyncGasDataBase
+
+        async with AsyncGasDataBase() as db_async:
+            return await db_async.insert_values_into_db(data=df, metodo=metodo)
+
+    def _process_chunk(
+        self,
+        nome_tabela: str,
+        chunk: pd.DataFrame,
+        skip_validation: bool = False,
+        metodo_insercao: str = 'orm',
+    ) -> pd.DataFrame:
+        """
+        Valida e insere um único chunk, acumulando as contagens no log de execução.
+
+        Args:
+            nome_tabela (str): Nome da tabela no Banco de Dados.
+            chunk (DataFrame): Chunk gerado.
+            skip_validation (bool): Se True, insere sem validar.
+            metodo_insercao (str): 'orm', 'copy' ou 'merge'.
+
+        Returns:
+            DataFrame: Chunk validado (ou o próprio chunk, se a validação foi pulada).
+        """
+        chunk = self._validate_chunk(nome_tabela, chunk, skip_validation)
+        self._insert_chunk(nome_tabela, chunk, metodo_insercao)
+        return chunk
+
+    def _validate_chunk(
+        self,
+        nome_tabela: str,
+        chunk: pd.DataFrame,
+        skip_validation: bool = False,
+        n_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> pd.DataFrame:
+        """
+        Valida um único chunk, acumulando as contagens de gerados e validados no log de execução.
+
+        Args:
+            nome_tabela (str): Nome da tabela no Banco de Dados.
+            chunk (DataFrame): Chunk gerado.
+            skip_validation (bool): Se True, devolve o chunk sem validar.
+            n_workers (Optional[int]): Se informado, divide o chunk entre `n_workers` processos
+                                       (`ValidateSchema.validate_table_parallel`).
+            executor (Optional[Executor]): Pool reaproveitado entre os chunks. Se None, cada
+                                           chamada cria o seu.
+
+        Returns:
+            DataFrame: Chunk validado (ou o próprio chunk, se a validação foi pulada).
+
+        Raises:
+            ValueError: Se o chunk for reprovado na validação.
+        """
+        validadores = {
+            'raw_pocos': self.validador.validate_pocos_table,
+            'raw_equipamentos': self.validador.validate_equipamentos_table,
+            'raw_producao': self.validador.validate_producao_table,
+            'raw_incidentes': self.validador.validate_incidentes_table,
+        }
+
+        log = self.execution_log
+        log['tables_generated'][nome_tabela] = log['tables_generated'].get(nome_tabela, 0) + len(chunk)
+
+        if skip_validation:
+            return chunk
+
+        try:
+            if n_workers:
+                validado = self.validador.validate_table_parallel(
+                    nome_tabela, chunk, n_workers=n_workers, chunk_size=-(-len(chunk) // n_workers),
+                    executor=executor,
+                )
+            else:
+                validado = validadores[nome_tabela](chunk)
+            if validado is None:
+                raise ValueError(f"Chunk de {nome_tabela} reprovado na validação.")
+            log['tables_verified'][nome_tabela] = log['tables_verified'].get(nome_tabela, 0) + len(validado)
+
+        except Exception as e:
+            log['errors'].append(f"Erro na validação: {e}")
+            raise
+
+        return validado
+
+    def _insert_chunk(self, nome_tabela: str, chunk: pd.DataFrame, metodo_insercao: str = 'orm') -> None:
+        """
+        Insere um único chunk já validado, acumulando a contagem de inseridos no log de execução.
+
+        Args:
+            nome_tabela (str): Nome da tabela no Banco de Dados.
+            chunk (DataFrame): Chunk validado.
+            metodo_insercao (str): 'orm', 'copy' ou 'merge'.
+        """
+        log = self.execution_log
+
+        try:
+            resultado = self._load(data={nome_tabela: chunk}, metodo=metodo_insercao)
+            log['tables_inserted'][nome_tabela] = (
+                log['tables_inserted'].get(nome_tabela, 0) + resultado.get(nome_tabela, 0)
+            )
+
+        except Exception as e:
+            log['errors'].append(f"Erro na inserção: {e}")
+            raise
+
+    def _load(self, data: Dict[str, pd.DataFrame], metodo: str = 'orm') -> Dict[str, int]:
+        """
+        Envia os DataFrames ao Banco de Dados com o método escolhido.
+
+        No método 'merge', os códigos já existentes são ignorados pelo Postgres e
+        contabilizados em `execution_log['tables_skipped']`.
+
+        Args:
+            data (Dict[str, DataFrame]): {nome_tabela: DataFrame}.
+            metodo (str): 'orm', 'copy' ou 'merge'.
+
+        Returns:
+            Dict com a quantidade inserida por tabela.
+        """
+        if metodo != 'merge':
+            return self.db.insert_values_into_db(data=data, metodo=metodo)
+
+        resultado_merge = self.db.merge_values_into_db(data=data, on_conflict='nothing')
+
+        resultado = {}
+        for tabela, contagem in resultado_merge.items():
+            resultado[tabela] = contagem['inseridos'] + contagem['atualizados']
+            ignorados = self.execution_log['tables_skipped'].get(tabela, 0)
+            self.execution_log['tables_skipped'][tabela] = ignorados + contagem['ignorados']
+
+        return resultado
+
     def _log_start(self):
         """Registra o inicio da execução."""
         self.execution_log['start_time'] = datetime.now()
@@ -252,6 +1122,7 @@ class PipelineController():
         """Registro o fim da execução."""
         self.execution_log['end_time'] = datetime.now()
         self.execution_log['status'] = status
+        self.execution_log['pool_metrics'] = self.db.pool_metrics()
 
         if error:
             self.execution_log['errors'].append(error)
@@ -278,9 +1149,34 @@ class PipelineController():
         for table, count in self.execution_log['tables_verified'].items():
             print(f"°{table}: {count}")
 
+        if self.execution_log.get('pipeline_stages'):
+            print(f"\nTEMPO OCUPADO POR ETAPA:")
+            for etapa, segundos in self.execution_log['pipeline_stages'].items():
+                print(f"°{etapa}: {segundos:.2f} segundos")
+
+        if self.execution_log['memory_report']:
+            print(f"\nMEMÓRIA DOS DATAFRAMES:")
+            for table, relatorio in self.execution_log['memory_report'].items():
+                print(f"°{table}: {relatorio['bytes'] / 1024 ** 2:.1f} MB ({relatorio['bytes_por_linha']:.0f} bytes/linha)")
+
+        if self.execution_log['validation_sampling']:
+            print(f"\nVALIDAÇÃO POR AMOSTRA:")
+            for table, relatorio in self.execution_log['validation_sampling'].items():
+                print(f"°{table}: amostra de {relatorio['amostra']}, taxa de falhas {relatorio['taxa_falhas']:.4%}")
+
+        if self.execution_log['tables_quarantined']:
+            print(f"\nREGISTROS EM QUARENTENA:")
+            for table, count in self.execution_log['tables_quarantined'].items():
+                print(f"°{table}: {count}")
+
         print(f"\nREGISTROS INSERIDOS:")
         for table, count in self.execution_log['tables_inserted'].items():
             print(f"°{table}: {count}")
+
+        if self.execution_log['tables_skipped']:
+            print(f"\nREGISTROS IGNORADOS (JÁ EXISTENTES):")
+            for table, count in self.execution_log['tables_skipped'].items():
+                print(f"°{table}: {count}")
         
         if self.execution_log['errors']:
             print(f"\nERROS:")
@@ -292,8 +1188,11 @@ class PipelineController():
         print(f"    Total de {total_inserido} registros inseridos no Banco de Dados.")
         print("=" * 70)
 
-    def check_database_status(self) -> Dict[str, int]:
+    def check_database_status(self, exato: bool = False) -> Dict[str, int]:
         """Verifica status atual do Banco de Dados.
+
+        Args:
+            exato: Se True, conta as linhas com `count(*)`; senão usa as estatísticas do Postgres.
         
         Returns:
             Dicionário com a contagem de registros por tabela.
@@ -302,11 +1201,20 @@ class PipelineController():
         print(f"VERIFICANDO STATUS DO BANCO DE DADOS")
         print("=" * 70)
 
-        status = self.db.check_table_values_into_db()
+        tabelas = list(self.db.orm_mapping.keys())
+        estatisticas = self.db.get_table_stats(tabelas)
+        if exato:
+            status = self.db.check_table_values_into_db(tabelas, exato=True)
+        else:
+            # A estimativa de linhas já vem na mesma consulta ao catálogo.
+            status = {table: estatisticas.get(table, {}).get('linhas', 0) for table in tabelas}
 
         print(f"\nResumo:")
         for table, count in status.items():
-            print(f"° {table}: {count} registros")
+            info = estatisticas.get(table, {})
+            ultima_carga = info.get('ultima_carga') or 'sem registro'
+            registros = f"{count}" if exato else f"~{count}"
+            print(f"° {table}: {registros} registros | {info.get('tamanho', '-')} | última carga: {ultima_carga}")
 
         total = sum(status.values())
         print(f"\n  Total: {total} registros no Banco de Dados")
@@ -317,6 +1225,9 @@ class PipelineController():
         """
         CUIDADO: Limpa todas as tabelas do Banco.
 
+        Para recarregar os dados sem deixar as tabelas vazias durante a carga, prefira
+        `run_full_pipeline(full_refresh=True)`.
+
         Args:
             confirm: Deve ser True para executar (segurança).
 
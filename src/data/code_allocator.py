@@ -0,0 +1,113 @@
+import numpy as np
+
+from typing import Optional
+
+
+class CodeAllocator():
+    """
+    Distribui códigos únicos sequenciais (ex.: POCO_101, PROD-42) por reserva de blocos.
+
+    Cada reserva apenas avança um contador, então o custo por código é O(1) e não
+    depende de quantos códigos já foram gerados, ao contrário do sorteio com
+    verificação de duplicidade em lista.
+    """
+    def __init__(
+            self,
+            prefixo: str,
+            inicio: int = 1,
+            limite: int = 10**12,
+        ):
+        """
+        Args:
+            prefixo (str): Prefixo do código, ex.: 'POCO_'.
+            inicio (int): Primeiro número que pode ser entregue.
+            limite (int): Maior número permitido no espaço de códigos.
+        """
+        if inicio > limite:
+            raise ValueError(f"Início ({inicio}) maior que o limite ({limite}) para '{prefixo}'.")
+
+        self.prefixo = prefixo
+        self.proximo = inicio
+        self.limite = limite
+
+    @classmethod
+    def from_database(
+            cls,
+            db_connection,
+            table_name: str,
+            code_column: str,
+            prefixo: str,
+            inicio: int = 1,
+            limite: int = 10**12,
+        ) -> "CodeAllocator":
+        """
+        Cria um alocador que continua a partir do maior código já salvo no Banco de Dados.
+
+        Args:
+            db_connection: Conexão com o Banco de Dados (GasDataBase) ou None.
+            table_name (str): Nome da tabela no mapeamento ORM.
+            code_column (str): Coluna que contém o código único.
+            prefixo (str): Prefixo do código.
+            inicio (int): Primeiro número usado quando a tabela está vazia.
+            limite (int): Maior número permitido no espaço de códigos.
+
+        Returns:
+            CodeAllocator: Alocador posicionado após o maior código existente.
+        """
+        maior_existente: Optional[int] = None
+        if db_connection:
+            maior_existente = db_connection.get_max_code_number(
+                table_name=table_name,
+                code_column=code_column,
+                prefixo=prefixo,
+            )
+        else:
+            print("Sem conexão com o banco, gerando sem verificação de duplicidade.")
+
+        if maior_existente is not None:
+            inicio = max(inicio, maior_existente + 1)
+
+        return cls(prefixo=prefixo, inicio=inicio, limite=limite)
+
+    @property
+    def disponiveis(self) -> int:
+        """Quantidade de códigos que ainda podem ser entregues."""
+        return self.limite - self.proximo + 1
+
+    def reservar(self, quantidade: int) -> np.ndarray:
+        """
+        Reserva um bloco contínuo de números.
+
+        Args:
+            quantidade (int): Quantidade de números a reservar.
+
+        Returns:
+            ndarray: Números reservados (int64), em ordem crescente.
+
+        Raises:
+            ValueError: Se o espaço de códigos não comportar a reserva.
+        """
+        if quantidade < 0:
+            raise ValueError("A quantidade reservada não pode ser negativa.")
+        if quantidade > self.disponiveis:
+            raise ValueError(
+                f"Espaço de códigos '{self.prefixo}' esgotado: {self.disponiveis} livres, "
+                f"{quantidade} solicitados."
+            )
+
+        numeros = np.arange(self.proximo, self.proximo + quantidade, dtype=np.int64)
+        self.proximo += quantidade
+        return numeros
+
+    def gerar_codigos(self, quantidade: int) -> np.ndarray:
+        """
+        Reserva um bloco e retorna os códigos já formatados.
+
+        Args:
+            quantidade (int): Quantidade de códigos.
+
+        Returns:
+            ndarray: Códigos no formato '<prefixo><número>'.
+        """
+        numeros = self.reservar(quantidade)
+        return np.char.add(self.prefixo, numeros.astype(str)).astype(object)
@@ -1,22 +1,119 @@
+import numpy as np
 import pandas as pd
 import random
 
-from datetime import timedelta
-from typing import Optional
+from datetime import date, timedelta
+from typing import Optional, Iterator
 from faker import Faker
 
+from src.data.code_allocator import CodeAllocator
 from src.database.db_connection import GasDataBase
-
-fake = Faker('pt_BR')
+from src.schemas.dominios import (
+    TIPOS_POCO, CAMADAS, STATUS_OPERACIONAL, OPERADORAS, TIPOS_EQUIPAMENTO, MARCAS,
+    TIPOS_INCIDENTE, SEVERIDADES, STATUS_RESOLUCAO, CATEGORIAS, COLUNAS_DATA
+)
 
 class FakeData():
     """Classe para criar as tabelas de exemplo do projeto usando Faker."""
-    def __init__(self, db_connection=None):
+
+    # {tabela: (coluna do código, prefixo, primeiro número)}
+    CODIGOS = {
+        'raw_pocos': ('codigo_poco', 'POCO_', 100),
+        'raw_equipamentos': ('cod_equipamento', 'EQUIP_', 100),
+        'raw_producao': ('cod_producao', 'PROD-', 1),
+        'raw_incidentes': ('cod_incidente', 'INC-', 1),
+    }
+
+    def __init__(
+            self,
+            db_connection=None,
+            usar_banco: bool = True,
+            limite_codigos: int = 10**12,
+            seed: Optional[int] = None,
+        ):
         """
         Args:
             db_connection: Conexão com o Banco de Dados (Opcional).
+            usar_banco (bool): Se False, gera os dados sem consultar o Banco de Dados
+                (sem verificação de duplicidade), útil para benchmarks.
+            limite_codigos (int): Maior número usado nos códigos únicos de cada tabela.
+            seed (Optional[int]): Semente dos geradores aleatórios desta instância.
+                Com a mesma semente, a mesma sequência de chamadas gera os mesmos dados.
+        """
+        if usar_banco:
+            self.db_connection = db_connection if db_connection else GasDataBase()
+        else:
+            self.db_connection = None
+
+        sementes = np.random.SeedSequence(seed)
+        semente_python, semente_faker = sementes.generate_state(2)
+
+        self.rng = np.random.default_rng(sementes)
+        self.random = random.Random(int(semente_python))
+        self.fake = Faker('pt_BR')
+        self.fake.seed_instance(int(semente_faker))
+        self.limite_codigos = limite_codigos
+        self.alocadores = {}
+
+    @staticmethod
+    def _aplicar_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converte as colunas de data para `datetime64[ns]` e as categóricas para `category`.
+
+        Uma data como `datetime64` ocupa 8 bytes, contra ~50 de um objeto `date`, e uma
+        categoria ocupa 1 byte por linha em vez de uma string Python por linha.
+
+        Args:
+            df (DataFrame): Chunk recém gerado.
+
+        Returns:
+            DataFrame: O mesmo chunk com os dtypes compactos.
+        """
+        for coluna in df.columns:
+            if coluna in CATEGORIAS:
+                df[coluna] = pd.Categorical(df[coluna], categories=list(CATEGORIAS[coluna]))
+            elif coluna in COLUNAS_DATA:
+                df[coluna] = pd.to_datetime(df[coluna]).astype('datetime64[ns]')
+        return df
+
+    def _get_alocador(self, table_name: str) -> CodeAllocator:
+        """
+        Retorna o `CodeAllocator` da tabela, criando-o na primeira chamada.
+
+        O alocador parte do maior código já salvo no Banco de Dados e é
+        reaproveitado nas gerações seguintes da mesma instância.
+
+        Args:
+            table_name (str): Nome da tabela (chave de `CODIGOS`).
+
+        Returns:
+            CodeAllocator: Alocador de códigos da tabela.
+        """
+        if table_name not in self.alocadores:
+            code_column, prefixo, inicio = self.CODIGOS[table_name]
+            self.alocadores[table_name] = CodeAllocator.from_database(
+                db_connection=self.db_connection,
+                table_name=table_name,
+                code_column=code_column,
+                prefixo=prefixo,
+                inicio=inicio,
+                limite=self.limite_codigos,
+            )
+
+        return self.alocadores[table_name]
+
+    def _gerar_codigos(self, table_name: str, quantidade: int) -> np.ndarray:
+        """
+        Reserva códigos únicos para uma tabela usando o `CodeAllocator` compartilhado.
+
+        Args:
+            table_name (str): Nome da tabela (chave de `CODIGOS`).
+            quantidade (int): Quantidade de códigos.
+
+        Returns:
+            ndarray: Códigos únicos formatados.
         """
-        self.db_connection = db_connection if db_connection else GasDataBase()
+        return self._get_alocador(table_name).gerar_codigos(quantidade)
 
     def generate_pocos_table(
             self,
@@ -32,74 +129,7 @@ class FakeData():
             Dataframe: DataFrame com os dados estruturados para validação com o Pandera.
         """
         try:
-            if self.db_connection:
-                pocos_cadastrados = self.db_connection.get_existing_codes(
-                    table_name='raw_pocos',
-                    code_column='codigo_poco',
-                )
-            else:
-                print("Sem conexão com o banco, gerando sem verificação de duplicidade.")
-                pocos_cadastrados = set()
-
-            chunk_size = 50
-            chunks = []
-            novos_pocos = []
-            
-            for chunk_start in range(0, tamanho_lote, chunk_size):
-                chunk_end = min(chunk_start + chunk_size, tamanho_lote)
-                chunk_data = []
-
-                for _ in range(chunk_start, chunk_end):
-                    try:
-                        while True:
-                            cod_poco = f"POCO_{random.randint(100, 6606)}"
-                            if cod_poco not in pocos_cadastrados and cod_poco not in novos_pocos:
-                                novos_pocos.append(cod_poco)
-                                break
-
-                        lista_pocos = [1, 2] # 1 = Marítimo | 2 = Terrestre
-                        tipo_poco = random.choices(lista_pocos, weights=[0.8, 0.2])[0]
-                        if tipo_poco == 1:
-                            profundidade = random.randint(2_000, 7_000)
-                            localizacao = random.choice(['Bacia de santos', 'Bacia de Campos', 'Bacia do Espírito Santos'])
-                        else:
-                            profundidade = random.randint(500, 3_000)
-                            localizacao = random.choice(['Bacia do Recôncavo', 'Bacia Potiguar'])
-
-                        camada = random.choices(['Pre-Sal', 'Pos-Sal'], weights=[0.78, 0.22])[0]
-                        status = random.choices(['Ativo', 'Manutenção', 'Inativo'], weights=[0.85, 0.10, 0.05])[0]
-                        operadora = random.choices(
-                            ['Petrobras', 'Shell', 'TotalEnergies', 'Equinor'],
-                            weights=[0.90, 0.05, 0.03, 0.02]
-                        )[0]
-
-                        chunk_data.append({
-                            "codigo_poco": cod_poco,
-                            "nome_poco": f"{fake.city()}-{random.randint(1, 100)}",
-                            "tipo_poco": tipo_poco,
-                            "localizacao": localizacao,
-                            "camada": camada,
-                            "profundidade_metros": profundidade,
-                            "status_operacional": status,
-                            "data_perfuracao": fake.date_between(start_date='-10y', end_date='-1y'),
-                            "operadora": operadora
-                        })
-
-                    except Exception as e:
-                        print(f"Erro ao gerar o poço: {e}")
-                        continue
-
-                if not chunk_data:
-                    continue
-
-                try:
-                    df_chunk = pd.DataFrame(chunk_data)
-                    chunks.append(df_chunk)
-
-                    print(f"    Gerados {chunk_end}/{tamanho_lote} cadastros...")
-                except Exception as e:
-                    print(f"    Erro ao criar o DataFrame do chunk: {str(e)}")
-                    continue
+            chunks = list(self.iter_pocos_chunks(tamanho_lote=tamanho_lote))
 
             if chunks:
                 df = pd.concat(chunks, ignore_index=True)
@@ -111,6 +141,65 @@ class FakeData():
         except Exception as e:
             print(f"Erro critico em generate_pocos_table: {str(e)}")
             return pd.DataFrame()
+
+    def iter_pocos_chunks(
+            self,
+            tamanho_lote: int = 100,
+            chunk_size: int = 50,
+        ) -> Iterator[pd.DataFrame]:
+        """
+        Gera os cadastros de Poços em chunks, sem manter o lote inteiro em memória.
+
+        Args:
+            - tamanho_lote (int): Quantidade total de registros.
+            - chunk_size (int): Quantidade de registros por chunk.
+
+        Yields:
+            DataFrame: Chunk com até `chunk_size` registros.
+        """
+        for chunk_start in range(0, tamanho_lote, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, tamanho_lote)
+            codigos = self._gerar_codigos('raw_pocos', chunk_end - chunk_start)
+            chunk_data = []
+
+            for cod_poco in codigos:
+                try:
+                    tipo_poco = self.random.choices(TIPOS_POCO, weights=[0.8, 0.2])[0]
+                    if tipo_poco == 1:
+                        profundidade = self.random.randint(2_000, 7_000)
+                        localizacao = self.random.choice(['Bacia de santos', 'Bacia de Campos', 'Bacia do Espírito Santos'])
+                    else:
+                        profundidade = self.random.randint(500, 3_000)
+                        localizacao = self.random.choice(['Bacia do Recôncavo', 'Bacia Potiguar'])
+
+                    camada = self.random.choices(CAMADAS, weights=[0.78, 0.22])[0]
+                    status = self.random.choices(STATUS_OPERACIONAL, weights=[0.85, 0.10, 0.05])[0]
+                    operadora = self.random.choices(
+                        OPERADORAS,
+                        weights=[0.90, 0.05, 0.03, 0.02]
+                    )[0]
+
+                    chunk_data.append({
+                        "codigo_poco": cod_poco,
+                        "nome_poco": f"{self.fake.city()}-{self.random.randint(1, 100)}",
+                        "tipo_poco": tipo_poco,
+                        "localizacao": localizacao,
+                        "camada": camada,
+                        "profundidade_metros": profundidade,
+                        "status_operacional": status,
+                        "data_perfuracao": self.fake.date_between(start_date='-10y', end_date='-1y'),
+                        "operadora": operadora
+                    })
+
+                except Exception as e:
+                    print(f"Erro ao gerar o poço: {e}")
+                    continue
+
+            if not chunk_data:
+                continue
+
+            print(f"    Gerados {chunk_end}/{tamanho_lote} cadastros...")
+            yield self._aplicar_dtypes(pd.DataFrame(chunk_data))
         
     def generate_equipamentos_table(
             self, 
@@ -132,79 +221,8 @@ class FakeData():
             if df_pocos is None or df_pocos.empty:
                 print("Erro: Não é possível gerar equipamentos, nenhum poço foi passado.")
                 return pd.DataFrame()
-            
-            if self.db_connection:
-                equipamentos_cadastrados = self.db_connection.get_existing_codes(
-                    table_name='raw_equipamentos',
-                    code_column='cod_equipamento'
-                )
-            else:
-                print("Sem conexão com o banco, gerando sem verificação de duplicidade.")
-                equipamentos_cadastrados = set()
-
-            chunk_size = 100
-            chunks = []
-            novos_equipamentos = []
-
-            nome_pocos = df_pocos[['codigo_poco', 'data_perfuracao']].to_dict('records')
-
-            for chunk_start in range(0, tamanho_lote, chunk_size):
-                chunk_end = min(chunk_start + chunk_size, tamanho_lote)
-                chunk_data = []
-
-                for _ in range(chunk_start, chunk_end):
-                    try:
-                        while True:
-                            cod_equipamento = f"EQUIP_{random.randint(100, 9_999)}"
-                            if cod_equipamento not in equipamentos_cadastrados and cod_equipamento not in novos_equipamentos:
-                                novos_equipamentos.append(cod_equipamento)
-                                break
-
-                        poco_selecionado = random.choice(nome_pocos)
-                        cod_poco = poco_selecionado['codigo_poco']
-                        data_perfuracao_poco = poco_selecionado['data_perfuracao']
-
-                        equipamento = random.choice(
-                            ['Bomba Submersível', 'FPSO', 'Válvula DHSV', 'Sistema de Elevação', 'Compressor', 'Separador']
-                        )
-                        marca = random.choice(
-                            ['Schulemberger', 'Haliburton', 'Baker Hughes', 'Weatherford', 'NOV']
-                        )
-                        modelo = f"{marca}-{equipamento}-{random.randint(100, 9_999)}"
-
-                        intervalo = random.randint(30, 75)
-                        data_instalacao = data_perfuracao_poco + timedelta(days=intervalo)
-                        vida_util = random.randint(10, 25)
-
-                        ultimo_teste = fake.date_between(start_date="-6m", end_date="today")
-                        eficiencia = random.uniform(0.6, 1)
-
-                        chunk_data.append({
-                            "cod_equipamento": cod_equipamento,
-                            "cod_poco": cod_poco,
-                            "tipo_equipamento": equipamento,
-                            "marca": marca,
-                            "modelo": modelo,
-                            "data_instalacao": data_instalacao,
-                            "vida_util_anos": vida_util,
-                            "ultimo_teste": ultimo_teste,
-                            "eficiencia_operacional": eficiencia
-                        }) 
-
-                    except Exception as e:
-                        print(f"Erro ao gerar equipamento: {str(e)}")
-                        return pd.DataFrame()
-                    
-                if not chunk_data:
-                    continue
-
-                try:
-                    df_chunk = pd.DataFrame(chunk_data)
-                    chunks.append(df_chunk)
 
-                    print(f"    Gerados {chunk_end}/{tamanho_lote} cadastros...")
-                except Exception as e:
-                    print(f"    Erro ao criar o DataFrame no chunk: {str(e)}")
+            chunks = list(self.iter_equipamentos_chunks(tamanho_lote=tamanho_lote, df_pocos=df_pocos))
 
             if chunks:
                 df = pd.concat(chunks, ignore_index=True)
@@ -216,12 +234,81 @@ class FakeData():
         except Exception as e:
             print(f"Erro crítico em generate_equipamentos_table: {str(e)}")
             return pd.DataFrame()
-        
+
+    def iter_equipamentos_chunks(
+            self,
+            tamanho_lote: int = 500,
+            df_pocos: Optional[pd.DataFrame] = None,
+            chunk_size: int = 100,
+        ) -> Iterator[pd.DataFrame]:
+        """
+        Gera os cadastros de Equipamentos em chunks, sem manter o lote inteiro em memória.
+
+        Args:
+            - tamanho_lote (int): Quantidade total de registros.
+            - df_pocos (Optional[DataFrame]): Poços usados como referência (codigo_poco, data_perfuracao).
+            - chunk_size (int): Quantidade de registros por chunk.
+
+        Yields:
+            DataFrame: Chunk com até `chunk_size` registros.
+
+        Raises:
+            ValueError: Se nenhum poço for passado.
+        """
+        if df_pocos is None or df_pocos.empty:
+            raise ValueError("Não é possível gerar equipamentos, nenhum poço foi passado.")
+
+        nome_pocos = df_pocos[['codigo_poco', 'data_perfuracao']].to_dict('records')
+
+        for chunk_start in range(0, tamanho_lote, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, tamanho_lote)
+            codigos = self._gerar_codigos('raw_equipamentos', chunk_end - chunk_start)
+            chunk_data = []
+
+            for cod_equipamento in codigos:
+                try:
+                    poco_selecionado = self.random.choice(nome_pocos)
+                    cod_poco = poco_selecionado['codigo_poco']
+                    data_perfuracao_poco = poco_selecionado['data_perfuracao']
+
+                    equipamento = self.random.choice(TIPOS_EQUIPAMENTO)
+                    marca = self.random.choice(MARCAS)
+                    modelo = f"{marca}-{equipamento}-{self.random.randint(100, 9_999)}"
+
+                    intervalo = self.random.randint(30, 75)
+                    data_instalacao = data_perfuracao_poco + timedelta(days=intervalo)
+                    vida_util = self.random.randint(10, 25)
+
+                    ultimo_teste = self.fake.date_between(start_date="-6m", end_date="today")
+                    eficiencia = self.random.uniform(0.6, 1)
+
+                    chunk_data.append({
+                        "cod_equipamento": cod_equipamento,
+                        "cod_poco": cod_poco,
+                        "tipo_equipamento": equipamento,
+                        "marca": marca,
+                        "modelo": modelo,
+                        "data_instalacao": data_instalacao,
+                        "vida_util_anos": vida_util,
+                        "ultimo_teste": ultimo_teste,
+                        "eficiencia_operacional": eficiencia
+                    }) 
+
+                except Exception as e:
+                    print(f"Erro ao gerar equipamento: {str(e)}")
+                    raise
+
+            if not chunk_data:
+                continue
+
+            print(f"    Gerados {chunk_end}/{tamanho_lote} cadastros...")
+            yield self._aplicar_dtypes(pd.DataFrame(chunk_data))
 
     def generate_producao_table(
             self,
             tamanho_lote: int = 500,
             df_pocos: Optional[pd.DataFrame] = None,
+            vetorizado: bool = False,
         ) -> pd.DataFrame:
         """
         Gera dados de produção aleatórios usando Faker e retorna um DataFrame.
@@ -230,6 +317,8 @@ class FakeData():
             - tamanho_lote (int): Quantidade de Dados a serem gerados, por padrão gera 500 registros.
             - df_pocos (Optinonal[DataFrame]): Lista de cadastro de poços gerados, usado para referenciar
                 os dados na hora da geração.
+            - vetorizado (bool): Se True, gera as colunas inteiras de uma vez com NumPy
+                em vez do loop linha a linha. Recomendado para lotes grandes.
 
         Returns:
             DataFrame: DataFrame com os dados estruturados para validação com Pandera.
@@ -238,83 +327,17 @@ class FakeData():
             if df_pocos is None or df_pocos.empty:
                 print("Erro: Não é possível gerar registros de produção, nenhum poço foi passado.")
                 return pd.DataFrame()
-            
-            if self.db_connection:
-                registros_producao = self.db_connection.get_existing_codes(
-                    table_name='raw_producao',
-                    code_column='cod_producao'
-                )
-            else:
-                print("Sem conexão com o banco, gerando sem verificação de duplicidade.")
-                registros_producao = set()
-
-            chunk_size = 100
-            chunks = []
-            novos_registros_producao = []
-
-            data_pocos = df_pocos[['codigo_poco', 'tipo_poco', 'data_perfuracao']].to_dict('records')
-
-            for chunk_start in range(0, tamanho_lote, chunk_size):
-                chunk_end = min(chunk_start + chunk_size, tamanho_lote)
-                chunk_data = []
-
-                for _ in range(chunk_start, chunk_end):
-                    try:
-                        while True:
-                            cod_producao = f"PROD-{random.randint(1, 9_999)}"
-                            if cod_producao not in registros_producao and cod_producao not in novos_registros_producao:
-                                registros_producao.add(cod_producao)
-                                break
-
-                        id_poco = random.choice(data_pocos)
-                        nome_poco = id_poco['codigo_poco']
-                        data_perfuracao = id_poco['data_perfuracao']
-                        tipo_poco = id_poco['tipo_poco']
-
-                        intervalo = random.randint(45, 90)
-                        data_producao = fake.date_between(
-                            start_date=(data_perfuracao + timedelta(days=intervalo)),
-                            end_date='today'
-                        )
-
-                        if tipo_poco == 1:
-                            producao_barris_dia = random.randint(50_000, 200_000)
-                        else:
-                            producao_barris_dia = random.randint(100, 5_000)
-
-                        agua_produzida = (producao_barris_dia * random.uniform(0.1, 0.4))
-                        tempo_operacao_horas = random.uniform(0.0, 24.0)
-                        pressao_bar = random.randint(150, 450)
-                        temperatura_celsius = random.uniform(60.0, 120.0)
-
-                        chunk_data.append({
-                            "cod_producao": cod_producao,
-                            "cod_poco": nome_poco,
-                            "data_producao": data_producao,
-                            "petroleo_barris_dia": producao_barris_dia,
-                            "agua_produzida_m3": agua_produzida,
-                            "tempo_horas_operacao": tempo_operacao_horas,
-                            "pressao_bar": pressao_bar,
-                            "temperatura_celsius": temperatura_celsius
-                        })
-
-                    except Exception as e:
-                        print(f"Erro ao gerar registro de produção: {str(e)}")
-                        return pd.DataFrame()
-
-                if not chunk_data:
-                    continue
 
-                try:
-                    df_chunk = pd.DataFrame(chunk_data)
-                    chunks.append(df_chunk)
-                    print(f"    Gerados {chunk_end}/{tamanho_lote} registros...")
-                except Exception as e:
-                    print(f"    Erro ao criar o DataFrame no chunk: {str(e)}")
+            chunks = list(self.iter_producao_chunks(
+                tamanho_lote=tamanho_lote,
+                df_pocos=df_pocos,
+                chunk_size=max(tamanho_lote, 1) if vetorizado else 100,
+                vetorizado=vetorizado,
+            ))
 
             if chunks:
                 df = pd.concat(chunks, ignore_index=True)
-                print(f"    Total de {len(df)} equipamentos gerados com suceso.")
+                print(f"    Total de {len(df)} registros de produção gerados com sucesso.")
                 return df
             else:
                 return pd.DataFrame()
@@ -322,12 +345,168 @@ class FakeData():
         except Exception as e:
             print(f"Erro crítico em generate_producao_table: {str(e)}")
             return pd.DataFrame()
+
+    def iter_producao_chunks(
+            self,
+            tamanho_lote: int = 500,
+            df_pocos: Optional[pd.DataFrame] = None,
+            chunk_size: int = 100,
+            vetorizado: bool = False,
+        ) -> Iterator[pd.DataFrame]:
+        """
+        Gera os registros de produção em chunks, sem manter o lote inteiro em memória.
+
+        Args:
+            - tamanho_lote (int): Quantidade total de registros.
+            - df_pocos (Optional[DataFrame]): Poços usados como referência
+                (codigo_poco, tipo_poco, data_perfuracao).
+            - chunk_size (int): Quantidade de registros por chunk.
+            - vetorizado (bool): Se True, cada chunk é gerado coluna a coluna com NumPy.
+
+        Yields:
+            DataFrame: Chunk com até `chunk_size` registros.
+
+        Raises:
+            ValueError: Se nenhum poço for passado.
+
+        Example:
+            >>> for chunk in gerador.iter_producao_chunks(50_000_000, df_pocos, chunk_size=100_000, vetorizado=True):
+            ...     db.insert_values_into_db({'raw_producao': chunk})
+        """
+        if df_pocos is None or df_pocos.empty:
+            raise ValueError("Não é possível gerar registros de produção, nenhum poço foi passado.")
+
+        data_pocos = df_pocos[['codigo_poco', 'tipo_poco', 'data_perfuracao']].to_dict('records')
+
+        for chunk_start in range(0, tamanho_lote, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, tamanho_lote)
+            codigos = self._gerar_codigos('raw_producao', chunk_end - chunk_start)
+
+            if vetorizado:
+                print(f"    Gerados {chunk_end}/{tamanho_lote} registros...")
+                yield self._generate_producao_vetorizado(
+                    tamanho_lote=chunk_end - chunk_start,
+                    df_pocos=df_pocos,
+                    codigos=codigos,
+                )
+                continue
+
+            chunk_data = []
+
+            for cod_producao in codigos:
+                try:
+                    id_poco = self.random.choice(data_pocos)
+                    nome_poco = id_poco['codigo_poco']
+                    data_perfuracao = id_poco['data_perfuracao']
+                    tipo_poco = id_poco['tipo_poco']
+
+                    intervalo = self.random.randint(45, 90)
+                    data_producao = self.fake.date_between(
+                        start_date=(data_perfuracao + timedelta(days=intervalo)),
+                        end_date='today'
+                    )
+
+                    if tipo_poco == 1:
+                        producao_barris_dia = self.random.randint(50_000, 200_000)
+                    else:
+                        producao_barris_dia = self.random.randint(100, 5_000)
+
+                    agua_produzida = (producao_barris_dia * self.random.uniform(0.1, 0.4))
+                    tempo_operacao_horas = self.random.uniform(0.0, 24.0)
+                    pressao_bar = self.random.randint(150, 450)
+                    temperatura_celsius = self.random.uniform(60.0, 120.0)
+
+                    chunk_data.append({
+                        "cod_producao": cod_producao,
+                        "cod_poco": nome_poco,
+                        "data_producao": data_producao,
+                        "petroleo_barris_dia": producao_barris_dia,
+                        "agua_produzida_m3": agua_produzida,
+                        "tempo_horas_operacao": tempo_operacao_horas,
+                        "pressao_bar": pressao_bar,
+                        "temperatura_celsius": temperatura_celsius
+                    })
+
+                except Exception as e:
+                    print(f"Erro ao gerar registro de produção: {str(e)}")
+                    raise
+
+            if not chunk_data:
+                continue
+
+            print(f"    Gerados {chunk_end}/{tamanho_lote} registros...")
+            yield self._aplicar_dtypes(pd.DataFrame(chunk_data))
+
+    def _sortear_datas_ate_hoje(self, inicio: np.ndarray) -> np.ndarray:
+        """
+        Sorteia, para cada data de início, uma data uniforme entre ela e hoje (inclusive).
+
+        Equivalente vetorizado de `fake.date_between(start_date=inicio, end_date='today')`.
+
+        Args:
+            inicio (ndarray): Datas de início (datetime64[D]).
+
+        Returns:
+            ndarray: Datas sorteadas (datetime64[ns]).
+        """
+        hoje = np.datetime64(date.today(), 'D')
+        dias_intervalo = np.maximum((hoje - inicio).astype(np.int64), 0)
+        deslocamento = np.floor(self.rng.random(len(inicio)) * (dias_intervalo + 1)).astype(np.int64)
+        return (inicio + deslocamento.astype('timedelta64[D]')).astype('datetime64[ns]')
+
+    def _generate_producao_vetorizado(
+            self,
+            tamanho_lote: int,
+            df_pocos: pd.DataFrame,
+            codigos: np.ndarray,
+        ) -> pd.DataFrame:
+        """
+        Gera os registros de produção coluna a coluna com NumPy.
+
+        Segue as mesmas regras do loop de `generate_producao_table`, mas sorteia
+        cada coluna inteira de uma vez, sem criar um dicionário por linha.
+
+        Args:
+            tamanho_lote (int): Quantidade de registros a serem gerados.
+            df_pocos (DataFrame): Poços usados como referência (codigo_poco, tipo_poco, data_perfuracao).
+            codigos (ndarray): Códigos de produção já reservados para o lote.
+
+        Returns:
+            DataFrame: DataFrame no mesmo schema aceito por `ValidateSchema.validate_producao_table`.
+        """
+        rng = self.rng
+
+        idx_poco = rng.integers(0, len(df_pocos), size=tamanho_lote)
+        cod_poco = df_pocos['codigo_poco'].to_numpy()[idx_poco]
+        tipo_poco = df_pocos['tipo_poco'].to_numpy()[idx_poco]
+        data_perfuracao = pd.to_datetime(df_pocos['data_perfuracao']).to_numpy().astype('datetime64[D]')[idx_poco]
+
+        inicio = data_perfuracao + rng.integers(45, 91, size=tamanho_lote).astype('timedelta64[D]')
+        data_producao = self._sortear_datas_ate_hoje(inicio)
+
+        petroleo_barris_dia = np.where(
+            tipo_poco == 1,
+            rng.integers(50_000, 200_001, size=tamanho_lote),
+            rng.integers(100, 5_001, size=tamanho_lote),
+        )
+
+        return self._aplicar_dtypes(pd.DataFrame({
+            "cod_producao": codigos,
+            "cod_poco": cod_poco,
+            "data_producao": data_producao,
+            "petroleo_barris_dia": petroleo_barris_dia,
+            "agua_produzida_m3": petroleo_barris_dia * rng.uniform(0.1, 0.4, size=tamanho_lote),
+            "tempo_horas_operacao": rng.uniform(0.0, 24.0, size=tamanho_lote),
+            "pressao_bar": rng.integers(150, 451, size=tamanho_lote),
+            "temperatura_celsius": rng.uniform(60.0, 120.0, size=tamanho_lote),
+        }))
         
     def generate_incidentes_table(
             self,
             tamanho_lote: int = 300,
             df_equipamentos: Optional[pd.DataFrame] = None,
-            df_producao: Optional[pd.DataFrame] = None
+            df_producao: Optional[pd.DataFrame] = None,
+            vetorizado: bool = False,
         ) -> pd.DataFrame:
         """
         Gera dados de incidentes usando Fake e retorna um DataFrame.
@@ -338,6 +517,8 @@ class FakeData():
                 usado para referenciar os dados na hora da geração.
             df_producao (Optional[DataFrame]): DataFrame com os registros de produção usado para
                 referenciar os dados de *data* na hora da geração
+            vetorizado (bool): Se True, sorteia todas as colunas de uma vez com NumPy
+                a partir do índice por poço.
         
         Returns:
             DataFrame: DataFrame com os dados estruturados para validação com Pandera.
@@ -349,84 +530,14 @@ class FakeData():
             elif df_producao is None or df_producao.empty:
                 print("Erro: Não foi possível gerar registros de incidentes. Nenhum registro de produção foi passado.")
                 return pd.DataFrame()
-            
-            if self.db_connection:
-                incidentes_cadastrados = self.db_connection.get_existing_codes(
-                    table_name='raw_incidentes',
-                    code_column='cod_incidente'
-                )
-            else:
-                print("Sem conexão com o banco, gerando sem verificação de duplicidade.")
-                incidentes_cadastrados = set()
-
-            chunk_size = 100
-            chunks = []
-            novos_incidentes = []
-
-            data_equipamentos = df_equipamentos[['cod_equipamento', 'cod_poco']].to_dict('records')
-            data_producao = df_producao[['cod_poco', 'data_producao']].to_dict('records')
-
-            for chunk_start in range(0, tamanho_lote, chunk_size):
-                chunk_end = min(chunk_start + chunk_size, tamanho_lote)
-                chunk_data = []
-
-                for _ in range(chunk_start, chunk_end):
-                    try:
-                        while True:
-                            cod_incidente = f"INC-{random.randint(1, 9_999)}"
-                            if cod_incidente not in novos_incidentes and cod_incidente not in incidentes_cadastrados:
-                                incidentes_cadastrados.add(cod_incidente)
-                                break
-
-                        id_equipamento = random.choice(data_equipamentos)
-                        cod_equipamento = id_equipamento['cod_equipamento']
-                        cod_poco = id_equipamento['cod_poco']
-
-                        producoes_poco = [
-                            prod for prod in data_producao if prod['cod_poco'] == cod_poco
-                        ]
-                        if not producoes_poco:
-                            continue
-
-                        datas_producao = [prod['data_producao'] for prod in producoes_poco]
-                        dias_producao_min = min(datas_producao)
-                        data_incidente = fake.date_between(start_date=dias_producao_min, end_date='today')
-                        
-                        tipo_incidente = [
-                            'Falha de Equipamento', 'Parada Programada', 'Vazamento Contido',
-                            'Queda de Pressão', 'Obstrução', 'Manutenção Emergencial'
-                            ]
-                        
-                        severidade = random.choices(['Baixa', 'Média', 'Alta'], weights=[0.5, 0.35, 0.15])[0]
-                        tempo_parada_horas = random.uniform(1.0, 168.0)
-                        custo_estimado_reais = random.randint(50_000, 5_000_000)
-                        status_resolucao = random.choices(['Resolvido', 'Em Andamento', 'Pendente'], weights=[0.7, 0.2, 0.1])[0]
-
-                        chunk_data.append({
-                            "cod_incidente": cod_incidente,
-                            "cod_poco": cod_poco,
-                            "cod_equipamento": cod_equipamento,
-                            "data_incidente": data_incidente,
-                            "tipo_incidente": random.choice(tipo_incidente),
-                            "severidade": severidade,
-                            "tempo_parada_horas": tempo_parada_horas,
-                            "custo_estimado_reais": custo_estimado_reais,
-                            "status_resolucao": status_resolucao
-                        })
-
-                    except Exception as e:
-                        print(f"Erro ao gerar registros de incidentes: {str(e)}")
-                        return pd.DataFrame()
-                
-                if not chunk_data:
-                    continue
 
-                try:
-                    df_chunk = pd.DataFrame(chunk_data)
-                    chunks.append(df_chunk)
-                    print(f"    Gerados {chunk_end}/{tamanho_lote} registros gerados.")
-                except Exception as e:
-                    print(f"    Erro ao criar o DataFrame no chunk: {str(e)}")
+            chunks = list(self.iter_incidentes_chunks(
+                tamanho_lote=tamanho_lote,
+                df_equipamentos=df_equipamentos,
+                df_producao=df_producao,
+                chunk_size=max(tamanho_lote, 1) if vetorizado else 100,
+                vetorizado=vetorizado,
+            ))
 
             if chunks:
                 df = pd.concat(chunks, ignore_index=True)
@@ -437,4 +548,165 @@ class FakeData():
 
         except Exception as e:
             print(f"Erro crítico em generate_incidentes_table: {str(e)}")
-            return pd.DataFrame()
\ No newline at end of file
+            return pd.DataFrame()
+
+    def iter_incidentes_chunks(
+            self,
+            tamanho_lote: int = 300,
+            df_equipamentos: Optional[pd.DataFrame] = None,
+            df_producao: Optional[pd.DataFrame] = None,
+            chunk_size: int = 100,
+            vetorizado: bool = False,
+        ) -> Iterator[pd.DataFrame]:
+        """
+        Gera os registros de incidentes em chunks, sem manter o lote inteiro em memória.
+
+        Como só a primeira data de produção de cada poço é usada, `df_producao` pode
+        ser apenas o resumo (cod_poco, data_producao) mantido durante uma carga em streaming.
+
+        Args:
+            tamanho_lote (int): Quantidade total de registros.
+            df_equipamentos (Optional[DataFrame]): Equipamentos (cod_equipamento, cod_poco).
+            df_producao (Optional[DataFrame]): Registros (ou resumo) de produção (cod_poco, data_producao).
+            chunk_size (int): Quantidade de registros por chunk.
+            vetorizado (bool): Se True, cada chunk é gerado coluna a coluna com NumPy.
+
+        Yields:
+            DataFrame: Chunk com até `chunk_size` registros.
+
+        Raises:
+            ValueError: Se faltar equipamentos ou registros de produção.
+        """
+        if df_equipamentos is None or df_equipamentos.empty:
+            raise ValueError("Não foi possível gerar registros de incidentes. Nenhum equipamento foi passado.")
+        if df_producao is None or df_producao.empty:
+            raise ValueError("Não foi possível gerar registros de incidentes. Nenhum registro de produção foi passado.")
+
+        indice_pocos = self._build_indice_pocos(df_equipamentos, df_producao)
+        if vetorizado and indice_pocos.empty:
+            raise ValueError("Nenhum equipamento pertence a um poço com registros de produção.")
+
+        data_equipamentos = df_equipamentos[['cod_equipamento', 'cod_poco']].to_dict('records')
+        primeira_producao = dict(zip(indice_pocos['cod_poco'], indice_pocos['primeira_producao']))
+
+        for chunk_start in range(0, tamanho_lote, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, tamanho_lote)
+            codigos = self._gerar_codigos('raw_incidentes', chunk_end - chunk_start)
+
+            if vetorizado:
+                print(f"    Gerados {chunk_end}/{tamanho_lote} registros gerados.")
+                yield self._generate_incidentes_vetorizado(
+                    tamanho_lote=chunk_end - chunk_start,
+                    indice_pocos=indice_pocos,
+                    codigos=codigos,
+                )
+                continue
+
+            chunk_data = []
+
+            for cod_incidente in codigos:
+                try:
+                    id_equipamento = self.random.choice(data_equipamentos)
+                    cod_equipamento = id_equipamento['cod_equipamento']
+                    cod_poco = id_equipamento['cod_poco']
+
+                    dias_producao_min = primeira_producao.get(cod_poco)
+                    if dias_producao_min is None:
+                        continue
+
+                    data_incidente = self.fake.date_between(start_date=dias_producao_min, end_date='today')
+                    
+                    severidade = self.random.choices(SEVERIDADES, weights=[0.5, 0.35, 0.15])[0]
+                    tempo_parada_horas = self.random.uniform(1.0, 168.0)
+                    custo_estimado_reais = self.random.randint(50_000, 5_000_000)
+                    status_resolucao = self.random.choices(STATUS_RESOLUCAO, weights=[0.7, 0.2, 0.1])[0]
+
+                    chunk_data.append({
+                        "cod_incidente": cod_incidente,
+                        "cod_poco": cod_poco,
+                        "cod_equipamento": cod_equipamento,
+                        "data_incidente": data_incidente,
+                        "tipo_incidente": self.random.choice(TIPOS_INCIDENTE),
+                        "severidade": severidade,
+                        "tempo_parada_horas": tempo_parada_horas,
+                        "custo_estimado_reais": custo_estimado_reais,
+                        "status_resolucao": status_resolucao
+                    })
+
+                except Exception as e:
+                    print(f"Erro ao gerar registros de incidentes: {str(e)}")
+                    raise
+            
+            if not chunk_data:
+                continue
+
+            print(f"    Gerados {chunk_end}/{tamanho_lote} registros gerados.")
+            yield self._aplicar_dtypes(pd.DataFrame(chunk_data))
+
+    def _build_indice_pocos(
+            self,
+            df_equipamentos: pd.DataFrame,
+            df_producao: pd.DataFrame,
+        ) -> pd.DataFrame:
+        """
+        Monta, uma única vez, o índice equipamento -> poço -> primeira data de produção.
+
+        Substitui a busca linear em todos os registros de produção a cada incidente
+        por um `groupby` sobre a coluna inteira.
+
+        Args:
+            df_equipamentos (DataFrame): Equipamentos (cod_equipamento, cod_poco).
+            df_producao (DataFrame): Registros de produção (cod_poco, data_producao).
+
+        Returns:
+            DataFrame: Colunas cod_equipamento, cod_poco e primeira_producao, apenas
+                para equipamentos cujo poço possui produção.
+        """
+        primeira_producao = (
+            df_producao.groupby('cod_poco', sort=False)['data_producao']
+            .min()
+            .rename('primeira_producao')
+            .reset_index()
+        )
+
+        return df_equipamentos[['cod_equipamento', 'cod_poco']].merge(
+            primeira_producao,
+            on='cod_poco',
+            how='inner',
+        )
+
+    def _generate_incidentes_vetorizado(
+            self,
+            tamanho_lote: int,
+            indice_pocos: pd.DataFrame,
+            codigos: np.ndarray,
+        ) -> pd.DataFrame:
+        """
+        Gera os registros de incidentes coluna a coluna a partir do índice por poço.
+
+        Args:
+            tamanho_lote (int): Quantidade de registros a serem gerados.
+            indice_pocos (DataFrame): Resultado de `_build_indice_pocos`.
+            codigos (ndarray): Códigos de incidentes já reservados para o lote.
+
+        Returns:
+            DataFrame: DataFrame no mesmo schema aceito por `ValidateSchema.validate_incidentes_table`.
+        """
+        rng = self.rng
+
+        idx = rng.integers(0, len(indice_pocos), size=tamanho_lote)
+        primeira_producao = pd.to_datetime(indice_pocos['primeira_producao']).to_numpy().astype('datetime64[D]')[idx]
+
+        return self._aplicar_dtypes(pd.DataFrame({
+            "cod_incidente": codigos,
+            "cod_poco": indice_pocos['cod_poco'].to_numpy()[idx],
+            "cod_equipamento": indice_pocos['cod_equipamento'].to_numpy()[idx],
+            "data_incidente": self._sortear_datas_ate_hoje(primeira_producao),
+            "tipo_incidente": rng.choice(TIPOS_INCIDENTE, size=tamanho_lote),
+            "severidade": rng.choice(SEVERIDADES, size=tamanho_lote, p=[0.5, 0.35, 0.15]),
+            "tempo_parada_horas": rng.uniform(1.0, 168.0, size=tamanho_lote),
+            "custo_estimado_reais": rng.integers(50_000, 5_000_001, size=tamanho_lote),
+            "status_resolucao": rng.choice(
+                STATUS_RESOLUCAO, size=tamanho_lote, p=[0.7, 0.2, 0.1]
+            ),
+        }))
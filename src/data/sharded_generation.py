@@ -0,0 +1,232 @@
+import io
+import os
+import numpy as np
+import pandas as pd
+
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, List, Tuple
+
+from src.data.code_allocator import CodeAllocator
+from src.data.generate_fake_data import FakeData
+
+# Ordem de geração (respeita as FKs) e chave de `lotes` de cada tabela.
+TABELAS = [
+    ('raw_pocos', 'pocos'),
+    ('raw_equipamentos', 'equipamentos'),
+    ('raw_producao', 'producao'),
+    ('raw_incidentes', 'incidentes'),
+]
+
+
+def _gerar_shard(tarefa: Tuple) -> pd.DataFrame:
+    """
+    Gera um shard de uma tabela em um processo do pool.
+
+    Cada shard usa sua própria instância de `FakeData`, sem Banco de Dados,
+    com a semente derivada do shard e um `CodeAllocator` posicionado no início
+    do bloco de códigos reservado pelo processo principal.
+
+    Args:
+        tarefa (Tuple): (tabela, semente, primeiro_codigo, tamanho, vetorizado, referencias).
+
+    Returns:
+        DataFrame: Registros gerados pelo shard.
+
+    Raises:
+        ValueError: Se o shard gerar menos registros do que o pedido.
+    """
+    tabela, semente, primeiro_codigo, tamanho, vetorizado, referencias = tarefa
+
+    gerador = FakeData(usar_banco=False, seed=semente)
+    _, prefixo, _ = FakeData.CODIGOS[tabela]
+    gerador.alocadores[tabela] = CodeAllocator(
+        prefixo=prefixo,
+        inicio=primeiro_codigo,
+        limite=primeiro_codigo + tamanho - 1,
+    )
+
+    # Chama os geradores `iter_*` direto (e não os `generate_*`, que devolvem um
+    # DataFrame vazio em caso de erro), para que a falha de um shard chegue ao pool.
+    with redirect_stdout(io.StringIO()):
+        if tabela == 'raw_pocos':
+            chunks = gerador.iter_pocos_chunks(tamanho_lote=tamanho)
+        elif tabela == 'raw_equipamentos':
+            chunks = gerador.iter_equipamentos_chunks(
+                tamanho_lote=tamanho,
+                df_pocos=referencias['df_pocos'],
+            )
+        elif tabela == 'raw_producao':
+            chunks = gerador.iter_producao_chunks(
+                tamanho_lote=tamanho,
+                df_pocos=referencias['df_pocos'],
+                chunk_size=tamanho if vetorizado else 100,
+                vetorizado=vetorizado,
+            )
+        else:
+            chunks = gerador.iter_incidentes_chunks(
+                tamanho_lote=tamanho,
+                df_equipamentos=referencias['df_equipamentos'],
+                df_producao=referencias['df_producao'],
+                chunk_size=tamanho if vetorizado else 100,
+                vetorizado=vetorizado,
+            )
+        chunks = list(chunks)
+
+    gerados = sum(len(chunk) for chunk in chunks)
+    if gerados != tamanho:
+        raise ValueError(f"Shard de {tabela} (código inicial {primeiro_codigo}) gerou {gerados} de {tamanho} registros.")
+
+    return pd.concat(chunks, ignore_index=True)
+
+
+class ShardedFakeData():
+    """
+    Geração de dados fake dividida em shards e executada em um pool de processos.
+
+    Cada tabela é quebrada em shards de tamanho fixo. A semente de cada shard é
+    derivada de (semente, tabela, shard) e os códigos são reservados em blocos
+    pelo processo principal, então o mesmo `seed` gera o mesmo conjunto de dados
+    com qualquer quantidade de workers, com códigos únicos e FKs consistentes.
+    """
+    def __init__(
+            self,
+            db_connection=None,
+            usar_banco: bool = True,
+            seed: Optional[int] = None,
+            n_workers: Optional[int] = None,
+            tamanho_shard: int = 50_000,
+            vetorizado: bool = True,
+            limite_codigos: int = 10**12,
+        ):
+        """
+        Args:
+            db_connection: Conexão com o Banco de Dados (Opcional).
+            usar_banco (bool): Se False, não consulta o Banco de Dados para posicionar os códigos.
+            seed (Optional[int]): Semente global. Se None, uma semente é sorteada e exibida.
+            n_workers (Optional[int]): Quantidade de processos. Se None, usa todos os núcleos.
+            tamanho_shard (int): Quantidade de registros por shard.
+            vetorizado (bool): Usa a geração vetorizada para produção e incidentes.
+            limite_codigos (int): Maior número usado nos códigos únicos de cada tabela.
+        """
+        if tamanho_shard <= 0:
+            raise ValueError("tamanho_shard deve ser maior que zero.")
+
+        self.gerador = FakeData(
+            db_connection=db_connection,
+            usar_banco=usar_banco,
+            limite_codigos=limite_codigos,
+        )
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy % 2**63)
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.tamanho_shard = tamanho_shard
+        self.vetorizado = vetorizado
+
+    def _montar_tarefas(
+            self,
+            tabela: str,
+            tamanho_lote: int,
+            referencias: Optional[Dict[str, pd.DataFrame]] = None,
+        ) -> List[Tuple]:
+        """
+        Reserva o bloco de códigos da tabela e divide o lote em shards.
+
+        Args:
+            tabela (str): Nome da tabela.
+            tamanho_lote (int): Quantidade total de registros.
+            referencias (Optional[Dict[str, DataFrame]]): DataFrames pais usados pelos shards.
+
+        Returns:
+            List[Tuple]: Tarefas para `_gerar_shard`, na ordem dos shards.
+        """
+        indice_tabela = [nome for nome, _ in TABELAS].index(tabela)
+        numeros = self.gerador._get_alocador(tabela).reservar(tamanho_lote)
+
+        tarefas = []
+        for indice_shard, inicio in enumerate(range(0, tamanho_lote, self.tamanho_shard)):
+            tamanho = min(self.tamanho_shard, tamanho_lote - inicio)
+            semente = np.random.SeedSequence(
+                entropy=self.seed,
+                spawn_key=(indice_tabela, indice_shard),
+            ).generate_state(1)[0]
+
+            tarefas.append((
+                tabela,
+                int(semente),
+                int(numeros[inicio]),
+                tamanho,
+                self.vetorizado,
+                referencias or {},
+            ))
+
+        return tarefas
+
+    def _executar(self, executor: Optional[ProcessPoolExecutor], tarefas: List[Tuple]) -> pd.DataFrame:
+        """
+        Executa as tarefas (no pool ou no próprio processo) e junta os shards em ordem.
+
+        A exceção de qualquer shard é relançada aqui: descartar um shard mudaria o
+        tamanho da tabela e quebraria a reprodutibilidade pelo `seed`.
+        """
+        if executor is None:
+            shards = [_gerar_shard(tarefa) for tarefa in tarefas]
+        else:
+            shards = list(executor.map(_gerar_shard, tarefas))
+
+        if not shards:
+            return pd.DataFrame()
+
+        return pd.concat(shards, ignore_index=True)
+
+    def generate_all(self, lotes: Dict[str, int]) -> Dict[str, pd.DataFrame]:
+        """
+        Gera as quatro tabelas em paralelo, respeitando a ordem das FKs.
+
+        Args:
+            lotes (Dict[str, int]): Tamanho de lote por tabela ('pocos', 'equipamentos', ...).
+
+        Returns:
+            Dict[str, DataFrame]: {nome_tabela: DataFrame}.
+
+        Example:
+            >>> sharded = ShardedFakeData(seed=42, n_workers=8)
+            >>> dados = sharded.generate_all({'pocos': 100, 'equipamentos': 500,
+            ...                               'producao': 1_000_000, 'incidentes': 10_000})
+        """
+        print(f"Geração em shards: seed={self.seed}, workers={self.n_workers}, shard={self.tamanho_shard}")
+
+        executor = ProcessPoolExecutor(max_workers=self.n_workers) if self.n_workers > 1 else None
+        dados = {}
+
+        try:
+            for tabela, chave in TABELAS:
+                tamanho_lote = lotes.get(chave, 0)
+
+                if tabela == 'raw_pocos':
+                    referencias = {}
+                elif tabela in ('raw_equipamentos', 'raw_producao'):
+                    referencias = {'df_pocos': dados['raw_pocos']}
+                else:
+                    # Cada shard só precisa da primeira data de produção de cada poço.
+                    referencias = {
+                        'df_equipamentos': dados['raw_equipamentos'][['cod_equipamento', 'cod_poco']],
+                        'df_producao': (
+                            dados['raw_producao']
+                            .groupby('cod_poco', sort=False)['data_producao']
+                            .min()
+                            .reset_index()
+                        ),
+                    }
+
+                tarefas = self._montar_tarefas(tabela, tamanho_lote, referencias)
+                print(f"    {tabela}: {tamanho_lote} registros em {len(tarefas)} shard(s)...")
+
+                dados[tabela] = self._executar(executor, tarefas)
+                if dados[tabela].empty:
+                    raise ValueError(f"Falha ao gerar {tabela}.")
+
+            return dados
+
+        finally:
+            if executor is not None:
+                executor.shutdown()
@@ -0,0 +1,374 @@
+import asyncio
+import os
+import pandas as pd
+
+from datetime import datetime
+from typing import Optional, List, Dict, Set
+
+from sqlalchemy import select, func, insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from dotenv import load_dotenv
+
+from src.database.db_connection import CONSULTA_ESTATISTICAS
+from src.database.engine_registry import build_database_url
+from src.database.parallel_loader import fk_levels
+from src.database.partitioning import (
+    get_partition_column, get_code_column, partition_name, months_in, create_partition_sql,
+    CODE_LOCK_SQL, duplicate_codes_sql,
+)
+from src.database.db_model import (
+    Base, PocosTable, EquipamentosTable, ProducaoTable, IncidentesTable, CargasWatermarkTable
+)
+
+load_dotenv()
+
+
+class AsyncGasDataBase():
+    """
+    Versão assíncrona (SQLAlchemy asyncio + asyncpg) das operações do `GasDataBase`.
+
+    Usa os mesmos modelos de `db_model.py`. Cada operação por tabela abre sua própria
+    conexão do pool, então consultas e cargas de tabelas independentes acontecem ao
+    mesmo tempo em vez de esperar os round-trips umas das outras.
+
+    Example:
+        >>> async with AsyncGasDataBase() as db:
+        ...     await db.insert_values_into_db(dados, metodo='copy')
+    """
+    def __init__(
+            self,
+            url: Optional[str] = None,
+            pool_size: Optional[int] = None,
+            max_overflow: Optional[int] = None,
+            pool_pre_ping: bool = True,
+        ):
+        """
+        Args:
+            url (Optional[str]): URL `postgresql+asyncpg://...`. Se None, usa DB_ASYNC_URL
+                ou as variáveis DB_* (permite apontar para um Postgres local de testes).
+            pool_size (Optional[int]): Conexões mantidas no pool (padrão: DB_POOL_SIZE ou 5).
+            max_overflow (Optional[int]): Conexões extras além do pool (padrão: DB_MAX_OVERFLOW ou 10).
+            pool_pre_ping (bool): Testa a conexão antes de cada uso.
+        """
+        self.url = url or os.getenv('DB_ASYNC_URL') or build_database_url(driver='asyncpg')
+        self.engine = create_async_engine(
+            self.url,
+            pool_size=pool_size if pool_size is not None else int(os.getenv('DB_POOL_SIZE', 5)),
+            max_overflow=max_overflow if max_overflow is not None else int(os.getenv('DB_MAX_OVERFLOW', 10)),
+            pool_pre_ping=pool_pre_ping,
+        )
+        self.Base = Base
+        self._schema_verificado = False
+
+        self.orm_mapping = {
+            "raw_pocos": PocosTable,
+            "raw_equipamentos": EquipamentosTable,
+            "raw_producao": ProducaoTable,
+            "raw_incidentes": IncidentesTable,
+        }
+
+    async def __aenter__(self) -> "AsyncGasDataBase":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.dispose()
+
+    async def dispose(self) -> None:
+        """Fecha as conexões do pool (o engine é ligado ao event loop em que foi usado)."""
+        await self.engine.dispose()
+
+    async def ensure_schema(self, force: bool = False) -> bool:
+        """
+        Cria as tabelas do projeto caso não existam (uma vez por instância).
+
+        Args:
+            force (bool): Se True, executa o `create_all` novamente.
+
+        Returns:
+            bool: True se o `create_all` foi executado nesta chamada.
+        """
+        if self._schema_verificado and not force:
+            return False
+
+        async with self.engine.begin() as conn:
+            await conn.run_sync(self.Base.metadata.create_all)
+
+        self._schema_verificado = True
+        return True
+
+    async def check_table_values_into_db(
+            self,
+            table_name: Optional[List[str]] = None,
+            exato: bool = False,
+        ) -> Dict[str, int]:
+        """
+        Retorna a quantidade de registros por tabela.
+
+        Por padrão usa as estatísticas do Postgres em uma única consulta. Com `exato=True`,
+        os `count(*)` de todas as tabelas rodam ao mesmo tempo, cada um em uma conexão.
+
+        Args:
+            table_name (Optional[List[str]]): Tabelas verificadas. Se None, todas as do mapeamento.
+            exato (bool): Se True, conta as linhas com varredura completa de cada tabela.
+
+        Returns:
+            Dict[str, int]: {nome_tabela: quantidade_registros}.
+
+        Example:
+            >>> await db.check_table_values_into_db(exato=True)
+            {'raw_pocos': 100, 'raw_equipamentos': 500, 'raw_producao': 2000, 'raw_incidentes': 250}
+        """
+        try:
+            tabelas_projeto = table_name if table_name is not None else list(self.orm_mapping.keys())
+
+            if exato:
+                contagens = await asyncio.gather(*(self._contar(tabela) for tabela in tabelas_projeto))
+                resultado = dict(zip(tabelas_projeto, contagens))
+            else:
+                async with self.engine.connect() as conn:
+                    linhas = (await conn.execute(
+                        CONSULTA_ESTATISTICAS, {'tabelas': list(tabelas_projeto)}
+                    )).mappings().all()
+                estatisticas = {linha['tabela']: linha['linhas'] for linha in linhas}
+                resultado = {tabela: estatisticas.get(tabela, 0) for tabela in tabelas_projeto}
+
+            for tabela, quantidade in resultado.items():
+                print(f"{tabela}: {quantidade} registros")
+
+            total_registros = sum(resultado.values())
+            print(f"\nTotal: {total_registros} registros em {len(resultado)} tabela(s)")
+
+            return resultado
+
+        except Exception as e:
+            print(f"Erro crítico em check_table_values_into_db: {str(e)}")
+            raise
+
+    async def _contar(self, nome_tabela: str) -> int:
+        """Executa o `count(*)` de uma tabela em uma conexão própria."""
+        orm_class = self.orm_mapping.get(nome_tabela)
+        if orm_class is None:
+            print(f"A Tabela: {nome_tabela} não existe no mapeamento.")
+            return 0
+
+        async with self.engine.connect() as conn:
+            return int((await conn.execute(select(func.count()).select_from(orm_class.__table__))).scalar())
+
+    async def get_existing_codes(
+            self,
+            table_name: str,
+            code_column: str
+        ) -> Set[str]:
+        """
+        Busca todos os códigos únicos já existentes em uma tabela, lendo o resultado em streaming.
+
+        Args:
+            table_name: Nome da tabela no mapeamento ORM.
+            code_column: Nome da Coluna que contém o código único.
+
+        Returns:
+            Set[str]: Conjunto com todos os códigos existentes.
+
+        Example:
+            >>> pocos, equipamentos = await asyncio.gather(
+            ...     db.get_existing_codes('raw_pocos', 'codigo_poco'),
+            ...     db.get_existing_codes('raw_equipamentos', 'cod_equipamento'),
+            ... )
+        """
+        try:
+            orm_class = self.orm_mapping.get(table_name)
+            if orm_class is None:
+                print(f"Tabela {table_name} não encontrada no mapeamento")
+                return set()
+
+            if not hasattr(orm_class, code_column):
+                print(f"Coluna {code_column} não existe na tabela {table_name}")
+                return set()
+
+            async with self.engine.connect() as conn:
+                resultado = await conn.stream(select(getattr(orm_class, code_column)))
+                codigos_existentes = {linha[0] async for linha in resultado}
+
+            print(f"{len(codigos_existentes)} código(s) existente(s) em {table_name}")
+            return codigos_existentes
+
+        except Exception as e:
+            print(f"Erro crítico em get_existing_codes: {str(e)}")
+            raise
+
+    async def insert_values_into_db(
+            self,
+            data: Optional[Dict[str, pd.DataFrame]] = None,
+            chunk_size: int = 10_000,
+            metodo: str = 'orm',
+        ) -> Dict[str, int]:
+        """
+        Insere os DataFrames validados, carregando ao mesmo tempo as tabelas do mesmo nível de FK.
+
+        As tabelas são agrupadas pelas dependências de FK (ex.: equipamentos e produção
+        só dependem de poços). Cada tabela roda em sua própria transação; se uma falhar,
+        as demais do mesmo nível são canceladas e desfeitas, e os níveis seguintes não começam.
+
+        Args:
+            data (Optional[Dict[str, DataFrame]]): Dicionário com {nome_tabela: DataFrame}.
+            chunk_size (int): Quantidade de linhas enviadas por vez.
+            metodo (str): 'orm' (INSERT em lote) ou 'copy' (`copy_records_to_table` do asyncpg).
+
+        Returns:
+            Dict[str, int]: {nome_tabela: quantidade_inserida}.
+
+        Raises:
+            ValueError: Se o método for inválido.
+            Exeception: Erro crítico ao fazer a inserção de dados nas tabelas.
+
+        Example:
+            >>> await db.insert_values_into_db({'raw_pocos': df_pocos, 'raw_producao': df_producao})
+            {'raw_pocos': 100, 'raw_producao': 2000}
+        """
+        try:
+            if metodo not in ('orm', 'copy'):
+                raise ValueError(f"Método de inserção inválido: {metodo}. Use 'orm' ou 'copy'.")
+
+            resultado = {nome_tabela: 0 for nome_tabela in (data or {})}
+            dados = {}
+            for nome_tabela, df in (data or {}).items():
+                if df is None or df.empty:
+                    print(f"{nome_tabela}: DataFrame vazio, pulando...")
+                elif nome_tabela not in self.orm_mapping:
+                    print(f"{nome_tabela}: Tabela não encontrada no mapeamento.")
+                else:
+                    dados[nome_tabela] = df
+
+            await self.ensure_schema()
+            await self._ensure_partitions(dados)
+
+            for nivel in fk_levels(dados.keys()):
+                print(f"Inserindo em {', '.join(nivel)}...")
+                async with asyncio.TaskGroup() as grupo:
+                    tarefas = {
+                        nome_tabela: grupo.create_task(
+                            self._insert_table(nome_tabela, dados[nome_tabela], chunk_size, metodo)
+                        )
+                        for nome_tabela in nivel
+                    }
+                for nome_tabela, tarefa in tarefas.items():
+                    resultado[nome_tabela] = tarefa.result()
+                    print(f"{nome_tabela}: {resultado[nome_tabela]} de registros inseridos")
+
+            total_inserido = sum(resultado.values())
+            print(f"\nTotal: {total_inserido} registros inseridos")
+
+            return resultado
+
+        except Exception as e:
+            print(f"Erro crítico em insert_values_into_db: {str(e)}")
+            raise
+
+    async def _insert_table(self, nome_tabela: str, df: pd.DataFrame, chunk_size: int, metodo: str) -> int:
+        """Insere uma tabela em uma transação própria e registra a carga em `pipeline_watermarks`."""
+        tabela = self.orm_mapping[nome_tabela].__table__
+        quantidade = 0
+
+        async with self.engine.begin() as conn:
+            if metodo == 'copy':
+                quantidade = await self._copy_dataframe(conn, tabela, df, chunk_size)
+            else:
+                for inicio in range(0, len(df), chunk_size):
+                    records = df.iloc[inicio:inicio + chunk_size].to_dict('records')
+                    await conn.execute(insert(tabela), records)
+                    quantidade += len(records)
+            await self._garantir_codigos_unicos(conn, tabela, df)
+
+            watermark = pg_insert(CargasWatermarkTable.__table__).values(
+                table_name=nome_tabela,
+                ultima_carga=func.now(),
+                linhas_ultima_carga=quantidade,
+            )
+            await conn.execute(watermark.on_conflict_do_update(
+                index_elements=['table_name'],
+                set_={
+                    'ultima_carga': watermark.excluded.ultima_carga,
+                    'linhas_ultima_carga': watermark.excluded.linhas_ultima_carga,
+                },
+            ))
+
+        return quantidade
+
+    async def _garantir_codigos_unicos(self, conn, tabela, df: pd.DataFrame) -> None:
+        """
+        Versão assíncrona de `GasDataBase._garantir_codigos_unicos`: confere, antes do commit,
+        que os códigos carregados não se repetem na tabela particionada.
+
+        Raises:
+            ValueError: Se algum código carregado aparecer mais de uma vez na tabela.
+        """
+        coluna = get_code_column(tabela)
+        if coluna is None or coluna not in df.columns:
+            return
+
+        preparer = self.engine.dialect.identifier_preparer
+        await conn.execute(text(CODE_LOCK_SQL), {'tabela': tabela.name})
+        repetidos = (await conn.execute(
+            text(duplicate_codes_sql(tabela, preparer)),
+            {'codigos': df[coluna].astype(str).unique().tolist()},
+        )).scalars().all()
+
+        if repetidos:
+            raise ValueError(f"{tabela.name}: códigos repetidos na tabela: {', '.join(repetidos)}")
+
+    async def _copy_dataframe(self, conn, tabela, df: pd.DataFrame, chunk_size: int) -> int:
+        """
+        Envia o DataFrame com o COPY binário do asyncpg, na transação de `conn`.
+
+        Em tabelas particionadas, cada mês vai direto para a sua partição.
+        """
+        desconhecidas = [coluna for coluna in df.columns if coluna not in tabela.columns]
+        if desconhecidas:
+            raise ValueError(f"Colunas inexistentes em {tabela.name}: {desconhecidas}")
+
+        if 'data_insercao' in tabela.columns and 'data_insercao' not in df.columns:
+            df = df.assign(data_insercao=datetime.now())
+
+        coluna_particao = get_partition_column(tabela)
+        if coluna_particao is not None and coluna_particao in df.columns:
+            meses = pd.to_datetime(df[coluna_particao]).dt.to_period('M')
+            destinos = [(partition_name(tabela.name, mes), grupo) for mes, grupo in df.groupby(meses, sort=True)]
+        else:
+            destinos = [(tabela.name, df)]
+
+        conexao = (await conn.get_raw_connection()).driver_connection
+        colunas = list(df.columns)
+        quantidade = 0
+
+        for destino, df_destino in destinos:
+            for inicio in range(0, len(df_destino), chunk_size):
+                parte = df_destino.iloc[inicio:inicio + chunk_size]
+                await conexao.copy_records_to_table(
+                    destino,
+                    records=parte.itertuples(index=False, name=None),
+                    columns=colunas,
+                )
+                quantidade += len(parte)
+
+        return quantidade
+
+    async def _ensure_partitions(self, data: Dict[str, pd.DataFrame]) -> None:
+        """Cria as partições mensais que faltam para os dados (ver `GasDataBase.ensure_partitions`)."""
+        preparer = self.engine.dialect.identifier_preparer
+
+        async with self.engine.begin() as conn:
+            for nome_tabela, df in data.items():
+                coluna = get_partition_column(self.orm_mapping[nome_tabela].__table__)
+                if coluna is None or coluna not in df.columns:
+                    continue
+
+                existentes = set((await conn.execute(text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = CAST(:tabela AS regclass)"
+                ), {'tabela': nome_tabela})).scalars())
+
+                for mes in months_in(df[coluna]):
+                    if partition_name(nome_tabela, mes) not in existentes:
+                        await conn.execute(text(create_partition_sql(nome_tabela, mes, preparer)))
@@ -1,33 +1,99 @@
+import io
+import json
 import os
+import shutil
+import time
 import pandas as pd
+import psycopg2
 
-from typing import Optional, List, Dict, Set
+from contextlib import contextmanager
+from datetime import datetime
 
-from sqlalchemy import create_engine
+from typing import Optional, List, Dict, Set, Iterator
+
+from sqlalchemy import (
+    select, insert, func, cast, text, Integer, BigInteger, SmallInteger, REAL, Float, Boolean, Date, DateTime,
+    Enum, Column, Index, MetaData, Table, UniqueConstraint
+)
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from dotenv import load_dotenv
 
-from src.database.db_model import Base, PocosTable, EquipamentosTable, ProducaoTable, IncidentesTable
+from src.database.engine_registry import build_database_url, get_engine, ensure_schema, get_pool_metrics
+from src.database.partitioning import (
+    get_partition_column, get_code_column, partition_name, month_range, months_in, create_partition_sql,
+    CODE_LOCK_SQL, duplicate_codes_sql,
+)
+from src.database.db_model import (
+    Base, PocosTable, EquipamentosTable, ProducaoTable, IncidentesTable, CargasWatermarkTable,
+    CheckpointsCargaTable, QuarentenaPocosTable, QuarentenaEquipamentosTable, QuarentenaProducaoTable,
+    QuarentenaIncidentesTable
+)
 
 load_dotenv()
 
+# Tabelas particionadas não têm linhas próprias: os valores são somados sobre as
+# partições folha (`pg_partition_tree` retorna a própria tabela quando não é particionada).
+CONSULTA_ESTATISTICAS = text("""
+    SELECT c.relname                                                              AS tabela
+         , COALESCE(sum(COALESCE(s.n_live_tup, GREATEST(p.reltuples, 0))), 0)::bigint AS linhas
+         , COALESCE(sum(pg_total_relation_size(p.oid)), 0)::bigint                AS tamanho_bytes
+         , pg_size_pretty(COALESCE(sum(pg_total_relation_size(p.oid)), 0))        AS tamanho
+         , max(GREATEST(s.last_analyze, s.last_autoanalyze))                      AS ultima_analise
+         , count(p.oid) FILTER (WHERE c.relkind = 'p')                            AS particoes
+         , w.ultima_carga                                                         AS ultima_carga
+         , w.linhas_ultima_carga                                                  AS linhas_ultima_carga
+      FROM pg_class c
+      JOIN pg_namespace n ON n.oid = c.relnamespace
+      LEFT JOIN LATERAL pg_partition_tree(c.oid) pt ON true
+      LEFT JOIN pg_class p ON p.oid = pt.relid AND pt.isleaf
+      LEFT JOIN pg_stat_user_tables s ON s.relid = p.oid
+      LEFT JOIN pipeline_watermarks w ON w.table_name = c.relname
+     WHERE n.nspname = current_schema()
+       AND c.relkind IN ('r', 'p')
+       AND c.relname = ANY(:tabelas)
+     GROUP BY c.relname, w.ultima_carga, w.linhas_ultima_carga
+""")
+
 class GasDataBase():
     """Classe de Banco de Dados que tem como responsabilidade
        toda a orquestração do Banco de Dados."""
-    def __init__(self):
-        
+    def __init__(
+            self,
+            criar_schema: bool = True,
+            pool_size: Optional[int] = None,
+            max_overflow: Optional[int] = None,
+            pool_pre_ping: bool = True,
+            pool_recycle: Optional[int] = None,
+        ):
+        """
+        Args:
+            criar_schema (bool): Se True, garante as tabelas via `ensure_schema()`
+                (executado no máximo uma vez por processo).
+            pool_size (Optional[int]): Conexões mantidas no pool (padrão: DB_POOL_SIZE ou 5).
+            max_overflow (Optional[int]): Conexões extras além do pool (padrão: DB_MAX_OVERFLOW ou 10).
+            pool_pre_ping (bool): Testa a conexão antes de cada uso.
+            pool_recycle (Optional[int]): Segundos até reciclar uma conexão (padrão: DB_POOL_RECYCLE ou 1800).
+        """
         self.db_user = os.getenv('DB_USER')
         self.db_pass = os.getenv('DB_PASS')
         self.db_host = os.getenv('DB_HOST')
         self.db_port = os.getenv('DB_PORT')
         self.db_name = os.getenv('DB_NAME')
 
-        self.engine = create_engine(f"postgresql://{self.db_user}:{self.db_pass}@{self.db_host}:{self.db_port}/{self.db_name}")
+        self.engine = get_engine(
+            url=build_database_url(),
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=pool_pre_ping,
+            pool_recycle=pool_recycle,
+        )
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         self.Base = Base
 
-        self.Base.metadata.create_all(bind=self.engine)
+        if criar_schema:
+            self.ensure_schema()
 
         self.orm_mapping = {
             "raw_pocos": PocosTable,
@@ -36,6 +102,124 @@ class GasDataBase():
             "raw_incidentes": IncidentesTable,
         }
 
+        # {tabela raw: (tabela de quarentena, coluna do código)}
+        self.quarantine_mapping = {
+            "raw_pocos": (QuarentenaPocosTable, 'codigo_poco'),
+            "raw_equipamentos": (QuarentenaEquipamentosTable, 'cod_equipamento'),
+            "raw_producao": (QuarentenaProducaoTable, 'cod_producao'),
+            "raw_incidentes": (QuarentenaIncidentesTable, 'cod_incidente'),
+        }
+
+    def ensure_schema(self, force: bool = False) -> bool:
+        """
+        Cria as tabelas do projeto caso não existam.
+
+        O `create_all` roda no máximo uma vez por processo, mesmo com várias
+        instâncias de `GasDataBase` (ex.: controller e gerador).
+
+        Args:
+            force (bool): Se True, executa o `create_all` novamente.
+
+        Returns:
+            bool: True se o `create_all` foi executado nesta chamada.
+        """
+        executado = ensure_schema(self.engine, self.Base.metadata, force=force)
+        if executado:
+            # `create_all` não cria índices novos em tabelas que já existiam.
+            self.ensure_indexes()
+        return executado
+
+    def _get_indexes(self, table_name: Optional[List[str]] = None, apenas_adiaveis: bool = False) -> List[Index]:
+        """Índices declarados nos modelos; com `apenas_adiaveis`, só os não únicos (B-tree de FK e BRIN)."""
+        tabelas = table_name if table_name is not None else list(self.orm_mapping.keys())
+        indices = []
+        for nome_tabela in tabelas:
+            orm_class = self.orm_mapping.get(nome_tabela)
+            if orm_class is None:
+                continue
+            indices.extend(
+                indice for indice in sorted(orm_class.__table__.indexes, key=lambda i: i.name)
+                if not (apenas_adiaveis and indice.unique)
+            )
+        return indices
+
+    def ensure_indexes(self, table_name: Optional[List[str]] = None) -> List[str]:
+        """
+        Cria os índices declarados nos modelos que ainda não existem no Banco de Dados.
+
+        Args:
+            table_name (Optional[List[str]]): Tabelas verificadas. Se None, todas as do mapeamento.
+
+        Returns:
+            List[str]: Nomes dos índices criados.
+        """
+        try:
+            criados = []
+            with self.engine.begin() as conn:
+                existentes = set(conn.execute(text(
+                    "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()"
+                )).scalars())
+
+                for indice in self._get_indexes(table_name):
+                    if indice.name not in existentes:
+                        indice.create(bind=conn)
+                        criados.append(indice.name)
+
+            if criados:
+                print(f"Índices criados: {', '.join(criados)}")
+            return criados
+
+        except Exception as e:
+            print(f"Erro crítico em ensure_indexes: {str(e)}")
+            raise
+
+    @contextmanager
+    def deferred_indexes(self, table_name: Optional[List[str]] = None, maintenance_work_mem: str = '512MB'):
+        """
+        Modo de carga em massa: remove os índices não únicos e os recria ao final.
+
+        Manter B-tree e BRIN atualizados linha a linha é mais lento que reconstruí-los
+        uma vez depois da carga. As constraints únicas (usadas pelo ON CONFLICT) são
+        mantidas. Os índices são recriados mesmo se a carga falhar, seguidos de `ANALYZE`.
+
+        Args:
+            table_name (Optional[List[str]]): Tabelas carregadas. Se None, todas as do mapeamento.
+            maintenance_work_mem (str): Memória usada pelo Postgres na reconstrução dos índices.
+
+        Example:
+            >>> with db.deferred_indexes(['raw_producao']):
+            ...     db.insert_values_into_db({'raw_producao': df_producao}, metodo='copy')
+        """
+        indices = self._get_indexes(table_name, apenas_adiaveis=True)
+        tabelas = sorted({indice.table.name for indice in indices})
+
+        with self.engine.begin() as conn:
+            for indice in indices:
+                indice.drop(bind=conn, checkfirst=True)
+        print(f"{len(indices)} índice(s) removido(s) para a carga: {', '.join(tabelas)}")
+
+        try:
+            yield
+
+        finally:
+            inicio = time.perf_counter()
+            with self.engine.begin() as conn:
+                conn.execute(text(f"SET LOCAL maintenance_work_mem = '{maintenance_work_mem}'"))
+                for indice in indices:
+                    indice.create(bind=conn, checkfirst=True)
+                for tabela in tabelas:
+                    conn.execute(text(f"ANALYZE {self.engine.dialect.identifier_preparer.quote(tabela)}"))
+            print(f"{len(indices)} índice(s) recriado(s) em {time.perf_counter() - inicio:.2f}s")
+
+    def pool_metrics(self) -> Dict[str, float]:
+        """
+        Retorna as métricas do pool de conexões (conexões em uso, overflow e tempo de espera).
+
+        Returns:
+            Dict[str, float]: Métricas do pool para monitoramento.
+        """
+        return get_pool_metrics(self.engine)
+
     def check_tables_into_db(self, table_name: Optional[List[str]] = None) -> List[str]:
         """Checa se a tabela existe no Banco de Dados, se existe, retorna uma lista, senão, retorna None.
            
@@ -63,12 +247,20 @@ class GasDataBase():
             print(f"Erro crítico em check_table_db: {str(e)}")
             raise
 
-    def check_table_values_into_db(self, table_name: Optional[List[str]] = None) -> Dict[str, int]:
+    def check_table_values_into_db(
+            self,
+            table_name: Optional[List[str]] = None,
+            exato: bool = False,
+        ) -> Dict[str, int]:
         """
         Verifica se existem registros na tabela, se existir, retorna eles, senão None.
 
+        Por padrão a contagem é estimada pelas estatísticas do Postgres (`get_table_stats`),
+        em uma única consulta de custo constante. Com `exato=True`, faz um `count(*)` por tabela.
+
         Args:
             table_names (Optional[List[str]]): Lista de tabelas que serão verificados os registros.
+            exato (bool): Se True, conta as linhas com varredura completa de cada tabela.
 
         Returns:
             Dict[str, int]: Dicionário com o nome da tabela no Banco de Dados e a quantidade de registros em cada uma.
@@ -90,6 +282,17 @@ class GasDataBase():
 
             resultado = {}
 
+            if not exato:
+                estatisticas = self.get_table_stats(tabelas_projeto)
+                for tabelas in tabelas_projeto:
+                    resultado[tabelas] = estatisticas.get(tabelas, {}).get('linhas', 0)
+                    print(f"{tabelas}: ~{resultado[tabelas]} registros (estimativa)")
+
+                total_registros = sum(resultado.values())
+                print(f"\nTotal: ~{total_registros} registros em {len(resultado)} tabela(s)")
+
+                return resultado
+
             with self.SessionLocal() as session:
                 for tabelas in tabelas_projeto:
 
@@ -120,20 +323,337 @@ class GasDataBase():
             print(f"Erro crítico em check_tables_values_into_db: {str(e)}")
             raise
 
+    def get_table_stats(self, table_name: Optional[List[str]] = None) -> Dict[str, Dict[str, any]]:
+        """
+        Retorna estatísticas das tabelas em uma única consulta ao catálogo do Postgres.
+
+        A quantidade de linhas vem de `pg_stat_user_tables.n_live_tup` (ou de
+        `pg_class.reltuples` quando não há estatística), então o custo não depende
+        do tamanho das tabelas. Inclui o tamanho em disco e a última carga feita pelo pipeline.
+
+        Args:
+            table_name (Optional[List[str]]): Tabelas consultadas. Se None, todas as do mapeamento.
+
+        Returns:
+            Dict[str, Dict[str, any]]: {tabela: {'linhas', 'tamanho_bytes', 'tamanho',
+                'ultima_analise', 'particoes', 'ultima_carga', 'linhas_ultima_carga'}}.
+                Para tabelas particionadas, linhas e tamanho são a soma das partições.
+
+        Example:
+            >>> db.get_table_stats(['raw_producao'])
+            {'raw_producao': {'linhas': 200000000, 'tamanho_bytes': 30064771072, 'tamanho': '28 GB', ...}}
+        """
+        try:
+            tabelas_projeto = table_name if table_name is not None else list(self.orm_mapping.keys())
+
+            with self.SessionLocal() as session:
+                linhas = session.execute(CONSULTA_ESTATISTICAS, {'tabelas': list(tabelas_projeto)}).mappings().all()
+
+            resultado = {linha['tabela']: {k: v for k, v in linha.items() if k != 'tabela'} for linha in linhas}
+            for tabela in tabelas_projeto:
+                if tabela not in resultado:
+                    print(f"A Tabela: {tabela} não existe no Banco de Dados.")
+
+            return resultado
+
+        except Exception as e:
+            print(f"Erro crítico em get_table_stats: {str(e)}")
+            raise
+
+    def _registrar_watermark(self, session, nome_tabela: str, linhas: int) -> None:
+        """Registra (upsert) a última carga de uma tabela em `pipeline_watermarks`, na transação corrente."""
+        tabela = CargasWatermarkTable.__table__
+        comando = pg_insert(tabela).values(
+            table_name=nome_tabela,
+            ultima_carga=func.now(),
+            linhas_ultima_carga=linhas,
+        )
+        session.execute(comando.on_conflict_do_update(
+            index_elements=[tabela.c.table_name],
+            set_={
+                'ultima_carga': comando.excluded.ultima_carga,
+                'linhas_ultima_carga': comando.excluded.linhas_ultima_carga,
+            },
+        ))
+
+    def ensure_partitions(self, data: Dict[str, pd.DataFrame]) -> Dict[str, List[str]]:
+        """
+        Cria as partições mensais que faltam para os dados que serão carregados.
+
+        Deve ser chamado antes de qualquer carga em tabela particionada: o Postgres
+        rejeita linhas sem partição de destino. O DDL roda em transação própria
+        (`CREATE TABLE IF NOT EXISTS`), então pode ser repetido sem efeito.
+
+        Args:
+            data (Dict[str, DataFrame]): {nome_tabela: DataFrame}. Tabelas não particionadas são ignoradas.
+
+        Returns:
+            Dict[str, List[str]]: {nome_tabela: partições criadas nesta chamada}.
+
+        Example:
+            >>> db.ensure_partitions({'raw_producao': df_producao})
+            {'raw_producao': ['raw_producao_p2024_01', 'raw_producao_p2024_02']}
+        """
+        try:
+            criadas = {}
+            preparer = self.engine.dialect.identifier_preparer
+
+            with self.engine.begin() as conn:
+                for nome_tabela, df in data.items():
+                    orm_class = self.orm_mapping.get(nome_tabela)
+                    if orm_class is None or df is None or df.empty:
+                        continue
+
+                    coluna = get_partition_column(orm_class.__table__)
+                    if coluna is None or coluna not in df.columns:
+                        continue
+
+                    existentes = set(conn.execute(text(
+                        "SELECT c.relname FROM pg_inherits i "
+                        "JOIN pg_class c ON c.oid = i.inhrelid "
+                        "WHERE i.inhparent = CAST(:tabela AS regclass)"
+                    ), {'tabela': nome_tabela}).scalars())
+
+                    criadas[nome_tabela] = []
+                    for mes in months_in(df[coluna]):
+                        nome_particao = partition_name(nome_tabela, mes)
+                        if nome_particao in existentes:
+                            continue
+
+                        conn.execute(text(create_partition_sql(nome_tabela, mes, preparer)))
+                        criadas[nome_tabela].append(nome_particao)
+
+                    if criadas[nome_tabela]:
+                        print(f"{nome_tabela}: {len(criadas[nome_tabela])} partição(ões) criada(s)")
+
+            return criadas
+
+        except Exception as e:
+            print(f"Erro crítico em ensure_partitions: {str(e)}")
+            raise
+
+    def migrate_to_partitioned(self, table_name: str) -> int:
+        """
+        Converte uma tabela `raw_*` comum (criada antes do particionamento) na versão particionada.
+
+        Tudo roda em uma única transação: a tabela antiga é renomeada (com seus índices
+        e sequência), a nova é criada pelo modelo, as partições são criadas para o
+        intervalo de datas existente e as linhas são copiadas mantendo os `id`.
+        Views que dependem da tabela (ex.: modelos dbt materializados como view)
+        impedem o DROP da antiga; nesse caso a migração é desfeita e as views devem
+        ser removidas e recriadas pelo dbt.
+
+        Args:
+            table_name (str): Nome da tabela (ex.: 'raw_producao').
+
+        Returns:
+            int: Quantidade de linhas migradas (0 se a tabela já estava particionada).
+
+        Raises:
+            ValueError: Se a tabela não for particionada no modelo.
+            Exeception: Erro crítico durante a migração.
+
+        Example:
+            >>> db.migrate_to_partitioned('raw_producao')
+            2000000
+        """
+        try:
+            orm_class = self.orm_mapping.get(table_name)
+            tabela = orm_class.__table__ if orm_class is not None else None
+            coluna = get_partition_column(tabela) if tabela is not None else None
+            if coluna is None:
+                raise ValueError(f"{table_name}: Tabela não é particionada no modelo.")
+
+            with self.engine.begin() as conn:
+                tipo = conn.execute(text(
+                    "SELECT relkind FROM pg_class WHERE oid = to_regclass(:tabela)"
+                ), {'tabela': table_name}).scalar()
+
+                if tipo is None:
+                    print(f"{table_name}: Tabela não existe, será criada já particionada.")
+                    tabela.create(bind=conn, checkfirst=True)
+                    return 0
+                if tipo == 'p':
+                    print(f"{table_name}: Tabela já está particionada.")
+                    return 0
+
+                quantidade = self._rebuild_table(conn, tabela)
+
+            print(f"{table_name}: {quantidade} registros migrados para a tabela particionada")
+            return quantidade
+
+        except Exception as e:
+            print(f"Erro crítico em migrate_to_partitioned: {str(e)}")
+            raise
+
+    def _rebuild_table(self, conn, tabela: Table) -> int:
+        """
+        Recria uma tabela a partir do modelo e copia as linhas da versão atual, na transação `conn`.
+
+        A tabela atual (e suas partições, índices e sequência) é renomeada com o sufixo
+        `__heap`, a nova é criada com `tabela.create`, as partições mensais são criadas
+        para o intervalo de datas existente e as linhas são copiadas com CAST para os
+        tipos do modelo, mantendo os `id`. A tabela antiga é removida no final.
+
+        Args:
+            conn: Conexão com a transação corrente.
+            tabela (Table): Tabela do modelo.
+
+        Returns:
+            int: Quantidade de linhas copiadas.
+        """
+        preparer = self.engine.dialect.identifier_preparer
+        nome_tabela = tabela.name
+        antiga = f"{nome_tabela}__heap"
+
+        sequencia = conn.execute(text(
+            "SELECT pg_get_serial_sequence(:tabela, 'id')"
+        ), {'tabela': nome_tabela}).scalar()
+        relacoes = conn.execute(text(
+            "SELECT c.relname FROM pg_partition_tree(CAST(:tabela AS regclass)) pt "
+            "JOIN pg_class c ON c.oid = pt.relid"
+        ), {'tabela': nome_tabela}).scalars().all()
+        indices = conn.execute(text(
+            "SELECT c.relname FROM pg_partition_tree(CAST(:tabela AS regclass)) pt "
+            "JOIN pg_index i ON i.indrelid = pt.relid JOIN pg_class c ON c.oid = i.indexrelid"
+        ), {'tabela': nome_tabela}).scalars().all()
+
+        # Libera os nomes (tabela, partições, índices/constraints e sequência) para a tabela nova.
+        for indice in indices:
+            conn.execute(text(f"ALTER INDEX {preparer.quote(indice)} RENAME TO {preparer.quote(indice + '__heap')}"))
+        for relacao in relacoes:
+            conn.execute(text(f"ALTER TABLE {preparer.quote(relacao)} RENAME TO {preparer.quote(relacao + '__heap')}"))
+        if sequencia:
+            conn.execute(text(f"ALTER SEQUENCE {sequencia} RENAME TO {preparer.quote(antiga + '_id_seq')}"))
+
+        tabela.create(bind=conn, checkfirst=True)
+
+        coluna = get_partition_column(tabela)
+        if coluna is not None:
+            limites = conn.execute(text(
+                f"SELECT min({preparer.quote(coluna)}), max({preparer.quote(coluna)}) FROM {preparer.quote(antiga)}"
+            )).one()
+            if limites[0] is not None:
+                for mes in month_range(limites[0], limites[1]):
+                    conn.execute(text(create_partition_sql(nome_tabela, mes, preparer)))
+
+        destino = ", ".join(preparer.quote(c.name) for c in tabela.columns)
+        origem = ", ".join(
+            f"CAST({preparer.quote(c.name)} AS {c.type.compile(dialect=self.engine.dialect)})"
+            for c in tabela.columns
+        )
+        quantidade = conn.execute(text(
+            f"INSERT INTO {preparer.quote(nome_tabela)} ({destino}) "
+            f"SELECT {origem} FROM {preparer.quote(antiga)}"
+        )).rowcount
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence(:tabela, 'id'), "
+            f"COALESCE((SELECT max(id) FROM {preparer.quote(nome_tabela)}), 0) + 1, false)"
+        ), {'tabela': nome_tabela})
+
+        conn.execute(text(f"DROP TABLE {preparer.quote(antiga)}"))
+        return quantidade
+
+    def migrate_compact_types(self, table_name: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """
+        Converte as colunas das tabelas existentes para os tipos compactos do modelo
+        (ENUM, DATE, SMALLINT e REAL no lugar de VARCHAR, TIMESTAMP, INTEGER e FLOAT).
+
+        Para cada tabela, todas as colunas divergentes mudam em um único `ALTER TABLE`
+        (uma só reescrita). Se a coluna da partição mudar de tipo, o Postgres não permite
+        o ALTER e a tabela é recriada com `_rebuild_table`. Views que usam as colunas
+        (modelos dbt de staging) bloqueiam a conversão: remova-as antes e rode o dbt depois.
+
+        Args:
+            table_name (Optional[List[str]]): Tabelas migradas. Se None, todas as do mapeamento.
+
+        Returns:
+            Dict[str, List[str]]: {nome_tabela: colunas convertidas}.
+
+        Raises:
+            Exeception: Erro crítico durante a migração (a transação é desfeita).
+
+        Example:
+            >>> db.migrate_compact_types(['raw_producao'])
+            {'raw_producao': ['data_producao', 'agua_produzida_m3', 'tempo_horas_operacao', ...]}
+        """
+        try:
+            tabelas = table_name if table_name is not None else list(self.orm_mapping.keys())
+            preparer = self.engine.dialect.identifier_preparer
+            tipos_compactos = (Enum, SmallInteger, Date, REAL)
+            resultado = {}
+
+            with self.engine.begin() as conn:
+                for nome_tabela in tabelas:
+                    tabela = self.orm_mapping[nome_tabela].__table__
+                    atuais = dict(conn.execute(text(
+                        "SELECT attname, format_type(atttypid, atttypmod) FROM pg_attribute "
+                        "WHERE attrelid = CAST(:tabela AS regclass) AND attnum > 0 AND NOT attisdropped"
+                    ), {'tabela': nome_tabela}).all())
+
+                    divergentes = []
+                    for coluna in tabela.columns:
+                        if not isinstance(coluna.type, tipos_compactos) or coluna.name not in atuais:
+                            continue
+                        alvo = coluna.type.compile(dialect=self.engine.dialect)
+                        if atuais[coluna.name].lower() != alvo.strip('"').lower():
+                            divergentes.append((coluna, alvo))
+
+                    resultado[nome_tabela] = [coluna.name for coluna, _ in divergentes]
+                    if not divergentes:
+                        print(f"{nome_tabela}: Colunas já estão nos tipos compactos.")
+                        continue
+
+                    for coluna, _ in divergentes:
+                        if isinstance(coluna.type, Enum):
+                            coluna.type.create(bind=conn, checkfirst=True)
+
+                    if get_partition_column(tabela) in resultado[nome_tabela]:
+                        self._rebuild_table(conn, tabela)
+                    else:
+                        alteracoes = ", ".join(
+                            f"ALTER COLUMN {preparer.quote(coluna.name)} TYPE {alvo} "
+                            f"USING {preparer.quote(coluna.name)}::{alvo}"
+                            for coluna, alvo in divergentes
+                        )
+                        conn.execute(text(f"ALTER TABLE {preparer.quote(nome_tabela)} {alteracoes}"))
+
+                    print(f"{nome_tabela}: {len(divergentes)} coluna(s) convertida(s)")
+
+            return resultado
+
+        except Exception as e:
+            print(f"Erro crítico em migrate_compact_types: {str(e)}")
+            raise
+
     def insert_values_into_db(
             self,
             data: Optional[Dict[str, pd.DataFrame]] = None,
+            chunk_size: int = 10_000,
+            metodo: str = 'orm',
         ) -> Dict[str, int]:
         """
         Faz a inserção de dados das tabelas no Banco de Dados apartir de DataFrames validados.
         
         Args:
             data (Optional[Dict[str, DataFrame]]): Dicionário com {nome_tabela: DataFrame}
+            chunk_size (int): Quantidade de linhas convertidas e enviadas por vez, para não
+                materializar o DataFrame inteiro como lista de dicionários.
+            metodo (str): 'orm' usa `bulk_insert_mappings`; 'copy' usa `COPY FROM STDIN`
+                do Postgres, bem mais rápido para cargas grandes. Nos dois casos tudo
+                roda em uma única transação.
+
+        Em `raw_producao` e `raw_incidentes` (particionadas por mês) o Postgres só garante
+        a unicidade do par (código, data): um código repetido com outra data não gera
+        IntegrityError. Essa garantia é refeita antes do commit por
+        `_garantir_codigos_unicos`, que levanta ValueError e desfaz a carga.
 
         Returns:
             Dict[str, int]: {nome_tabela: quantidade_inserida}.
 
         Raises:
+            IntegrityError: Chave duplicada ou FK inexistente.
+            ValueError: Código de produção/incidente que já existe na tabela.
             Exeception: Erro crítico ao fazer a inserção de dados nas tabelas.
 
         Example:
@@ -144,6 +664,9 @@ class GasDataBase():
             {'raw_pocos': 150, 'raw_equipamentos': 500}
         """
         try:
+            if metodo not in ('orm', 'copy'):
+                raise ValueError(f"Método de inserção inválido: {metodo}. Use 'orm' ou 'copy'.")
+
             if data is not None:
                 print(f"Inserindo dados em {len(data)} tabelas")
                 dados_para_inserir = data
@@ -153,6 +676,8 @@ class GasDataBase():
                     print(f"{nome_tabela}: DataFrame vazio, pulando...")
                     dados_para_inserir[nome_tabela] = None
 
+            self.ensure_partitions(dados_para_inserir)
+
             resultado = {}
             with self.SessionLocal() as session:
                 try:
@@ -169,11 +694,18 @@ class GasDataBase():
 
                         print(f"Inserindo em {nome_tabela}...")
 
-                        records = df.to_dict('records')
-                        session.bulk_insert_mappings(orm_class, records)
+                        if metodo == 'copy':
+                            quantidade = self._copy_dataframe(session, orm_class.__table__, df, chunk_size)
+                        else:
+                            quantidade = 0
+                            for inicio in range(0, len(df), chunk_size):
+                                records = df.iloc[inicio:inicio + chunk_size].to_dict('records')
+                                session.bulk_insert_mappings(orm_class, records)
+                                quantidade += len(records)
+                        self._garantir_codigos_unicos(session, orm_class.__table__, df)
 
-                        quantidade = len(records)
                         resultado[nome_tabela] = quantidade
+                        self._registrar_watermark(session, nome_tabela, quantidade)
 
                         print(f"{quantidade} de registros inseridos")
 
@@ -187,6 +719,7 @@ class GasDataBase():
                 except Exception as e:
                     session.rollback()
                     print(f"Erro durante a inserção: {str(e)}")
+                    raise
 
             total_inserido = sum(resultado.values())
             print(f"\nTotal: {total_inserido} registros inseridos")
@@ -197,6 +730,557 @@ class GasDataBase():
             print(f"Erro crítico em insert_values_into_db: {str(e)}")
             raise
 
+    def start_checkpoints(self, run_id: str, seed: Optional[int], codigos_iniciais: Dict[str, int]) -> None:
+        """
+        Registra uma execução retomável: semente e primeiro código de cada tabela.
+
+        Com esses dados a execução regenera exatamente os mesmos registros ao ser retomada.
+        Se o `run_id` já existir, os registros atuais são mantidos.
+
+        Args:
+            run_id (str): Identificador da execução.
+            seed (Optional[int]): Semente usada na geração dos dados.
+            codigos_iniciais (Dict[str, int]): {nome_tabela: primeiro número de código da execução}.
+        """
+        try:
+            tabela = CheckpointsCargaTable.__table__
+            with self.SessionLocal() as session:
+                session.execute(pg_insert(tabela).values([
+                    {'run_id': run_id, 'table_name': nome_tabela, 'seed': seed, 'codigo_inicial': codigo}
+                    for nome_tabela, codigo in codigos_iniciais.items()
+                ]).on_conflict_do_nothing(index_elements=[tabela.c.run_id, tabela.c.table_name]))
+                session.commit()
+
+        except Exception as e:
+            print(f"Erro crítico em start_checkpoints: {str(e)}")
+            raise
+
+    def get_checkpoints(self, run_id: str) -> Dict[str, Dict[str, any]]:
+        """
+        Retorna o progresso salvo de uma execução.
+
+        Args:
+            run_id (str): Identificador da execução.
+
+        Returns:
+            Dict[str, Dict[str, any]]: {nome_tabela: {'seed', 'codigo_inicial', 'ultimo_chunk',
+                'linhas_commitadas', 'concluida', 'atualizado_em'}}. Vazio se a execução não existir.
+
+        Example:
+            >>> db.get_checkpoints('carga_2025_01')
+            {'raw_pocos': {'ultimo_chunk': 0, 'linhas_commitadas': 100, 'concluida': True, ...}, ...}
+        """
+        try:
+            tabela = CheckpointsCargaTable.__table__
+            with self.SessionLocal() as session:
+                linhas = session.execute(
+                    select(tabela).where(tabela.c.run_id == run_id)
+                ).mappings().all()
+
+            return {
+                linha['table_name']: {k: v for k, v in linha.items() if k not in ('run_id', 'table_name')}
+                for linha in linhas
+            }
+
+        except Exception as e:
+            print(f"Erro crítico em get_checkpoints: {str(e)}")
+            raise
+
+    def _salvar_checkpoint(
+            self,
+            session,
+            run_id: str,
+            nome_tabela: str,
+            ultimo_chunk: int,
+            linhas_commitadas: int,
+            concluida: bool,
+        ) -> None:
+        """Atualiza (upsert) o checkpoint de uma tabela na transação do chunk, para serem commitados juntos."""
+        tabela = CheckpointsCargaTable.__table__
+        comando = pg_insert(tabela).values(
+            run_id=run_id,
+            table_name=nome_tabela,
+            ultimo_chunk=ultimo_chunk,
+            linhas_commitadas=linhas_commitadas,
+            concluida=concluida,
+            atualizado_em=func.now(),
+        )
+        session.execute(comando.on_conflict_do_update(
+            index_elements=[tabela.c.run_id, tabela.c.table_name],
+            set_={
+                'ultimo_chunk': comando.excluded.ultimo_chunk,
+                'linhas_commitadas': comando.excluded.linhas_commitadas,
+                'concluida': comando.excluded.concluida,
+                'atualizado_em': comando.excluded.atualizado_em,
+            },
+        ))
+
+    def insert_values_in_chunks(
+            self,
+            data: Dict[str, pd.DataFrame],
+            run_id: str,
+            chunk_size: int = 100_000,
+            metodo: str = 'copy',
+        ) -> Dict[str, int]:
+        """
+        Inserção retomável: um commit por chunk, com checkpoint em `pipeline_checkpoints`.
+
+        Cada chunk e o seu checkpoint são gravados na mesma transação, então após uma
+        falha a próxima chamada com o mesmo `run_id` (e os mesmos DataFrames) continua
+        da primeira linha ainda não commitada, sem reinserir nada. Transações curtas
+        também evitam que uma carga longa segure o VACUUM e acumule WAL.
+        As tabelas são carregadas na ordem do dicionário (respeite as FKs).
+
+        Args:
+            data (Dict[str, DataFrame]): {nome_tabela: DataFrame validado}.
+            run_id (str): Identificador da execução.
+            chunk_size (int): Quantidade de linhas por commit.
+            metodo (str): 'copy' (COPY FROM STDIN) ou 'orm' (bulk_insert_mappings).
+
+        Returns:
+            Dict[str, int]: {nome_tabela: quantidade_inserida nesta chamada}.
+
+        Raises:
+            ValueError: Se o método for inválido ou o DataFrame for menor que o já commitado.
+            Exeception: Erro crítico na inserção (chunks anteriores permanecem commitados).
+
+        Example:
+            >>> db.insert_values_in_chunks(dados, run_id='carga_2025_01', chunk_size=50_000)
+            {'raw_pocos': 0, 'raw_equipamentos': 0, 'raw_producao': 1_250_000, 'raw_incidentes': 10_000}
+        """
+        try:
+            if metodo not in ('orm', 'copy'):
+                raise ValueError(f"Método de inserção inválido: {metodo}. Use 'orm' ou 'copy'.")
+
+            checkpoints = self.get_checkpoints(run_id)
+            self.ensure_partitions(data)
+
+            resultado = {}
+            for nome_tabela, df in data.items():
+                resultado[nome_tabela] = 0
+                orm_class = self.orm_mapping.get(nome_tabela)
+                if df is None or df.empty or orm_class is None:
+                    print(f"{nome_tabela}: DataFrame vazio ou fora do mapeamento, pulando...")
+                    continue
+
+                checkpoint = checkpoints.get(nome_tabela, {})
+                if checkpoint.get('concluida'):
+                    print(f"{nome_tabela}: já concluída na execução {run_id}, pulando...")
+                    continue
+
+                linhas_commitadas = checkpoint.get('linhas_commitadas', 0)
+                ultimo_chunk = checkpoint.get('ultimo_chunk', -1)
+                if linhas_commitadas > len(df):
+                    raise ValueError(
+                        f"{nome_tabela}: {linhas_commitadas} linhas já commitadas, mas o DataFrame tem {len(df)}."
+                    )
+                if linhas_commitadas:
+                    print(f"{nome_tabela}: retomando a partir da linha {linhas_commitadas}")
+
+                for inicio in range(linhas_commitadas, len(df), chunk_size):
+                    chunk = df.iloc[inicio:inicio + chunk_size]
+
+                    with self.SessionLocal() as session:
+                        try:
+                            if metodo == 'copy':
+                                self._copy_dataframe(session, orm_class.__table__, chunk, chunk_size)
+                            else:
+                                session.bulk_insert_mappings(orm_class, chunk.to_dict('records'))
+                            self._garantir_codigos_unicos(session, orm_class.__table__, chunk)
+
+                            ultimo_chunk += 1
+                            linhas_commitadas += len(chunk)
+                            concluida = linhas_commitadas == len(df)
+
+                            self._salvar_checkpoint(
+                                session, run_id, nome_tabela, ultimo_chunk, linhas_commitadas, concluida
+                            )
+                            if concluida:
+                                self._registrar_watermark(session, nome_tabela, linhas_commitadas)
+                            session.commit()
+
+                        except Exception:
+                            session.rollback()
+                            raise
+
+                    resultado[nome_tabela] += len(chunk)
+
+                print(f"{nome_tabela}: {resultado[nome_tabela]} registros inseridos ({ultimo_chunk + 1} chunks)")
+
+            total_inserido = sum(resultado.values())
+            print(f"\nTotal: {total_inserido} registros inseridos")
+
+            return resultado
+
+        except Exception as e:
+            print(f"Erro crítico em insert_values_in_chunks: {str(e)}")
+            raise
+
+    def _garantir_codigos_unicos(self, session, tabela: Table, df: pd.DataFrame) -> None:
+        """
+        Confere, antes do commit, que os códigos carregados não se repetem na tabela particionada.
+
+        Nas tabelas particionadas a constraint única é (código, data), então o Postgres aceita
+        o mesmo código com outra data. Chamado depois da inserção: o advisory lock serializa
+        as cargas da tabela até o commit e, como cada comando enxerga o que já foi commitado,
+        duas execuções concorrentes com os mesmos códigos não passam as duas. Tabelas sem
+        `coluna_codigo` em `info` (não particionadas) são ignoradas.
+
+        Args:
+            session: Sessão SQLAlchemy com a transação corrente.
+            tabela (Table): Tabela de destino.
+            df (DataFrame): Dados recém-inseridos nesta transação.
+
+        Raises:
+            ValueError: Se algum código carregado aparecer mais de uma vez na tabela.
+        """
+        coluna = get_code_column(tabela)
+        if coluna is None or coluna not in df.columns:
+            return
+
+        preparer = self.engine.dialect.identifier_preparer
+        session.execute(text(CODE_LOCK_SQL), {'tabela': tabela.name})
+        repetidos = session.execute(
+            text(duplicate_codes_sql(tabela, preparer)),
+            {'codigos': df[coluna].astype(str).unique().tolist()},
+        ).scalars().all()
+
+        if repetidos:
+            raise ValueError(f"{tabela.name}: códigos repetidos na tabela: {', '.join(repetidos)}")
+
+    def _copy_dataframe(
+            self,
+            session,
+            tabela: Table,
+            df: pd.DataFrame,
+            chunk_size: int = 100_000,
+        ) -> int:
+        """
+        Envia um DataFrame para a tabela com `COPY ... FROM STDIN` (CSV em memória).
+
+        Usa a mesma conexão da sessão, então o COPY participa da transação aberta
+        e é desfeito pelo `rollback` como a inserção via ORM. O DataFrame é
+        serializado em fatias de `chunk_size` linhas para limitar o buffer.
+        Em tabelas particionadas, as linhas são agrupadas por mês e cada grupo vai
+        direto para a sua partição, sem o roteamento linha a linha da tabela pai
+        (as partições precisam existir: ver `ensure_partitions`).
+
+        Args:
+            session: Sessão SQLAlchemy com a transação corrente.
+            tabela (Table): Tabela de destino (ex.: `ProducaoTable.__table__`).
+            df (DataFrame): Dados a inserir (colunas com os nomes das colunas da tabela).
+            chunk_size (int): Quantidade de linhas por buffer CSV.
+
+        Returns:
+            int: Quantidade de linhas enviadas.
+
+        Raises:
+            ValueError: Se o DataFrame tiver colunas que não existem na tabela.
+            IntegrityError: Se o Postgres rejeitar a carga por chave duplicada ou FK.
+            DBAPIError: Qualquer outra falha do COPY (dado inválido, partição inexistente, conversão de tipo).
+        """
+        desconhecidas = [coluna for coluna in df.columns if coluna not in tabela.columns]
+        if desconhecidas:
+            raise ValueError(f"Colunas inexistentes em {tabela.name}: {desconhecidas}")
+
+        if 'data_insercao' in tabela.columns and 'data_insercao' not in df.columns:
+            df = df.assign(data_insercao=datetime.now())
+
+        preparer = self.engine.dialect.identifier_preparer
+        colunas = ", ".join(preparer.quote(coluna) for coluna in df.columns)
+
+        coluna_particao = get_partition_column(tabela)
+        if coluna_particao is not None and coluna_particao in df.columns:
+            meses = pd.to_datetime(df[coluna_particao]).dt.to_period('M')
+            destinos = [
+                (preparer.quote(partition_name(tabela.name, mes)), grupo)
+                for mes, grupo in df.groupby(meses, sort=True)
+            ]
+        else:
+            destinos = [(preparer.format_table(tabela), df)]
+
+        cursor = session.connection().connection.cursor()
+        quantidade = 0
+        sql = None
+        try:
+            for destino, df_destino in destinos:
+                sql = f"COPY {destino} ({colunas}) FROM STDIN WITH (FORMAT csv)"
+
+                for inicio in range(0, len(df_destino), chunk_size):
+                    parte = df_destino.iloc[inicio:inicio + chunk_size]
+                    buffer = io.StringIO()
+                    parte.to_csv(buffer, index=False, header=False)
+                    buffer.seek(0)
+
+                    cursor.copy_expert(sql, buffer)
+                    quantidade += len(parte)
+
+        except psycopg2.IntegrityError as e:
+            raise IntegrityError(sql, None, e) from e
+
+        except psycopg2.Error as e:
+            raise DBAPIError(sql, None, e) from e
+
+        finally:
+            cursor.close()
+
+        return quantidade
+
+    def merge_values_into_db(
+            self,
+            data: Optional[Dict[str, pd.DataFrame]] = None,
+            on_conflict: str = 'nothing',
+            chunk_size: int = 100_000,
+        ) -> Dict[str, Dict[str, int]]:
+        """
+        Carga idempotente: envia cada DataFrame para uma tabela de staging temporária
+        via COPY e faz o merge em `raw_*` com `INSERT ... ON CONFLICT`.
+
+        A deduplicação acontece no servidor, então não é preciso carregar os códigos
+        existentes em memória e um código repetido não derruba a transação inteira.
+
+        Nas tabelas particionadas (`raw_producao`, `raw_incidentes`) a constraint única
+        inclui a data da partição, então o ON CONFLICT sozinho deixaria entrar o mesmo
+        código com outra data. Nelas o merge continua deduplicando só pelo código:
+        'update' atualiza as linhas existentes com `UPDATE ... FROM` (corrigindo inclusive
+        a data, com o Postgres movendo a linha de partição) e só os códigos novos são
+        inseridos. Como não há constraint única só no código, o merge dessas tabelas
+        segura um advisory lock por tabela até o commit, e merges simultâneos do mesmo
+        código novo são serializados em vez de inserirem duas linhas.
+
+        Args:
+            data (Optional[Dict[str, DataFrame]]): Dicionário com {nome_tabela: DataFrame}.
+            on_conflict (str): 'nothing' ignora códigos já existentes; 'update' sobrescreve
+                os demais campos com os valores novos.
+            chunk_size (int): Quantidade de linhas por buffer do COPY.
+
+        Returns:
+            Dict[str, Dict[str, int]]: {nome_tabela: {'inseridos': n, 'atualizados': n, 'ignorados': n}}.
+
+        Raises:
+            ValueError: Se `on_conflict` for inválido.
+            Exeception: Erro crítico durante o merge (a transação é desfeita).
+
+        Example:
+            >>> db.merge_values_into_db({'raw_pocos': df_pocos}, on_conflict='nothing')
+            {'raw_pocos': {'inseridos': 95, 'atualizados': 0, 'ignorados': 5}}
+        """
+        try:
+            if on_conflict not in ('nothing', 'update'):
+                raise ValueError(f"on_conflict inválido: {on_conflict}. Use 'nothing' ou 'update'.")
+
+            self.ensure_partitions(data or {})
+
+            resultado = {}
+            with self.SessionLocal() as session:
+                try:
+                    for nome_tabela, df in (data or {}).items():
+                        vazio = {'inseridos': 0, 'atualizados': 0, 'ignorados': 0}
+                        if df is None or df.empty:
+                            print(f"{nome_tabela}: DataFrame vazio, pulando...")
+                            resultado[nome_tabela] = vazio
+                            continue
+
+                        orm_class = self.orm_mapping.get(nome_tabela)
+                        if orm_class is None:
+                            print(f"{nome_tabela}: Tabela não encontrada no mapeamento.")
+                            resultado[nome_tabela] = vazio
+                            continue
+
+                        print(f"Fazendo merge em {nome_tabela}...")
+                        resultado[nome_tabela] = self._merge_dataframe(
+                            session, orm_class.__table__, df, on_conflict, chunk_size
+                        )
+                        self._registrar_watermark(
+                            session,
+                            nome_tabela,
+                            resultado[nome_tabela]['inseridos'] + resultado[nome_tabela]['atualizados'],
+                        )
+                        print(
+                            f"{resultado[nome_tabela]['inseridos']} inseridos, "
+                            f"{resultado[nome_tabela]['atualizados']} atualizados, "
+                            f"{resultado[nome_tabela]['ignorados']} ignorados"
+                        )
+
+                    session.commit()
+
+                except Exception as e:
+                    session.rollback()
+                    print(f"Erro durante o merge: {str(e)}")
+                    raise
+
+            return resultado
+
+        except Exception as e:
+            print(f"Erro crítico em merge_values_into_db: {str(e)}")
+            raise
+
+    def _get_conflict_columns(self, tabela: Table) -> List[str]:
+        """Retorna as colunas da constraint única de negócio (ex.: o código) usada no ON CONFLICT."""
+        chave_primaria = set(tabela.primary_key.columns.keys())
+
+        for constraint in tabela.constraints:
+            if isinstance(constraint, UniqueConstraint):
+                colunas = list(constraint.columns.keys())
+                if set(colunas) != chave_primaria:
+                    return colunas
+
+        raise ValueError(f"Tabela {tabela.name} não possui constraint única além da chave primária.")
+
+    def _merge_dataframe(
+            self,
+            session,
+            tabela: Table,
+            df: pd.DataFrame,
+            on_conflict: str,
+            chunk_size: int,
+        ) -> Dict[str, int]:
+        """
+        Carrega um DataFrame na staging da tabela e faz o merge com ON CONFLICT.
+
+        A staging é uma tabela temporária (`ON COMMIT DROP`), visível só na conexão da
+        sessão, então merges simultâneos na mesma tabela não sobrescrevem os dados um
+        do outro e nenhuma staging sobra no banco se a transação falhar.
+
+        Args:
+            session: Sessão SQLAlchemy com a transação corrente.
+            tabela (Table): Tabela de destino.
+            df (DataFrame): Dados a carregar.
+            on_conflict (str): 'nothing' ou 'update'.
+            chunk_size (int): Quantidade de linhas por buffer do COPY.
+
+        Returns:
+            Dict[str, int]: {'inseridos': n, 'atualizados': n, 'ignorados': n}.
+        """
+        preparer = self.engine.dialect.identifier_preparer
+        colunas = [coluna for coluna in df.columns if coluna in tabela.columns]
+        conflito = self._get_conflict_columns(tabela)
+        coluna_particao = get_partition_column(tabela)
+
+        staging = Table(
+            f"{tabela.name}__staging",
+            MetaData(),
+            *[Column(coluna, tabela.columns[coluna].type) for coluna in colunas],
+        )
+        nome_staging = preparer.format_table(staging)
+        nome_tabela = preparer.format_table(tabela)
+
+        lista_colunas = ", ".join(preparer.quote(coluna) for coluna in colunas)
+        lista_conflito = ", ".join(preparer.quote(coluna) for coluna in conflito)
+
+        session.execute(text(
+            f"CREATE TEMP TABLE {nome_staging} ON COMMIT DROP AS "
+            f"SELECT {lista_colunas} FROM {nome_tabela} WITH NO DATA"
+        ))
+
+        recebidos = self._copy_dataframe(session, staging, df[colunas], chunk_size)
+
+        tem_data_insercao = 'data_insercao' in tabela.columns and 'data_insercao' not in colunas
+        destino = lista_colunas + (", data_insercao" if tem_data_insercao else "")
+        origem = lista_colunas + (", now()" if tem_data_insercao else "")
+
+        if coluna_particao in conflito:
+            session.execute(text(CODE_LOCK_SQL), {'tabela': tabela.name})
+            contagem = self._merge_por_codigo(
+                session,
+                nome_tabela,
+                nome_staging,
+                colunas,
+                conflito,
+                [coluna for coluna in conflito if coluna != coluna_particao],
+                on_conflict,
+                tem_data_insercao,
+            )
+            session.execute(text(f"DROP TABLE {nome_staging}"))
+            return {**contagem, 'ignorados': recebidos - contagem['inseridos'] - contagem['atualizados']}
+
+        if on_conflict == 'update':
+            atualizacoes = [
+                f"{preparer.quote(coluna)} = EXCLUDED.{preparer.quote(coluna)}"
+                for coluna in colunas if coluna not in conflito
+            ]
+            if tem_data_insercao:
+                atualizacoes.append("data_insercao = now()")
+            acao = f"DO UPDATE SET {', '.join(atualizacoes)}"
+        else:
+            acao = "DO NOTHING"
+
+        contagem = session.execute(text(
+            f"WITH merged AS ("
+            f"  INSERT INTO {nome_tabela} ({destino})"
+            f"  SELECT DISTINCT ON ({lista_conflito}) {origem} FROM {nome_staging}"
+            f"  ON CONFLICT ({lista_conflito}) {acao}"
+            f"  RETURNING (xmax = 0) AS inserido"
+            f") "
+            f"SELECT count(*) FILTER (WHERE inserido), count(*) FILTER (WHERE NOT inserido) FROM merged"
+        )).one()
+
+        session.execute(text(f"DROP TABLE {nome_staging}"))
+
+        inseridos, atualizados = int(contagem[0]), int(contagem[1])
+        return {
+            'inseridos': inseridos,
+            'atualizados': atualizados,
+            'ignorados': recebidos - inseridos - atualizados,
+        }
+
+    def _merge_por_codigo(
+            self,
+            session,
+            nome_tabela: str,
+            nome_staging: str,
+            colunas: List[str],
+            conflito: List[str],
+            chave: List[str],
+            on_conflict: str,
+            tem_data_insercao: bool,
+        ) -> Dict[str, int]:
+        """
+        Merge de tabela particionada deduplicando pelo código (`chave`), não pela constraint única.
+
+        Args:
+            session: Sessão SQLAlchemy com a transação corrente.
+            nome_tabela (str): Tabela de destino, já citada.
+            nome_staging (str): Staging com os dados, já citada.
+            colunas (List[str]): Colunas carregadas na staging.
+            conflito (List[str]): Colunas da constraint única (código e coluna da partição).
+            chave (List[str]): Colunas que identificam o registro (o código).
+            on_conflict (str): 'nothing' ou 'update'.
+            tem_data_insercao (bool): Se `data_insercao` deve ser preenchida com `now()`.
+
+        Returns:
+            Dict[str, int]: {'inseridos': n, 'atualizados': n}.
+        """
+        preparer = self.engine.dialect.identifier_preparer
+        lista_colunas = ", ".join(preparer.quote(coluna) for coluna in colunas)
+        lista_chave = ", ".join(preparer.quote(coluna) for coluna in chave)
+        lista_conflito = ", ".join(preparer.quote(coluna) for coluna in conflito)
+        mesma_chave = " AND ".join(f"t.{preparer.quote(coluna)} = s.{preparer.quote(coluna)}" for coluna in chave)
+        fonte = f"(SELECT DISTINCT ON ({lista_chave}) {lista_colunas} FROM {nome_staging}) AS s"
+
+        atualizados = 0
+        if on_conflict == 'update':
+            atualizacoes = [
+                f"{preparer.quote(coluna)} = s.{preparer.quote(coluna)}"
+                for coluna in colunas if coluna not in chave
+            ]
+            if tem_data_insercao:
+                atualizacoes.append("data_insercao = now()")
+            atualizados = session.execute(text(
+                f"UPDATE {nome_tabela} AS t SET {', '.join(atualizacoes)} FROM {fonte} WHERE {mesma_chave}"
+            )).rowcount
+
+        destino = lista_colunas + (", data_insercao" if tem_data_insercao else "")
+        origem = lista_colunas + (", now()" if tem_data_insercao else "")
+        inseridos = session.execute(text(
+            f"INSERT INTO {nome_tabela} ({destino}) "
+            f"SELECT {origem} FROM {fonte} "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {nome_tabela} AS t WHERE {mesma_chave}) "
+            f"ON CONFLICT ({lista_conflito}) DO NOTHING"
+        )).rowcount
+
+        return {'inseridos': inseridos, 'atualizados': atualizados}
+
     def get_existing_codes(
             self,
             table_name: str,
@@ -235,4 +1319,396 @@ class GasDataBase():
                 return codigos_existentes
             
         except Exception as e:
-            print(f"Erro crítico em get_existing_codes: {str(e)}")
\ No newline at end of file
+            print(f"Erro crítico em get_existing_codes: {str(e)}")
+
+    def get_max_code_number(
+            self,
+            table_name: str,
+            code_column: str,
+            prefixo: str
+        ) -> Optional[int]:
+        """
+        Busca o maior número já usado nos códigos de uma tabela (ex.: 6606 em 'POCO_6606').
+
+        A agregação é feita no próprio Postgres, então apenas um valor trafega
+        pela rede, independentemente do tamanho da tabela.
+
+        Args:
+            table_name: Nome da tabela no mapeamento ORM.
+            code_column: Nome da Coluna que contém o código único.
+            prefixo: Prefixo dos códigos, ex.: 'POCO_'.
+
+        Returns:
+            Optional[int]: Maior número encontrado, ou None se a tabela não tiver códigos.
+
+        Example:
+            >>> db.get_max_code_number('raw_pocos', 'codigo_poco', 'POCO_')
+            6606
+        """
+        try:
+            orm_class = self.orm_mapping.get(table_name)
+            if orm_class is None:
+                print(f"Tabela {table_name} não encontrada no mapeamento")
+                return None
+
+            if not hasattr(orm_class, code_column):
+                print(f"Coluna {code_column} não existe na tabela {table_name}")
+                return None
+
+            column = getattr(orm_class, code_column)
+            sufixo = func.substr(column, len(prefixo) + 1)
+
+            with self.SessionLocal() as session:
+                maior = session.execute(
+                    select(func.max(cast(sufixo, BigInteger)))
+                    .where(column.startswith(prefixo, autoescape=True))
+                    .where(sufixo.regexp_match('^[0-9]+$'))
+                ).scalar()
+
+                print(f"Maior código em {table_name}: {prefixo}{maior}" if maior is not None
+                      else f"Nenhum código existente em {table_name}")
+                return maior
+
+        except Exception as e:
+            print(f"Erro crítico em get_max_code_number: {str(e)}")
+            raise
+
+    def _pandas_dtypes(self, tabela: Table, colunas: List[str]) -> Dict[str, any]:
+        """Dtypes pandas equivalentes aos tipos das colunas (inteiros anuláveis, float32, datas e categorias)."""
+        dtypes = {}
+
+        for nome in colunas:
+            tipo = tabela.c[nome].type
+            if isinstance(tipo, Enum):
+                dtypes[nome] = pd.CategoricalDtype(tipo.enums)
+            elif isinstance(tipo, SmallInteger):
+                dtypes[nome] = 'Int16'
+            elif isinstance(tipo, BigInteger):
+                dtypes[nome] = 'Int64'
+            elif isinstance(tipo, Integer):
+                dtypes[nome] = 'Int32'
+            elif isinstance(tipo, REAL):
+                dtypes[nome] = 'float32'
+            elif isinstance(tipo, Float):
+                dtypes[nome] = 'float64'
+            elif isinstance(tipo, Boolean):
+                dtypes[nome] = 'boolean'
+            elif isinstance(tipo, (Date, DateTime)):
+                dtypes[nome] = 'datetime64[ns]'
+
+        return dtypes
+
+    def iter_table(
+            self,
+            table_name: str,
+            columns: Optional[List[str]] = None,
+            data_inicio=None,
+            data_fim=None,
+            cod_poco: Optional[List[str]] = None,
+            batch_size: int = 50_000,
+            coluna_data: Optional[str] = None,
+        ) -> Iterator[pd.DataFrame]:
+        """
+        Lê uma tabela em DataFrames de até `batch_size` linhas, com cursor no servidor.
+
+        O Postgres entrega as linhas sob demanda (cursor nomeado do psycopg2 via
+        `yield_per`), então a memória fica limitada a um lote, independentemente do
+        tamanho da tabela. Os filtros são aplicados no próprio Banco de Dados; em
+        tabelas particionadas, o filtro de datas na coluna de partição descarta as
+        partições fora do intervalo.
+
+        Args:
+            table_name (str): Nome da tabela no mapeamento ORM.
+            columns (Optional[List[str]]): Colunas a ler. Se None, lê todas.
+            data_inicio: Data mínima (inclusive) em `coluna_data`.
+            data_fim: Data máxima (exclusive) em `coluna_data`.
+            cod_poco (Optional[List[str]]): Filtra pelos poços informados
+                (`cod_poco`, ou `codigo_poco` em raw_pocos).
+            batch_size (int): Quantidade de linhas por DataFrame.
+            coluna_data (Optional[str]): Coluna usada no filtro de datas. Se None, usa a
+                coluna de partição ou a primeira coluna `Date` da tabela.
+
+        Yields:
+            DataFrame: Lote com dtypes tipados (`Int16`/`Int32`/`Int64`, `float32`,
+                `datetime64[ns]` e `category` para as colunas ENUM).
+
+        Raises:
+            ValueError: Se a tabela, uma coluna ou o filtro não existir.
+
+        Example:
+            >>> for lote in db.iter_table('raw_producao', columns=['cod_poco', 'data_producao', 'petroleo_barris_dia'],
+            ...                           data_inicio='2024-01-01', data_fim='2024-04-01'):
+            ...     total += lote['petroleo_barris_dia'].sum()
+        """
+        try:
+            orm_class = self.orm_mapping.get(table_name)
+            if orm_class is None:
+                raise ValueError(f"Tabela {table_name} não encontrada no mapeamento")
+
+            tabela = orm_class.__table__
+            colunas = columns or list(tabela.columns.keys())
+            desconhecidas = [coluna for coluna in colunas if coluna not in tabela.columns]
+            if desconhecidas:
+                raise ValueError(f"Colunas inexistentes em {table_name}: {desconhecidas}")
+
+            consulta = select(*[tabela.c[coluna] for coluna in colunas])
+
+            if data_inicio is not None or data_fim is not None:
+                coluna_data = coluna_data or get_partition_column(tabela) or next(
+                    (coluna.name for coluna in tabela.columns if isinstance(coluna.type, Date)), None
+                )
+                if coluna_data is None or coluna_data not in tabela.columns:
+                    raise ValueError(f"Tabela {table_name} não tem coluna de data para o filtro")
+                if data_inicio is not None:
+                    consulta = consulta.where(tabela.c[coluna_data] >= pd.Timestamp(data_inicio).date())
+                if data_fim is not None:
+                    consulta = consulta.where(tabela.c[coluna_data] < pd.Timestamp(data_fim).date())
+
+            if cod_poco is not None:
+                coluna_poco = 'cod_poco' if 'cod_poco' in tabela.columns else 'codigo_poco'
+                consulta = consulta.where(tabela.c[coluna_poco].in_(list(cod_poco)))
+
+            dtypes = self._pandas_dtypes(tabela, colunas)
+            datas = [coluna for coluna, dtype in dtypes.items() if dtype == 'datetime64[ns]']
+
+            with self.engine.connect() as conn:
+                resultado = conn.execution_options(yield_per=batch_size).execute(consulta)
+
+                for linhas in resultado.partitions():
+                    lote = pd.DataFrame.from_records(linhas, columns=colunas)
+                    for coluna in datas:
+                        lote[coluna] = pd.to_datetime(lote[coluna])
+                    yield lote.astype(dtypes)
+
+        except Exception as e:
+            print(f"Erro crítico em iter_table: {str(e)}")
+            raise
+
+    def export_parquet(
+            self,
+            diretorio: str,
+            table_name: Optional[List[str]] = None,
+            batch_size: int = 500_000,
+        ) -> Dict[str, int]:
+        """
+        Exporta as tabelas para datasets Parquet, lendo em lotes com `iter_table`.
+
+        Cada tabela vira `<diretorio>/<tabela>/`. As tabelas particionadas são gravadas
+        com partição Hive por mês (`mes=2024-01/`), na mesma granularidade das
+        partições do Postgres. O `id` não é exportado: é gerado de novo na importação
+        (as FKs usam os códigos). Um dataset anterior da mesma tabela é substituído.
+
+        Args:
+            diretorio (str): Pasta de destino.
+            table_name (Optional[List[str]]): Tabelas a exportar. Se None, exporta todas do mapeamento.
+            batch_size (int): Linhas lidas e gravadas por vez (limita a memória).
+
+        Returns:
+            Dict[str, int]: {nome_tabela: quantidade_exportada}.
+
+        Raises:
+            ImportError: Se o `pyarrow` não estiver instalado.
+
+        Example:
+            >>> db.export_parquet('snapshots/2024-06-01')
+            {'raw_pocos': 100, 'raw_equipamentos': 500, 'raw_producao': 2000000, 'raw_incidentes': 250}
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            resultado = {}
+            inicio = time.perf_counter()
+
+            for nome_tabela in table_name or list(self.orm_mapping.keys()):
+                orm_class = self.orm_mapping.get(nome_tabela)
+                if orm_class is None:
+                    print(f"{nome_tabela}: Tabela não encontrada no mapeamento.")
+                    continue
+
+                tabela = orm_class.__table__
+                coluna_particao = get_partition_column(tabela)
+                destino = os.path.join(diretorio, nome_tabela)
+                shutil.rmtree(destino, ignore_errors=True)
+                os.makedirs(destino)
+
+                colunas = [coluna for coluna in tabela.columns.keys() if coluna != 'id']
+                quantidade = 0
+
+                for numero, lote in enumerate(self.iter_table(nome_tabela, columns=colunas, batch_size=batch_size)):
+                    if coluna_particao is not None:
+                        lote['mes'] = lote[coluna_particao].dt.strftime('%Y-%m')
+
+                    pq.write_to_dataset(
+                        pa.Table.from_pandas(lote, preserve_index=False),
+                        root_path=destino,
+                        partition_cols=['mes'] if coluna_particao is not None else None,
+                        basename_template=f"parte-{numero:05d}-{{i}}.parquet",
+                        existing_data_behavior='overwrite_or_ignore',
+                    )
+                    quantidade += len(lote)
+
+                resultado[nome_tabela] = quantidade
+                print(f"{nome_tabela}: {quantidade} registros exportados para {destino}")
+
+            print(f"\nExportação concluída em {time.perf_counter() - inicio:.2f}s")
+            return resultado
+
+        except Exception as e:
+            print(f"Erro crítico em export_parquet: {str(e)}")
+            raise
+
+    def import_parquet(
+            self,
+            diretorio: str,
+            table_name: Optional[List[str]] = None,
+            chunk_size: int = 500_000,
+            metodo: str = 'copy',
+        ) -> Dict[str, int]:
+        """
+        Recarrega datasets gerados por `export_parquet`, na ordem das FKs.
+
+        Os arquivos são lidos em lotes de `chunk_size` linhas (Arrow) e cada lote
+        vai para a tabela pelo mesmo caminho da carga em massa (`ensure_partitions`
+        + `COPY`), com um commit por lote. As tabelas de destino devem estar vazias
+        ou sem os códigos importados (ver `truncate_all_tables`).
+
+        Args:
+            diretorio (str): Pasta com um subdiretório por tabela.
+            table_name (Optional[List[str]]): Tabelas a importar. Se None, importa as que
+                existirem no diretório.
+            chunk_size (int): Linhas por lote (e por commit).
+            metodo (str): 'copy' (padrão) ou 'orm'.
+
+        Returns:
+            Dict[str, int]: {nome_tabela: quantidade_importada}.
+
+        Raises:
+            ImportError: Se o `pyarrow` não estiver instalado.
+            IntegrityError: Se algum código já existir na tabela de destino.
+
+        Example:
+            >>> db.import_parquet('snapshots/2024-06-01')
+            {'raw_pocos': 100, 'raw_equipamentos': 500, 'raw_producao': 2000000, 'raw_incidentes': 250}
+        """
+        try:
+            import pyarrow.dataset as ds
+
+            if metodo not in ('orm', 'copy'):
+                raise ValueError(f"Método de inserção inválido: {metodo}. Use 'orm' ou 'copy'.")
+
+            selecionadas = table_name or [
+                nome for nome in self.orm_mapping if os.path.isdir(os.path.join(diretorio, nome))
+            ]
+            ordem = [tabela.name for tabela in Base.metadata.sorted_tables if tabela.name in selecionadas]
+
+            resultado = {}
+            inicio = time.perf_counter()
+
+            for nome_tabela in ordem:
+                orm_class = self.orm_mapping[nome_tabela]
+                dataset = ds.dataset(os.path.join(diretorio, nome_tabela), format='parquet', partitioning='hive')
+                quantidade = 0
+
+                print(f"Importando {nome_tabela}...")
+                with self.SessionLocal() as session:
+                    try:
+                        for lote in dataset.to_batches(batch_size=chunk_size):
+                            df = lote.to_pandas().drop(columns=['mes'], errors='ignore')
+                            if df.empty:
+                                continue
+
+                            self.ensure_partitions({nome_tabela: df})
+                            if metodo == 'copy':
+                                self._copy_dataframe(session, orm_class.__table__, df, chunk_size)
+                            else:
+                                session.bulk_insert_mappings(orm_class, df.to_dict('records'))
+                            self._garantir_codigos_unicos(session, orm_class.__table__, df)
+
+                            session.commit()
+                            quantidade += len(df)
+
+                        self._registrar_watermark(session, nome_tabela, quantidade)
+                        session.commit()
+
+                    except Exception:
+                        session.rollback()
+                        raise
+
+                resultado[nome_tabela] = quantidade
+                print(f"{quantidade} registros importados")
+
+            print(f"\nImportação concluída em {time.perf_counter() - inicio:.2f}s")
+            return resultado
+
+        except Exception as e:
+            print(f"Erro crítico em import_parquet: {str(e)}")
+            raise
+
+    def insert_quarantine(
+            self,
+            rejeitados: Dict[str, Optional[pd.DataFrame]],
+            chunk_size: int = 10_000,
+        ) -> Dict[str, int]:
+        """
+        Grava as linhas reprovadas na validação nas tabelas `quarantine_*`.
+
+        Cada linha vira um registro com a linha original em `payload` (JSONB, datas em
+        ISO 8601) e a lista de falhas em `motivos`, para correção e reprocessamento
+        sem regerar a carga inteira.
+
+        Args:
+            rejeitados (Dict[str, DataFrame]): {nome_tabela: DataFrame com a coluna `motivos`},
+                como retornado por `ValidateSchema.split_valid_invalid`.
+            chunk_size (int): Linhas por INSERT em lote.
+
+        Returns:
+            Dict[str, int]: {nome_tabela: quantidade_em_quarentena}.
+
+        Example:
+            >>> db.insert_quarantine({'raw_producao': rejeitados_producao})
+            {'raw_producao': 3}
+        """
+        try:
+            resultado = {}
+
+            with self.SessionLocal() as session:
+                try:
+                    for nome_tabela, df in rejeitados.items():
+                        if df is None or df.empty:
+                            continue
+
+                        mapeamento = self.quarantine_mapping.get(nome_tabela)
+                        if mapeamento is None:
+                            print(f"{nome_tabela}: Tabela sem quarentena no mapeamento.")
+                            continue
+                        orm_class, coluna_codigo = mapeamento
+
+                        for inicio in range(0, len(df), chunk_size):
+                            chunk = df.iloc[inicio:inicio + chunk_size]
+                            payloads = json.loads(
+                                chunk.drop(columns=['motivos']).to_json(
+                                    orient='records', date_format='iso', force_ascii=False
+                                )
+                            )
+                            codigos = chunk[coluna_codigo] if coluna_codigo in chunk.columns else [None] * len(chunk)
+
+                            session.execute(insert(orm_class), [
+                                {'codigo': None if pd.isna(codigo) else str(codigo), 'payload': payload, 'motivos': list(motivos)}
+                                for codigo, payload, motivos in zip(codigos, payloads, chunk['motivos'])
+                            ])
+
+                        resultado[nome_tabela] = len(df)
+                        print(f"{nome_tabela}: {len(df)} registro(s) em quarentena")
+
+                    session.commit()
+
+                except Exception:
+                    session.rollback()
+                    raise
+
+            return resultado
+
+        except Exception as e:
+            print(f"Erro crítico em insert_quarantine: {str(e)}")
+            raise
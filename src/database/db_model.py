@@ -1,7 +1,16 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import (
+    Column, String, Integer, SmallInteger, BigInteger, Boolean, REAL, Date, DateTime, Enum,
+    ForeignKey, UniqueConstraint, Index
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import func
 
+from src.schemas.dominios import (
+    CAMADAS, STATUS_OPERACIONAL, OPERADORAS, TIPOS_EQUIPAMENTO, MARCAS,
+    TIPOS_INCIDENTE, SEVERIDADES, STATUS_RESOLUCAO
+)
+
 Base = declarative_base()
 
 class PocosTable(Base):
@@ -10,13 +19,13 @@ class PocosTable(Base):
     id = Column(Integer, primary_key=True, unique=True, autoincrement=True, nullable=False)
     codigo_poco = Column(String, unique=True, nullable=False)
     nome_poco = Column(String, nullable=False)
-    tipo_poco = Column(String, nullable=False)
+    tipo_poco = Column(SmallInteger, nullable=False)
     localizacao = Column(String, nullable=False)
-    camada = Column(String, nullable=False)
-    profundidade_metros = Column(Integer, nullable=False)
-    status_operacional = Column(String, nullable=False)
-    data_perfuracao = Column(DateTime, nullable=False)
-    operadora = Column(String, nullable=False)
+    camada = Column(Enum(*CAMADAS, name='camada_poco'), nullable=False)
+    profundidade_metros = Column(SmallInteger, nullable=False)
+    status_operacional = Column(Enum(*STATUS_OPERACIONAL, name='status_operacional_poco'), nullable=False)
+    data_perfuracao = Column(Date, nullable=False)
+    operadora = Column(Enum(*OPERADORAS, name='operadora_poco'), nullable=False)
     data_insercao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
 
     equipamentos = relationship("EquipamentosTable", back_populates="pocos")
@@ -25,17 +34,21 @@ class PocosTable(Base):
 
 class EquipamentosTable(Base):
     __tablename__ = 'raw_equipamentos'
+    __table_args__ = (
+        Index('ix_raw_equipamentos_cod_poco', 'cod_poco'),
+    )
 
     id = Column(Integer, primary_key=True, unique=True, autoincrement=True, nullable=False)
     cod_equipamento = Column(String, unique=True, nullable=False)
     cod_poco = Column(String, ForeignKey('raw_pocos.codigo_poco'), nullable=False)
-    tipo_equipamento = Column(String, nullable=False)
-    marca = Column(String, nullable=False)
+    tipo_equipamento = Column(Enum(*TIPOS_EQUIPAMENTO, name='tipo_equipamento'), nullable=False)
+    marca = Column(Enum(*MARCAS, name='marca_equipamento'), nullable=False)
     modelo = Column(String, nullable=False)
-    data_instalacao = Column(DateTime, nullable=False)
-    vida_util_anos = Column(Integer, nullable=False)
+    data_instalacao = Column(Date, nullable=False)
+    vida_util_anos = Column(SmallInteger, nullable=False)
+    # Mantido como timestamp: o dbt calcula `current_date - ultimo_teste` como intervalo.
     ultimo_teste = Column(DateTime, nullable=False)
-    eficiencia_operacional = Column(Float, nullable=False)
+    eficiencia_operacional = Column(REAL, nullable=False)
     data_insercao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
 
     pocos = relationship("PocosTable", back_populates="equipamentos")
@@ -43,34 +56,116 @@ class EquipamentosTable(Base):
 
 class ProducaoTable(Base):
     __tablename__ = 'raw_producao'
+    # Particionada por mês em data_producao: PK e constraints únicas precisam conter a coluna da partição.
+    # Por isso o Postgres não garante mais um cod_producao único (só o par código + data); a unicidade
+    # do código é conferida pelos carregadores (`GasDataBase._garantir_codigos_unicos`) antes do commit.
+    __table_args__ = (
+        UniqueConstraint('cod_producao', 'data_producao'),
+        Index('ix_raw_producao_cod_poco', 'cod_poco'),
+        # BRIN: as linhas chegam em ordem de data, então um índice de poucas páginas basta.
+        Index('ix_raw_producao_data_producao', 'data_producao', postgresql_using='brin'),
+        Index('ix_raw_producao_data_insercao', 'data_insercao', postgresql_using='brin'),
+        {
+            'postgresql_partition_by': 'RANGE (data_producao)',
+            'info': {'coluna_particao': 'data_producao', 'coluna_codigo': 'cod_producao'},
+        },
+    )
 
-    id = Column(Integer, primary_key=True, unique=True, autoincrement=True, nullable=False)
-    cod_producao = Column(String, unique=True, nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True, nullable=False)
+    cod_producao = Column(String, nullable=False)
     cod_poco = Column(String, ForeignKey('raw_pocos.codigo_poco'), nullable=False)
-    data_producao = Column(DateTime, nullable=False)
+    data_producao = Column(Date, primary_key=True, nullable=False)
     petroleo_barris_dia = Column(Integer, nullable=False)
-    agua_produzida_m3 = Column(Float, nullable=False)
-    tempo_horas_operacao = Column(Float, nullable=False)
-    pressao_bar = Column(Integer, nullable=False)
-    temperatura_celsius = Column(Float, nullable=False)
+    agua_produzida_m3 = Column(REAL, nullable=False)
+    tempo_horas_operacao = Column(REAL, nullable=False)
+    pressao_bar = Column(SmallInteger, nullable=False)
+    temperatura_celsius = Column(REAL, nullable=False)
     data_insercao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
 
     pocos = relationship("PocosTable", back_populates='producao')
 
 class IncidentesTable(Base):
     __tablename__ = 'raw_incidentes'
+    # Particionada por mês em data_incidente: PK e constraints únicas precisam conter a coluna da partição.
+    # Como em raw_producao, a unicidade de cod_incidente sozinho é conferida pelos carregadores.
+    __table_args__ = (
+        UniqueConstraint('cod_incidente', 'data_incidente'),
+        Index('ix_raw_incidentes_cod_poco', 'cod_poco'),
+        Index('ix_raw_incidentes_cod_equipamento', 'cod_equipamento'),
+        Index('ix_raw_incidentes_data_insercao', 'data_insercao', postgresql_using='brin'),
+        {
+            'postgresql_partition_by': 'RANGE (data_incidente)',
+            'info': {'coluna_particao': 'data_incidente', 'coluna_codigo': 'cod_incidente'},
+        },
+    )
 
-    id = Column(Integer, primary_key=True, unique=True, autoincrement=True, nullable=False)
-    cod_incidente = Column(String, unique=True, nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True, nullable=False)
+    cod_incidente = Column(String, nullable=False)
     cod_poco = Column(String, ForeignKey('raw_pocos.codigo_poco'), nullable=False)
     cod_equipamento = Column(String, ForeignKey('raw_equipamentos.cod_equipamento'), nullable=False)
-    data_incidente = Column(DateTime, nullable=False)
-    tipo_incidente = Column(String, nullable=False)
-    severidade = Column(String, nullable=False)
-    tempo_parada_horas = Column(Float, nullable=False)
+    data_incidente = Column(Date, primary_key=True, nullable=False)
+    tipo_incidente = Column(Enum(*TIPOS_INCIDENTE, name='tipo_incidente'), nullable=False)
+    severidade = Column(Enum(*SEVERIDADES, name='severidade_incidente'), nullable=False)
+    tempo_parada_horas = Column(REAL, nullable=False)
     custo_estimado_reais = Column(Integer, nullable=False)
-    status_resolucao = Column(String, nullable=False)
+    status_resolucao = Column(Enum(*STATUS_RESOLUCAO, name='status_resolucao_incidente'), nullable=False)
     data_insercao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
 
     pocos = relationship("PocosTable", back_populates='incidentes')
-    equipamentos = relationship("EquipamentosTable", back_populates='incidentes')
\ No newline at end of file
+    equipamentos = relationship("EquipamentosTable", back_populates='incidentes')
+
+class CargasWatermarkTable(Base):
+    __tablename__ = 'pipeline_watermarks'
+
+    table_name = Column(String, primary_key=True, nullable=False)
+    ultima_carga = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+    linhas_ultima_carga = Column(BigInteger, nullable=False, default=0)
+
+class CheckpointsCargaTable(Base):
+    __tablename__ = 'pipeline_checkpoints'
+
+    run_id = Column(String, primary_key=True, nullable=False)
+    table_name = Column(String, primary_key=True, nullable=False)
+    seed = Column(BigInteger, nullable=True)
+    codigo_inicial = Column(BigInteger, nullable=True)
+    ultimo_chunk = Column(Integer, nullable=False, default=-1)
+    linhas_commitadas = Column(BigInteger, nullable=False, default=0)
+    concluida = Column(Boolean, nullable=False, default=False)
+    atualizado_em = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+
+# Linhas reprovadas na validação: `payload` guarda a linha original e `motivos` a lista de falhas.
+class QuarentenaPocosTable(Base):
+    __tablename__ = 'quarantine_pocos'
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
+    codigo = Column(String, nullable=True, index=True)
+    payload = Column(JSONB, nullable=False)
+    motivos = Column(JSONB, nullable=False)
+    data_insercao = Column(DateTime, nullable=False, default=func.now())
+
+class QuarentenaEquipamentosTable(Base):
+    __tablename__ = 'quarantine_equipamentos'
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
+    codigo = Column(String, nullable=True, index=True)
+    payload = Column(JSONB, nullable=False)
+    motivos = Column(JSONB, nullable=False)
+    data_insercao = Column(DateTime, nullable=False, default=func.now())
+
+class QuarentenaProducaoTable(Base):
+    __tablename__ = 'quarantine_producao'
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
+    codigo = Column(String, nullable=True, index=True)
+    payload = Column(JSONB, nullable=False)
+    motivos = Column(JSONB, nullable=False)
+    data_insercao = Column(DateTime, nullable=False, default=func.now())
+
+class QuarentenaIncidentesTable(Base):
+    __tablename__ = 'quarantine_incidentes'
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
+    codigo = Column(String, nullable=True, index=True)
+    payload = Column(JSONB, nullable=False)
+    motivos = Column(JSONB, nullable=False)
+    data_insercao = Column(DateTime, nullable=False, default=func.now())
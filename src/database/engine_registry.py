@@ -0,0 +1,157 @@
+import os
+import threading
+import time
+
+from typing import Optional, Dict, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_ENGINES: Dict[Tuple, Engine] = {}
+_SCHEMAS_VERIFICADOS = set()
+_LOCK = threading.Lock()
+
+
+class MonitoredQueuePool(QueuePool):
+    """
+    `QueuePool` que mede quanto tempo cada checkout espera por uma conexão.
+
+    Sobrescreve só o `connect()` público do pool (é ele que `Engine.connect()` e as
+    sessões chamam para obter a conexão), sem depender de métodos internos do
+    SQLAlchemy. O tempo medido inclui a espera na fila, o `pool_pre_ping` e a abertura
+    de uma conexão nova quando o pool ainda não a tem.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metricas_lock = threading.Lock()
+        self.checkouts = 0
+        self.tempo_espera_total = 0.0
+        self.tempo_espera_max = 0.0
+
+    def connect(self):
+        inicio = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            espera = time.perf_counter() - inicio
+            with self._metricas_lock:
+                self.checkouts += 1
+                self.tempo_espera_total += espera
+                self.tempo_espera_max = max(self.tempo_espera_max, espera)
+
+
+def build_database_url(driver: str = 'psycopg2') -> str:
+    """Monta a URL do Postgres a partir das variáveis de ambiente DB_* ('psycopg2' ou 'asyncpg')."""
+    return (
+        f"postgresql+{driver}://{os.getenv('DB_USER')}:{os.getenv('DB_PASS')}"
+        f"@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+    )
+
+
+def get_engine(
+        url: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_pre_ping: bool = True,
+        pool_recycle: Optional[int] = None,
+    ) -> Engine:
+    """
+    Retorna o engine do processo para a URL e configuração de pool informadas.
+
+    Engines são criados uma única vez por (processo, URL, configuração) e reutilizados
+    por todas as instâncias de `GasDataBase`. Valores não informados vêm das variáveis
+    DB_POOL_SIZE, DB_MAX_OVERFLOW e DB_POOL_RECYCLE (padrões 5, 10 e 1800 segundos).
+
+    Args:
+        url (Optional[str]): URL do Banco de Dados. Se None, usa `build_database_url()`.
+        pool_size (Optional[int]): Conexões mantidas abertas no pool.
+        max_overflow (Optional[int]): Conexões extras permitidas acima de `pool_size`.
+        pool_pre_ping (bool): Testa a conexão antes de cada checkout.
+        pool_recycle (Optional[int]): Idade máxima (segundos) de uma conexão antes de ser reciclada.
+
+    Returns:
+        Engine: Engine compartilhado.
+    """
+    url = url or build_database_url()
+    pool_size = pool_size if pool_size is not None else int(os.getenv('DB_POOL_SIZE', 5))
+    max_overflow = max_overflow if max_overflow is not None else int(os.getenv('DB_MAX_OVERFLOW', 10))
+    pool_recycle = pool_recycle if pool_recycle is not None else int(os.getenv('DB_POOL_RECYCLE', 1800))
+
+    # O pid entra na chave para que processos filhos (fork) não herdem conexões do pai.
+    chave = (os.getpid(), url, pool_size, max_overflow, pool_pre_ping, pool_recycle)
+
+    with _LOCK:
+        engine = _ENGINES.get(chave)
+        if engine is None:
+            engine = create_engine(
+                url,
+                poolclass=MonitoredQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=pool_pre_ping,
+                pool_recycle=pool_recycle,
+                executemany_mode='values_plus_batch',
+                insertmanyvalues_page_size=10_000,
+            )
+            _ENGINES[chave] = engine
+
+        return engine
+
+
+def ensure_schema(engine: Engine, metadata, force: bool = False) -> bool:
+    """
+    Executa `metadata.create_all` no máximo uma vez por processo e Banco de Dados.
+
+    Args:
+        engine (Engine): Engine do Banco de Dados.
+        metadata: MetaData com as tabelas do projeto.
+        force (bool): Se True, executa mesmo que o schema já tenha sido verificado.
+
+    Returns:
+        bool: True se o `create_all` foi executado nesta chamada.
+    """
+    chave = (os.getpid(), str(engine.url), id(metadata))
+
+    with _LOCK:
+        if chave in _SCHEMAS_VERIFICADOS and not force:
+            return False
+
+        metadata.create_all(bind=engine)
+        _SCHEMAS_VERIFICADOS.add(chave)
+        return True
+
+
+def get_pool_metrics(engine: Engine) -> Dict[str, float]:
+    """
+    Retorna as métricas do pool de conexões de um engine.
+
+    Args:
+        engine (Engine): Engine do Banco de Dados.
+
+    Returns:
+        Dict[str, float]: Tamanho, conexões em uso/livres, overflow e tempos de espera no checkout.
+
+    Example:
+        >>> get_pool_metrics(db.engine)
+        {'pool_size': 5, 'checked_out': 2, 'checked_in': 3, 'overflow': 0, 'checkouts': 120, ...}
+    """
+    pool = engine.pool
+    metricas = {
+        'pool_size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        'overflow': max(pool.overflow(), 0),
+    }
+
+    if isinstance(pool, MonitoredQueuePool):
+        metricas['checkouts'] = pool.checkouts
+        metricas['tempo_espera_total_s'] = pool.tempo_espera_total
+        metricas['tempo_espera_medio_s'] = pool.tempo_espera_total / pool.checkouts if pool.checkouts else 0.0
+        metricas['tempo_espera_max_s'] = pool.tempo_espera_max
+
+    return metricas
+
@@ -0,0 +1,215 @@
+import time
+import pandas as pd
+
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from graphlib import TopologicalSorter
+from typing import Optional, Dict, List, Set
+
+from src.database.db_connection import GasDataBase
+from src.database.db_model import Base
+
+
+def build_dependency_graph(tabelas) -> Dict[str, Set[str]]:
+    """
+    Monta o grafo {tabela: tabelas que ela referencia} a partir das FKs do metadata.
+
+    Args:
+        tabelas: Nomes das tabelas consideradas; FKs para tabelas fora da lista são ignoradas.
+
+    Returns:
+        Dict[str, Set[str]]: Dependências de cada tabela.
+
+    Example:
+        >>> build_dependency_graph(['raw_pocos', 'raw_producao', 'raw_incidentes'])
+        {'raw_pocos': set(), 'raw_producao': {'raw_pocos'}, 'raw_incidentes': {'raw_pocos'}}
+    """
+    tabelas = set(tabelas)
+    grafo = {}
+
+    for nome_tabela in tabelas:
+        tabela = Base.metadata.tables.get(nome_tabela)
+        if tabela is None:
+            grafo[nome_tabela] = set()
+            continue
+
+        grafo[nome_tabela] = {
+            fk.column.table.name for fk in tabela.foreign_keys
+            if fk.column.table.name in tabelas and fk.column.table.name != nome_tabela
+        }
+
+    return grafo
+
+
+def fk_levels(tabelas) -> List[List[str]]:
+    """
+    Agrupa as tabelas em níveis: cada nível só referencia tabelas dos níveis anteriores.
+
+    Example:
+        >>> fk_levels(['raw_pocos', 'raw_equipamentos', 'raw_producao', 'raw_incidentes'])
+        [['raw_pocos'], ['raw_equipamentos', 'raw_producao'], ['raw_incidentes']]
+    """
+    ordenador = TopologicalSorter(build_dependency_graph(tabelas))
+    ordenador.prepare()
+
+    niveis = []
+    while ordenador.is_active():
+        nivel = sorted(ordenador.get_ready())
+        niveis.append(nivel)
+        ordenador.done(*nivel)
+
+    return niveis
+
+
+class ParallelLoader():
+    """
+    Carregador que insere tabelas independentes em paralelo, respeitando as FKs.
+
+    O grafo de dependências é montado a partir das foreign keys de `Base.metadata`:
+    uma tabela só começa a ser carregada quando todas as tabelas que ela referencia
+    terminaram. Cada tabela usa sua própria conexão do pool e faz commit por chunk.
+    """
+    def __init__(
+            self,
+            db_connection: Optional[GasDataBase] = None,
+            max_workers: int = 4,
+            chunk_size: int = 100_000,
+            metodo: str = 'copy',
+            adiar_indices: bool = False,
+        ):
+        """
+        Args:
+            db_connection (Optional[GasDataBase]): Conexão com o Banco de Dados. Se None, cria uma nova.
+            max_workers (int): Quantidade máxima de tabelas carregadas ao mesmo tempo.
+            chunk_size (int): Quantidade de linhas por chunk (e por commit).
+            metodo (str): 'copy' (COPY FROM STDIN) ou 'orm' (bulk_insert_mappings).
+            adiar_indices (bool): Se True, remove os índices não únicos durante a carga
+                e os recria no final (ver `GasDataBase.deferred_indexes`).
+        """
+        if metodo not in ('orm', 'copy'):
+            raise ValueError(f"Método de inserção inválido: {metodo}. Use 'orm' ou 'copy'.")
+
+        self.db = db_connection if db_connection else GasDataBase()
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.metodo = metodo
+        self.adiar_indices = adiar_indices
+        self.metricas = {}
+
+    def load(self, data: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+        """
+        Carrega os DataFrames, disparando cada tabela assim que suas dependências terminam.
+
+        Args:
+            data (Dict[str, DataFrame]): {nome_tabela: DataFrame validado}.
+
+        Returns:
+            Dict[str, int]: {nome_tabela: quantidade_inserida}. A vazão por tabela
+                fica em `self.metricas`.
+
+        Raises:
+            Exception: Primeiro erro de carga. Tabelas dependentes da que falhou não são iniciadas;
+                chunks já commitados permanecem no Banco de Dados.
+
+        Example:
+            >>> ParallelLoader(db, max_workers=3).load(dados)
+            {'raw_pocos': 100, 'raw_equipamentos': 500, 'raw_producao': 2000000, 'raw_incidentes': 250}
+        """
+        dados = {tabela: df for tabela, df in data.items() if df is not None and not df.empty}
+        for tabela in data.keys() - dados.keys():
+            print(f"{tabela}: DataFrame vazio, pulando...")
+
+        self.db.ensure_partitions(dados)
+
+        grafo = build_dependency_graph(dados.keys())
+        ordenador = TopologicalSorter(grafo)
+        ordenador.prepare()
+
+        resultado = {tabela: 0 for tabela in data}
+        self.metricas = {}
+        inicio_total = time.perf_counter()
+        erro = None
+
+        adiamento = self.db.deferred_indexes(list(dados)) if self.adiar_indices else nullcontext()
+        with adiamento:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                em_andamento = {}
+
+                while ordenador.is_active() and erro is None:
+                    for tabela in ordenador.get_ready():
+                        print(f"Iniciando carga de {tabela}...")
+                        em_andamento[executor.submit(self._load_table, tabela, dados[tabela])] = tabela
+
+                    if not em_andamento:
+                        break
+
+                    concluidos, _ = wait(em_andamento, return_when=FIRST_COMPLETED)
+                    for futuro in concluidos:
+                        tabela = em_andamento.pop(futuro)
+                        try:
+                            resultado[tabela] = futuro.result()
+                            ordenador.done(tabela)
+                        except Exception as e:
+                            print(f"Erro ao carregar {tabela}: {str(e)}")
+                            erro = erro or e
+
+                wait(em_andamento)
+
+        if erro is not None:
+            raise erro
+
+        duracao_total = time.perf_counter() - inicio_total
+        total_inserido = sum(resultado.values())
+        print(f"\nTotal: {total_inserido} registros inseridos em {duracao_total:.2f}s")
+
+        return resultado
+
+    def _load_table(self, nome_tabela: str, df: pd.DataFrame) -> int:
+        """
+        Carrega uma tabela em uma sessão própria, com um commit por chunk.
+
+        Args:
+            nome_tabela (str): Nome da tabela.
+            df (DataFrame): Dados da tabela.
+
+        Returns:
+            int: Quantidade de linhas inseridas.
+        """
+        orm_class = self.db.orm_mapping.get(nome_tabela)
+        if orm_class is None:
+            raise ValueError(f"{nome_tabela}: Tabela não encontrada no mapeamento.")
+
+        inicio = time.perf_counter()
+        quantidade = 0
+
+        with self.db.SessionLocal() as session:
+            try:
+                for chunk_start in range(0, len(df), self.chunk_size):
+                    chunk = df.iloc[chunk_start:chunk_start + self.chunk_size]
+
+                    if self.metodo == 'copy':
+                        self.db._copy_dataframe(session, orm_class.__table__, chunk, self.chunk_size)
+                    else:
+                        session.bulk_insert_mappings(orm_class, chunk.to_dict('records'))
+                    self.db._garantir_codigos_unicos(session, orm_class.__table__, chunk)
+
+                    session.commit()
+                    quantidade += len(chunk)
+
+                self.db._registrar_watermark(session, nome_tabela, quantidade)
+                session.commit()
+
+            except Exception:
+                session.rollback()
+                raise
+
+        duracao = time.perf_counter() - inicio
+        self.metricas[nome_tabela] = {
+            'linhas': quantidade,
+            'segundos': duracao,
+            'linhas_por_segundo': quantidade / duracao if duracao > 0 else 0.0,
+        }
+        print(f"{nome_tabela}: {quantidade} registros em {duracao:.2f}s "
+              f"({self.metricas[nome_tabela]['linhas_por_segundo']:,.0f} reg/s)")
+
+        return quantidade
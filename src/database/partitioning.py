@@ -0,0 +1,86 @@
+import pandas as pd
+
+from typing import Optional, List, Tuple
+
+from sqlalchemy import Table
+
+
+def get_partition_column(tabela: Table) -> Optional[str]:
+    """Retorna a coluna de particionamento mensal da tabela (definida em `info`), ou None."""
+    return tabela.info.get('coluna_particao')
+
+
+def get_code_column(tabela: Table) -> Optional[str]:
+    """Retorna a coluna de código de negócio de uma tabela particionada (definida em `info`), ou None."""
+    return tabela.info.get('coluna_codigo')
+
+
+# Lock de transação por tabela: serializa as cargas de uma tabela particionada até o commit.
+CODE_LOCK_SQL = "SELECT pg_advisory_xact_lock(hashtext(:tabela))"
+
+
+def duplicate_codes_sql(tabela: Table, preparer, limite: int = 5) -> str:
+    """
+    Consulta os códigos de `:codigos` que aparecem mais de uma vez na tabela (até `limite`).
+
+    Nas tabelas particionadas a constraint única é (código, data da partição), então o
+    Postgres não impede o mesmo código com outra data; esta consulta faz essa checagem.
+    """
+    coluna = preparer.quote(get_code_column(tabela))
+    return (
+        f"SELECT {coluna} FROM {preparer.format_table(tabela)} "
+        f"WHERE {coluna} = ANY(:codigos) "
+        f"GROUP BY {coluna} HAVING count(*) > 1 "
+        f"LIMIT {limite}"
+    )
+
+
+def partition_name(nome_tabela: str, mes: pd.Period) -> str:
+    """
+    Nome da partição mensal de uma tabela.
+
+    Example:
+        >>> partition_name('raw_producao', pd.Period('2024-03', freq='M'))
+        'raw_producao_p2024_03'
+    """
+    return f"{nome_tabela}_p{mes.year:04d}_{mes.month:02d}"
+
+
+def month_range(inicio, fim) -> List[pd.Period]:
+    """Lista os meses (inclusive) entre duas datas."""
+    return list(pd.period_range(pd.Period(inicio, freq='M'), pd.Period(fim, freq='M'), freq='M'))
+
+
+def months_in(serie: pd.Series) -> List[pd.Period]:
+    """Meses distintos presentes em uma coluna de datas, em ordem."""
+    datas = pd.to_datetime(serie.dropna())
+    if datas.empty:
+        return []
+    return sorted(datas.dt.to_period('M').unique())
+
+
+def partition_bounds(mes: pd.Period) -> Tuple[str, str]:
+    """Limites [início, fim) da partição no formato aceito pelo `FOR VALUES FROM ... TO ...`."""
+    return mes.start_time.strftime('%Y-%m-%d'), (mes + 1).start_time.strftime('%Y-%m-%d')
+
+
+def create_partition_sql(nome_tabela: str, mes: pd.Period, preparer, unlogged: bool = False) -> str:
+    """
+    Monta o DDL idempotente de uma partição mensal.
+
+    Args:
+        nome_tabela (str): Tabela particionada (pai).
+        mes (Period): Mês da partição.
+        preparer: `identifier_preparer` do dialeto, usado para citar os nomes.
+        unlogged (bool): Cria a partição como UNLOGGED (cargas em tabelas sombra).
+
+    Returns:
+        str: Comando `CREATE TABLE IF NOT EXISTS ... PARTITION OF ...`.
+    """
+    inicio, fim = partition_bounds(mes)
+    return (
+        f"CREATE {'UNLOGGED ' if unlogged else ''}TABLE IF NOT EXISTS "
+        f"{preparer.quote(partition_name(nome_tabela, mes))} "
+        f"PARTITION OF {preparer.quote(nome_tabela)} "
+        f"FOR VALUES FROM ('{inicio}') TO ('{fim}')"
+    )
@@ -0,0 +1,335 @@
+import time
+import pandas as pd
+from datetime import datetime
+from typing import Optional, Dict, List
+
+from sqlalchemy import text, insert, Column, Index, MetaData, Table, UniqueConstraint
+
+from src.database.db_connection import GasDataBase
+from src.database.db_model import Base
+from src.database.parallel_loader import build_dependency_graph, fk_levels
+from src.database.partitioning import get_partition_column, months_in, create_partition_sql
+
+
+class ShadowTableLoader():
+    """
+    Full refresh sem janela vazia: carrega cópias sombra das tabelas `raw_*` e troca por renomeação.
+
+    1. Cria `raw_x__shadow` UNLOGGED (sem índices nem constraints, só defaults).
+    2. Carrega os dados na sombra, com commit por chunk.
+    3. Torna a sombra LOGGED e cria PK, constraints únicas, índices e FKs de uma vez.
+    4. Em uma transação curta, renomeia a tabela viva para `__old`, a sombra para o
+       nome final, transfere a sequência do `id`, remove as antigas e recria as views
+       que dependiam delas (ex.: modelos de staging do dbt).
+
+    Leitores enxergam os dados antigos até o commit da troca e os novos logo depois.
+    As views recriadas perdem GRANTs específicos que tivessem.
+    """
+    SUFIXO = '__shadow'
+
+    def __init__(
+            self,
+            db_connection: Optional[GasDataBase] = None,
+            metodo: str = 'copy',
+            chunk_size: int = 100_000,
+            lock_timeout: str = '10s',
+            maintenance_work_mem: str = '512MB',
+        ):
+        """
+        Args:
+            db_connection (Optional[GasDataBase]): Conexão com o Banco de Dados. Se None, cria uma nova.
+            metodo (str): 'copy' (COPY FROM STDIN) ou 'orm' (INSERT em lote).
+            chunk_size (int): Quantidade de linhas por chunk (e por commit) na sombra.
+            lock_timeout (str): Tempo máximo de espera pelos locks da troca; se esgotar,
+                a troca é desfeita e as tabelas vivas continuam intactas.
+            maintenance_work_mem (str): Memória usada pelo Postgres na criação dos índices.
+        """
+        if metodo not in ('orm', 'copy'):
+            raise ValueError(f"Método de inserção inválido: {metodo}. Use 'orm' ou 'copy'.")
+
+        self.db = db_connection if db_connection else GasDataBase()
+        self.metodo = metodo
+        self.chunk_size = chunk_size
+        self.lock_timeout = lock_timeout
+        self.maintenance_work_mem = maintenance_work_mem
+        self.preparer = self.db.engine.dialect.identifier_preparer
+
+    def load(self, data: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+        """
+        Substitui o conteúdo das tabelas pelos DataFrames informados.
+
+        Args:
+            data (Dict[str, DataFrame]): {nome_tabela: DataFrame validado}.
+
+        Returns:
+            Dict[str, int]: {nome_tabela: quantidade_carregada}.
+
+        Raises:
+            ValueError: Se uma tabela fora da carga referenciar uma das tabelas substituídas
+                (a FK dela seria removida junto com a tabela antiga).
+            Exception: Erro na carga ou na troca; as sombras são removidas e as tabelas
+                vivas continuam como estavam.
+
+        Example:
+            >>> ShadowTableLoader(db).load({'raw_pocos': df_pocos, 'raw_equipamentos': df_equip,
+            ...                             'raw_producao': df_prod, 'raw_incidentes': df_incid})
+            {'raw_pocos': 100, 'raw_equipamentos': 500, 'raw_producao': 2000000, 'raw_incidentes': 250}
+        """
+        dados = {
+            tabela: df for tabela, df in data.items()
+            if df is not None and not df.empty and tabela in self.db.orm_mapping
+        }
+        for tabela in data.keys() - dados.keys():
+            print(f"{tabela}: DataFrame vazio ou fora do mapeamento, pulando...")
+
+        self._validar_dependentes(dados.keys())
+        ordem = [tabela for nivel in fk_levels(dados.keys()) for tabela in nivel]
+
+        inicio = time.perf_counter()
+        resultado = {}
+        sombras = {}
+
+        try:
+            for tabela in ordem:
+                sombras[tabela] = self._criar_sombra(tabela, dados[tabela])
+
+            for tabela in ordem:
+                print(f"Carregando {sombras[tabela].name}...")
+                resultado[tabela] = self._carregar(sombras[tabela], dados[tabela])
+
+            for tabela in ordem:
+                self._finalizar_sombra(tabela, sombras)
+
+            self._trocar(ordem, resultado)
+
+        except Exception as e:
+            print(f"Erro no full refresh, removendo tabelas sombra: {str(e)}")
+            self._remover_sombras(ordem)
+            raise
+
+        with self.db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            for tabela in ordem:
+                conn.execute(text(f"ANALYZE {self.preparer.quote(tabela)}"))
+
+        print(f"\nFull refresh: {sum(resultado.values())} registros em {time.perf_counter() - inicio:.2f}s")
+        return resultado
+
+    def _validar_dependentes(self, tabelas) -> None:
+        """Garante que nenhuma tabela mapeada fora da carga tenha FK para uma tabela substituída."""
+        tabelas = set(tabelas)
+        grafo = build_dependency_graph(self.db.orm_mapping.keys())
+
+        for tabela, referencias in grafo.items():
+            if tabela not in tabelas and referencias & tabelas:
+                raise ValueError(
+                    f"{tabela} referencia {sorted(referencias & tabelas)} e também precisa entrar no full refresh."
+                )
+
+    def _criar_sombra(self, nome_tabela: str, df: pd.DataFrame) -> Table:
+        """Cria a tabela sombra (UNLOGGED, sem índices) e retorna um `Table` para a carga."""
+        viva = Base.metadata.tables[nome_tabela]
+        nome_sombra = nome_tabela + self.SUFIXO
+        sombra_sql = self.preparer.quote(nome_sombra)
+        coluna = get_partition_column(viva)
+
+        with self.db.engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {sombra_sql} CASCADE"))
+
+            # INCLUDING DEFAULTS mantém o nextval da sequência do `id` da tabela viva.
+            if coluna is None:
+                conn.execute(text(
+                    f"CREATE UNLOGGED TABLE {sombra_sql} (LIKE {self.preparer.quote(nome_tabela)} INCLUDING DEFAULTS)"
+                ))
+            else:
+                conn.execute(text(
+                    f"CREATE TABLE {sombra_sql} (LIKE {self.preparer.quote(nome_tabela)} INCLUDING DEFAULTS) "
+                    f"PARTITION BY RANGE ({self.preparer.quote(coluna)})"
+                ))
+                for mes in months_in(df[coluna]):
+                    conn.execute(text(create_partition_sql(nome_sombra, mes, self.preparer, unlogged=True)))
+
+        return Table(
+            nome_sombra,
+            MetaData(),
+            *[Column(c.name, c.type) for c in viva.columns],
+            info=dict(viva.info),
+        )
+
+    def _carregar(self, sombra: Table, df: pd.DataFrame) -> int:
+        """Carrega o DataFrame na sombra, com um commit por chunk."""
+        quantidade = 0
+
+        with self.db.SessionLocal() as session:
+            try:
+                for inicio in range(0, len(df), self.chunk_size):
+                    chunk = df.iloc[inicio:inicio + self.chunk_size]
+
+                    if self.metodo == 'copy':
+                        self.db._copy_dataframe(session, sombra, chunk, self.chunk_size)
+                    else:
+                        if 'data_insercao' in sombra.columns and 'data_insercao' not in chunk.columns:
+                            chunk = chunk.assign(data_insercao=datetime.now())
+                        session.execute(insert(sombra), chunk.to_dict('records'))
+
+                    session.commit()
+                    quantidade += len(chunk)
+
+            except Exception:
+                session.rollback()
+                raise
+
+        return quantidade
+
+    def _finalizar_sombra(self, nome_tabela: str, sombras: Dict[str, Table]) -> None:
+        """Torna a sombra LOGGED e cria PK, constraints únicas, índices e FKs depois da carga."""
+        viva = Base.metadata.tables[nome_tabela]
+        sombra = sombras[nome_tabela]
+        sombra_sql = self.preparer.quote(sombra.name)
+
+        def colunas(nomes) -> str:
+            return ", ".join(self.preparer.quote(nome) for nome in nomes)
+
+        inicio = time.perf_counter()
+        with self.db.engine.begin() as conn:
+            conn.execute(text(f"SET LOCAL maintenance_work_mem = '{self.maintenance_work_mem}'"))
+
+            folhas = conn.execute(text(
+                "SELECT c.relname FROM pg_partition_tree(CAST(:tabela AS regclass)) pt "
+                "JOIN pg_class c ON c.oid = pt.relid WHERE pt.isleaf"
+            ), {'tabela': sombra.name}).scalars().all()
+            for folha in folhas:
+                conn.execute(text(f"ALTER TABLE {self.preparer.quote(folha)} SET LOGGED"))
+
+            conn.execute(text(
+                f"ALTER TABLE {sombra_sql} ADD PRIMARY KEY ({colunas(viva.primary_key.columns.keys())})"
+            ))
+            for constraint in viva.constraints:
+                if isinstance(constraint, UniqueConstraint):
+                    conn.execute(text(
+                        f"ALTER TABLE {sombra_sql} ADD UNIQUE ({colunas(constraint.columns.keys())})"
+                    ))
+
+            for indice in viva.indexes:
+                Index(
+                    indice.name + self.SUFIXO,
+                    *[sombra.c[coluna.name] for coluna in indice.columns],
+                    unique=indice.unique,
+                    **indice.dialect_kwargs,
+                ).create(bind=conn)
+
+            for fk in viva.foreign_keys:
+                referenciada = fk.column.table.name
+                alvo = sombras[referenciada].name if referenciada in sombras else referenciada
+                conn.execute(text(
+                    f"ALTER TABLE {sombra_sql} ADD FOREIGN KEY ({self.preparer.quote(fk.parent.name)}) "
+                    f"REFERENCES {self.preparer.quote(alvo)} ({self.preparer.quote(fk.column.name)})"
+                ))
+
+        print(f"{sombra.name}: índices e constraints criados em {time.perf_counter() - inicio:.2f}s")
+
+    def _views_dependentes(self, conn, tabelas: List[str]) -> List[Dict[str, str]]:
+        """Views (e materialized views) que dependem das tabelas, direta ou indiretamente, em ordem de criação."""
+        return conn.execute(text("""
+            WITH RECURSIVE dependentes AS (
+                SELECT DISTINCT r.ev_class AS oid, 1 AS nivel
+                  FROM pg_depend d
+                  JOIN pg_rewrite r ON r.oid = d.objid
+                 WHERE d.refobjid = ANY(CAST(:tabelas AS regclass[]))
+                   AND r.ev_class <> d.refobjid
+                UNION
+                SELECT r.ev_class, dependentes.nivel + 1
+                  FROM dependentes
+                  JOIN pg_depend d ON d.refobjid = dependentes.oid
+                  JOIN pg_rewrite r ON r.oid = d.objid
+                 WHERE r.ev_class <> dependentes.oid
+            )
+            SELECT c.oid::regclass::text AS nome, c.relkind AS tipo, pg_get_viewdef(c.oid) AS definicao
+              FROM dependentes
+              JOIN pg_class c ON c.oid = dependentes.oid
+             WHERE c.relkind IN ('v', 'm')
+             GROUP BY c.oid, c.relkind
+             ORDER BY max(dependentes.nivel)
+        """), {'tabelas': tabelas}).mappings().all()
+
+    def _trocar(self, ordem: List[str], resultado: Dict[str, int]) -> None:
+        """Troca as tabelas vivas pelas sombras em uma única transação curta."""
+        inicio = time.perf_counter()
+
+        with self.db.SessionLocal() as session:
+            try:
+                conn = session.connection()
+                conn.execute(text(f"SET LOCAL lock_timeout = '{self.lock_timeout}'"))
+
+                # As definições são lidas antes das renomeações, ainda com os nomes finais das tabelas.
+                views = self._views_dependentes(conn, ordem)
+                sequencias = {
+                    tabela: conn.execute(text("SELECT pg_get_serial_sequence(:tabela, 'id')"), {'tabela': tabela}).scalar()
+                    for tabela in ordem
+                }
+
+                for tabela in ordem:
+                    conn.execute(text(
+                        f"ALTER TABLE {self.preparer.quote(tabela)} RENAME TO {self.preparer.quote(tabela + '__old')}"
+                    ))
+                for tabela in ordem:
+                    conn.execute(text(
+                        f"ALTER TABLE {self.preparer.quote(tabela + self.SUFIXO)} RENAME TO {self.preparer.quote(tabela)}"
+                    ))
+                    if sequencias[tabela]:
+                        conn.execute(text(
+                            f"ALTER SEQUENCE {sequencias[tabela]} OWNED BY {self.preparer.quote(tabela)}.id"
+                        ))
+
+                for tabela in reversed(ordem):
+                    conn.execute(text(f"DROP TABLE {self.preparer.quote(tabela + '__old')} CASCADE"))
+
+                for view in views:
+                    tipo = 'MATERIALIZED VIEW' if view['tipo'] == 'm' else 'VIEW'
+                    conn.execute(text(f"CREATE {tipo} {view['nome']} AS {view['definicao']}"))
+
+                self._renomear_restantes(conn, ordem)
+
+                for tabela in ordem:
+                    self.db._registrar_watermark(session, tabela, resultado[tabela])
+
+                session.commit()
+
+            except Exception:
+                session.rollback()
+                raise
+
+        print(f"Troca de {len(ordem)} tabela(s) concluída em {time.perf_counter() - inicio:.3f}s "
+              f"({len(views)} view(s) recriada(s))")
+
+    def _renomear_restantes(self, conn, ordem: List[str]) -> None:
+        """Remove o sufixo das partições, índices e FKs herdados das sombras."""
+        relacoes = conn.execute(text(
+            "SELECT c.relname, c.relkind FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = current_schema() AND strpos(c.relname, :sufixo) > 0"
+        ), {'sufixo': self.SUFIXO}).all()
+
+        for nome, tipo in relacoes:
+            if not any(tabela in nome for tabela in ordem):
+                continue
+            comando = 'INDEX' if tipo in ('i', 'I') else 'TABLE'
+            conn.execute(text(
+                f"ALTER {comando} {self.preparer.quote(nome)} "
+                f"RENAME TO {self.preparer.quote(nome.replace(self.SUFIXO, ''))}"
+            ))
+
+        fks = conn.execute(text(
+            "SELECT conrelid::regclass::text, conname FROM pg_constraint "
+            "WHERE contype = 'f' AND strpos(conname, :sufixo) > 0 AND conrelid = ANY(CAST(:tabelas AS regclass[]))"
+        ), {'sufixo': self.SUFIXO, 'tabelas': ordem}).all()
+
+        for tabela, nome in fks:
+            conn.execute(text(
+                f"ALTER TABLE {tabela} RENAME CONSTRAINT {self.preparer.quote(nome)} "
+                f"TO {self.preparer.quote(nome.replace(self.SUFIXO, ''))}"
+            ))
+
+    def _remover_sombras(self, ordem: List[str]) -> None:
+        """Remove as tabelas sombra que sobraram de uma carga que falhou."""
+        with self.db.engine.begin() as conn:
+            for tabela in reversed(ordem):
+                conn.execute(text(f"DROP TABLE IF EXISTS {self.preparer.quote(tabela + self.SUFIXO)} CASCADE"))
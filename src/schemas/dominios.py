@@ -0,0 +1,45 @@
+"""
+Domínios (valores aceitos) das colunas categóricas das tabelas raw.
+
+Fonte única usada pelo gerador (`FakeData`), pelos schemas Pandera (`ValidateSchema`)
+e pelos modelos do Banco de Dados (tipos ENUM do Postgres).
+Incluir um valor novo exige também um `ALTER TYPE ... ADD VALUE` no Banco de Dados.
+"""
+
+TIPOS_POCO = (1, 2)  # 1 = Marítimo | 2 = Terrestre
+
+CAMADAS = ('Pre-Sal', 'Pos-Sal')
+
+STATUS_OPERACIONAL = ('Ativo', 'Manutenção', 'Inativo')
+
+OPERADORAS = ('Petrobras', 'Shell', 'TotalEnergies', 'Equinor')
+
+TIPOS_EQUIPAMENTO = (
+    'Bomba Submersível', 'FPSO', 'Válvula DHSV', 'Sistema de Elevação', 'Compressor', 'Separador'
+)
+
+MARCAS = ('Schulemberger', 'Haliburton', 'Baker Hughes', 'Weatherford', 'NOV')
+
+TIPOS_INCIDENTE = (
+    'Falha de Equipamento', 'Parada Programada', 'Vazamento Contido',
+    'Queda de Pressão', 'Obstrução', 'Manutenção Emergencial'
+)
+
+SEVERIDADES = ('Baixa', 'Média', 'Alta')
+
+STATUS_RESOLUCAO = ('Resolvido', 'Em Andamento', 'Pendente')
+
+# Colunas categóricas das tabelas raw e seus domínios (dtype `category` nos DataFrames).
+CATEGORIAS = {
+    'camada': CAMADAS,
+    'status_operacional': STATUS_OPERACIONAL,
+    'operadora': OPERADORAS,
+    'tipo_equipamento': TIPOS_EQUIPAMENTO,
+    'marca': MARCAS,
+    'tipo_incidente': TIPOS_INCIDENTE,
+    'severidade': SEVERIDADES,
+    'status_resolucao': STATUS_RESOLUCAO,
+}
+
+# Colunas de data das tabelas raw (dtype `datetime64[ns]` nos DataFrames).
+COLUNAS_DATA = ('data_perfuracao', 'data_instalacao', 'ultimo_teste', 'data_producao', 'data_incidente')
@@ -1,13 +1,284 @@
+import numpy as np
 import pandas as pd
 import pandera.pandas as pa
 
-from typing import Optional
-from datetime import date
-from pandera.errors import SchemaError
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Optional, Dict, List, Tuple
+from pandera.errors import SchemaError, SchemaErrors
+from pandera.backends.pandas.error_formatters import format_vectorized_error_message
+
+from src.schemas.dominios import (
+    TIPOS_POCO, CAMADAS, STATUS_OPERACIONAL, OPERADORAS, TIPOS_EQUIPAMENTO, MARCAS,
+    TIPOS_INCIDENTE, SEVERIDADES, STATUS_RESOLUCAO
+)
+
+
+def build_schemas() -> Dict[str, pa.DataFrameSchema]:
+    """
+    Monta os schemas Pandera das tabelas raw.
+
+    Os valores aceitos nas colunas categóricas vêm de `src.schemas.dominios`, os mesmos
+    usados pelo gerador e pelos tipos ENUM do Banco de Dados. As datas são `datetime64[ns]`
+    e as colunas categóricas têm dtype `category` com esses domínios.
+
+    Returns:
+        Dict[str, DataFrameSchema]: {nome_tabela: schema}.
+    """
+    return {
+        'raw_pocos': pa.DataFrameSchema(
+            {
+                "codigo_poco": pa.Column(str, nullable=False, unique=True),
+                "nome_poco": pa.Column(str, nullable=False),
+                "tipo_poco": pa.Column(int, pa.Check.isin(list(TIPOS_POCO)), nullable=False),
+                "localizacao": pa.Column(str, nullable=False),
+                "camada": pa.Column(pd.CategoricalDtype(list(CAMADAS)), pa.Check.isin(list(CAMADAS)), nullable=False),
+                "profundidade_metros": pa.Column(int, pa.Check.between(500, 7_000), nullable=False),
+                "status_operacional": pa.Column(pd.CategoricalDtype(list(STATUS_OPERACIONAL)), pa.Check.isin(list(STATUS_OPERACIONAL)), nullable=False),
+                "data_perfuracao": pa.Column('datetime64[ns]', nullable=False),
+                "operadora": pa.Column(pd.CategoricalDtype(list(OPERADORAS)), pa.Check.isin(list(OPERADORAS)), nullable=False)
+            }, strict=True
+        ),
+        'raw_equipamentos': pa.DataFrameSchema(
+            {
+                "cod_equipamento": pa.Column(str, unique=True, nullable=False),
+                "cod_poco": pa.Column(str, nullable=False),
+                "tipo_equipamento": pa.Column(pd.CategoricalDtype(list(TIPOS_EQUIPAMENTO)), pa.Check.isin(list(TIPOS_EQUIPAMENTO)), nullable=False),
+                "marca": pa.Column(pd.CategoricalDtype(list(MARCAS)), pa.Check.isin(list(MARCAS)), nullable=False),
+                "modelo": pa.Column(str, nullable=False),
+                "data_instalacao": pa.Column('datetime64[ns]', nullable=False),
+                "vida_util_anos": pa.Column(int, pa.Check.between(10, 25), nullable=False),
+                "ultimo_teste": pa.Column('datetime64[ns]', nullable=False),
+                "eficiencia_operacional": pa.Column(float, pa.Check.between(0.6, 1), nullable=False)
+            }, strict=True
+        ),
+        'raw_producao': pa.DataFrameSchema(
+            {
+                "cod_producao": pa.Column(str, unique=True, nullable=False),
+                "cod_poco": pa.Column(str, nullable=False),
+                "data_producao": pa.Column('datetime64[ns]', nullable=False),
+                "petroleo_barris_dia": pa.Column(int, pa.Check.between(100, 200_000), nullable=False),
+                "agua_produzida_m3": pa.Column(float, pa.Check.ge(0), nullable=False),
+                "tempo_horas_operacao": pa.Column(float, pa.Check.between(0, 24), nullable=False),
+                "pressao_bar": pa.Column(int, pa.Check.between(150, 450), nullable=False),
+                "temperatura_celsius": pa.Column(float, pa.Check.between(60, 120), nullable=False)
+            }, strict=True
+        ),
+        'raw_incidentes': pa.DataFrameSchema(
+            {
+                "cod_incidente": pa.Column(str, unique=True, nullable=False),
+                "cod_poco": pa.Column(str, nullable=False),
+                "cod_equipamento": pa.Column(str, nullable=False),
+                "data_incidente": pa.Column('datetime64[ns]', nullable=False),
+                "tipo_incidente": pa.Column(pd.CategoricalDtype(list(TIPOS_INCIDENTE)), pa.Check.isin(list(TIPOS_INCIDENTE)), nullable=False),
+                "severidade": pa.Column(pd.CategoricalDtype(list(SEVERIDADES)), pa.Check.isin(list(SEVERIDADES)), nullable=False),
+                "tempo_parada_horas": pa.Column(float, pa.Check.between(1, 168), nullable=False),
+                "custo_estimado_reais": pa.Column(int, pa.Check.between(50_000, 5_000_000), nullable=False),
+                "status_resolucao": pa.Column(pd.CategoricalDtype(list(STATUS_RESOLUCAO)), pa.Check.isin(list(STATUS_RESOLUCAO)), nullable=False)
+            }, strict=True
+        ),
+    }
+
+
+# Chaves estrangeiras entre os DataFrames de uma mesma carga:
+# (tabela, colunas, tabela referenciada, colunas referenciadas).
+RELACIONAMENTOS = [
+    ('raw_equipamentos', ('cod_poco',), 'raw_pocos', ('codigo_poco',)),
+    ('raw_producao', ('cod_poco',), 'raw_pocos', ('codigo_poco',)),
+    ('raw_incidentes', ('cod_poco',), 'raw_pocos', ('codigo_poco',)),
+    ('raw_incidentes', ('cod_equipamento',), 'raw_equipamentos', ('cod_equipamento',)),
+    ('raw_incidentes', ('cod_equipamento', 'cod_poco'), 'raw_equipamentos', ('cod_equipamento', 'cod_poco')),
+]
+
+# Ordem das datas: a data da tabela não pode ser anterior à menor data referenciada do mesmo poço.
+# (tabela, coluna de data, chave, tabela referenciada, chave referenciada, data referenciada).
+ORDEM_TEMPORAL = [
+    ('raw_equipamentos', 'data_instalacao', 'cod_poco', 'raw_pocos', 'codigo_poco', 'data_perfuracao'),
+    ('raw_producao', 'data_producao', 'cod_poco', 'raw_pocos', 'codigo_poco', 'data_perfuracao'),
+    ('raw_incidentes', 'data_incidente', 'cod_poco', 'raw_producao', 'cod_poco', 'data_producao'),
+]
+
+# Schemas sem as checagens `unique`, cacheados por processo.
+_SCHEMAS_CHUNK: Dict[str, pa.DataFrameSchema] = {}
+
+
+def _colunas_unicas(schema: pa.DataFrameSchema) -> List[str]:
+    """Colunas do schema com `unique=True`."""
+    return [nome for nome, coluna in schema.columns.items() if coluna.unique]
+
+
+def _schema_sem_unicidade(nome_tabela: str) -> pa.DataFrameSchema:
+    """Schema da tabela sem as checagens `unique` (para chunks e amostras), cacheado por processo."""
+    schema = _SCHEMAS_CHUNK.get(nome_tabela)
+    if schema is None:
+        original = ValidateSchema.SCHEMAS[nome_tabela]
+        schema = original.update_columns({nome: {'unique': False} for nome in _colunas_unicas(original)})
+        _SCHEMAS_CHUNK[nome_tabela] = schema
+    return schema
+
+
+def _verificar_invariantes(schema: pa.DataFrameSchema, df: pd.DataFrame) -> List[Dict]:
+    """
+    Checagens baratas, vetorizadas com máscaras NumPy, derivadas do próprio schema.
+
+    Cobre colunas esperadas, família do dtype, nulos, unicidade e as checagens
+    `in_range`, `greater_than_or_equal_to` e `isin`. As demais regras (ex.: tipo
+    domínio exato das categorias) ficam para a validação Pandera da amostra.
+
+    Returns:
+        List[Dict]: Violações encontradas: {'coluna', 'invariante', 'linhas', 'exemplos'}.
+    """
+    violacoes = []
+
+    def registrar(coluna: str, invariante: str, mascara: np.ndarray, serie: pd.Series) -> None:
+        quantidade = int(mascara.sum())
+        if quantidade:
+            violacoes.append({
+                'coluna': coluna,
+                'invariante': invariante,
+                'linhas': quantidade,
+                'exemplos': serie[mascara].head(5).tolist(),
+            })
+
+    faltando = [nome for nome in schema.columns if nome not in df.columns]
+    sobrando = [nome for nome in df.columns if nome not in schema.columns] if schema.strict else []
+    for nome in faltando:
+        violacoes.append({'coluna': nome, 'invariante': 'coluna ausente', 'linhas': len(df), 'exemplos': []})
+    for nome in sobrando:
+        violacoes.append({'coluna': nome, 'invariante': 'coluna fora do schema', 'linhas': len(df), 'exemplos': []})
+
+    familias = {
+        'int64': pd.api.types.is_integer_dtype,
+        'float64': pd.api.types.is_float_dtype,
+        'str': pd.api.types.is_string_dtype,
+        'datetime64[ns]': pd.api.types.is_datetime64_any_dtype,
+        'category': lambda dtype: isinstance(dtype, pd.CategoricalDtype),
+    }
+
+    for nome, coluna in schema.columns.items():
+        if nome not in df.columns:
+            continue
+        serie = df[nome]
+
+        nulos = serie.isna().to_numpy()
+        if not coluna.nullable:
+            registrar(nome, 'nulo', nulos, serie)
+        if coluna.unique:
+            registrar(nome, 'duplicado', serie.duplicated(keep=False).to_numpy(), serie)
+
+        familia = familias.get(str(coluna.dtype))
+        if familia is not None and not familia(serie.dtype):
+            violacoes.append({
+                'coluna': nome, 'invariante': f"dtype {serie.dtype} (esperado {coluna.dtype})",
+                'linhas': len(df), 'exemplos': [],
+            })
+            continue
+
+        for check in coluna.checks:
+            estatisticas = check.statistics
+            if check.name == 'isin':
+                mascara = ~serie.isin(estatisticas['allowed_values']).to_numpy()
+            elif check.name in ('in_range', 'greater_than_or_equal_to'):
+                valores = serie.to_numpy()
+                minimo, maximo = estatisticas['min_value'], estatisticas.get('max_value')
+                mascara = valores < minimo if estatisticas.get('include_min', True) else valores <= minimo
+                if maximo is not None:
+                    mascara = mascara | (valores > maximo if estatisticas['include_max'] else valores >= maximo)
+            else:
+                continue
+            registrar(nome, check.name, mascara & ~nulos, serie)
+
+    return violacoes
+
+
+def _validar_chunk(tarefa: Tuple) -> List[Dict]:
+    """
+    Valida um chunk em um processo do pool, sem as checagens de unicidade.
+
+    A unicidade só faz sentido sobre o DataFrame inteiro e é verificada uma única
+    vez no processo principal. Um `SchemaError` não sobrevive ao pickle entre
+    processos (schema e check viram texto), então cada erro volta como um
+    dicionário e é reconstruído por `_consolidar_erros`.
+
+    Args:
+        tarefa (Tuple): (nome_tabela, chunk).
+
+    Returns:
+        List[Dict]: Erros encontrados no chunk (vazia se válido).
+    """
+    nome_tabela, chunk = tarefa
+
+    try:
+        _schema_sem_unicidade(nome_tabela).validate(chunk, lazy=True)
+        return []
+    except SchemaErrors as e:
+        return [
+            {
+                'coluna': erro.schema.name if isinstance(erro.schema, pa.Column) else None,
+                'check': erro.check if erro.check is None or isinstance(erro.check, str) else None,
+                'check_index': erro.check_index,
+                'failure_cases': erro.failure_cases,
+                'reason_code': erro.reason_code,
+                'column_name': erro.column_name,
+                'mensagem': str(erro),
+            }
+            for erro in e.schema_errors
+        ]
+
+
+def _consolidar_erros(schema: pa.DataFrameSchema, erros: List[Dict]) -> List[SchemaError]:
+    """
+    Junta os erros devolvidos pelos chunks em `SchemaError`s do DataFrame inteiro.
+
+    Uma mesma checagem que falhou em vários chunks vira um único erro com todos os
+    failure cases (como na validação sem chunks). Erros sem linhas associadas
+    (ex.: tipo da coluna) se repetem em todos os chunks e entram uma vez só.
+    """
+    agrupados = {}
+    for erro in erros:
+        chave = (erro['coluna'], erro['check'], erro['check_index'], erro['reason_code'])
+        if chave not in agrupados:
+            agrupados[chave] = dict(erro, failure_cases=[erro['failure_cases']])
+        elif isinstance(erro['failure_cases'], pd.DataFrame):
+            agrupados[chave]['failure_cases'].append(erro['failure_cases'])
+
+    consolidados = []
+    for erro in agrupados.values():
+        componente = schema.columns[erro['coluna']] if erro['coluna'] is not None else schema
+
+        check = erro['check']
+        if check is None and erro['check_index'] is not None:
+            check = componente.checks[erro['check_index']]
+
+        failure_cases = erro['failure_cases']
+        mensagem = erro['mensagem']
+        if isinstance(failure_cases[0], pd.DataFrame):
+            failure_cases = pd.concat(failure_cases, ignore_index=True)
+            if len(erro['failure_cases']) > 1 and erro['check_index'] is not None:
+                mensagem = format_vectorized_error_message(componente, check, erro['check_index'], failure_cases)
+        else:
+            failure_cases = failure_cases[0]
+
+        consolidados.append(SchemaError(
+            schema=componente,
+            data=None,
+            message=mensagem,
+            failure_cases=failure_cases,
+            check=check,
+            check_index=erro['check_index'],
+            reason_code=erro['reason_code'],
+            column_name=erro['column_name'],
+        ))
+
+    return consolidados
 
 
 class ValidateSchema():
     """Classe de validção de Schema usando Pandera."""
+
+    # Montados uma única vez por processo e reaproveitados em todas as validações.
+    SCHEMAS = build_schemas()
+
     def __init__(self):
         pass
 
@@ -30,19 +301,7 @@ class ValidateSchema():
             else:
                 print(f"{len(df_pocos)} registros para serem validados.")
 
-            schema = pa.DataFrameSchema(
-                {
-                    "codigo_poco": pa.Column(str, nullable=False, unique=True),
-                    "nome_poco": pa.Column(str, nullable=False),
-                    "tipo_poco": pa.Column(int, pa.Check.isin([1, 2]), nullable=False),
-                    "localizacao": pa.Column(str, nullable=False),
-                    "camada": pa.Column(str, pa.Check.isin(['Pre-Sal', 'Pos-Sal']), nullable=False),
-                    "profundidade_metros": pa.Column(int, pa.Check.between(500, 7_000), nullable=False),
-                    "status_operacional": pa.Column(str, pa.Check.isin(['Ativo', 'Manutenção', 'Inativo']), nullable=False),
-                    "data_perfuracao": pa.Column(date, nullable=False),
-                    "operadora": pa.Column(str, pa.Check.isin(['Petrobras', 'Shell', 'TotalEnergies', 'Equinor']), nullable=False) 
-                }, strict=True
-            )
+            schema = self.SCHEMAS['raw_pocos']
             
             try:
                 validated_data = schema.validate(df_pocos, lazy=True)
@@ -56,6 +315,7 @@ class ValidateSchema():
         
         except Exception as e:
             print(f"Erro crítico em validate_pocos_table: {str(e)}")
+            raise
 
     
     def validate_equipamentos_table(self, df_equipamentos: Optional[pd.DataFrame]) -> pd.DataFrame:
@@ -77,19 +337,7 @@ class ValidateSchema():
             else:
                 print(f"{len(df_equipamentos)} registros para serem validados.")
 
-            schema = pa.DataFrameSchema(
-                {
-                    "cod_equipamento": pa.Column(str, unique=True, nullable=False),
-                    "cod_poco": pa.Column(str, nullable=False),
-                    "tipo_equipamento": pa.Column(str, pa.Check.isin(["Bomba Submersível", "FPSO", "Válvula DHSV", "Sistema de Elevação", "Compressor", "Separador"]), nullable=False),
-                    "marca": pa.Column(str, pa.Check.isin(["Schulemberger", "Haliburton", "Baker Hughes", "Weatherford", "NOV"]), nullable=False),
-                    "modelo": pa.Column(str, nullable=False),
-                    "data_instalacao": pa.Column(date, nullable=False),
-                    "vida_util_anos": pa.Column(int, pa.Check.between(10, 25), nullable=False),
-                    "ultimo_teste": pa.Column(date, nullable=False),
-                    "eficiencia_operacional": pa.Column(float, pa.Check.between(0.6, 1), nullable=False)
-                }, strict=True
-            )
+            schema = self.SCHEMAS['raw_equipamentos']
 
             try:
                 validated_data = schema.validate(df_equipamentos, lazy=True)
@@ -124,18 +372,7 @@ class ValidateSchema():
             else:
                 print(f"{len(df_producao)} registros para serem validados.")
             
-            schema = pa.DataFrameSchema(
-                {
-                    "cod_producao": pa.Column(str, unique=True, nullable=False),
-                    "cod_poco": pa.Column(str, nullable=False),
-                    "data_producao": pa.Column(date, nullable=False),
-                    "petroleo_barris_dia": pa.Column(int, pa.Check.between(100, 200_000), nullable=False),
-                    "agua_produzida_m3": pa.Column(float, pa.Check.ge(0), nullable=False),
-                    "tempo_horas_operacao": pa.Column(float, pa.Check.between(0, 24), nullable=False),
-                    "pressao_bar": pa.Column(int, pa.Check.between(150, 450), nullable=False),
-                    "temperatura_celsius": pa.Column(float, pa.Check.between(60, 120), nullable=False)
-                },strict=True
-            )
+            schema = self.SCHEMAS['raw_producao']
 
             try:
                 validated_data = schema.validate(df_producao, lazy=True)
@@ -145,9 +382,11 @@ class ValidateSchema():
             
             except SchemaError as e:
                 print(f"Erro de validação:\n{str(e)}")
+                raise
 
         except Exception as e:
             print(f"Erro crítico em validate_producao_table: {str(e)}")
+            raise
 
 
     def validate_incidentes_table(self, df_incidentes: Optional[pd.DataFrame]) -> pd.DataFrame:
@@ -170,19 +409,7 @@ class ValidateSchema():
             else:
                 print(f"{len(df_incidentes)} registros para serem validados.")
 
-            schema = pa.DataFrameSchema(
-                {
-                    "cod_incidente": pa.Column(str, unique=True, nullable=False),
-                    "cod_poco": pa.Column(str, nullable=False),
-                    "cod_equipamento": pa.Column(str, nullable=False),
-                    "data_incidente": pa.Column(date, nullable=False),
-                    "tipo_incidente": pa.Column(str, pa.Check.isin(['Falha de Equipamento', 'Parada Programada', 'Vazamento Contido', 'Queda de Pressão', 'Obstrução', 'Manutenção Emergencial']), nullable=False),
-                    "severidade": pa.Column(str, pa.Check.isin(['Baixa', 'Média', 'Alta']), nullable=False),
-                    "tempo_parada_horas": pa.Column(float, pa.Check.between(1, 168), nullable=False),
-                    "custo_estimado_reais": pa.Column(int, pa.Check.between(50_000, 5_000_000), nullable=False),
-                    "status_resolucao": pa.Column(str, pa.Check.isin(['Resolvido', 'Em Andamento', 'Pendente']), nullable=False)
-                }, strict=True
-            )
+            schema = self.SCHEMAS['raw_incidentes']
 
             try:
                 validated_data = schema.validate(df_incidentes, lazy=True)
@@ -192,6 +419,348 @@ class ValidateSchema():
             
             except SchemaError as e:
                 print(f"Erro de validação\n {str(e)}")
+                raise
 
         except Exception as e:
-            print(f"Erro crítico em validate_incidentes_table: {str(e)}")
\ No newline at end of file
+            print(f"Erro crítico em validate_incidentes_table: {str(e)}")
+            raise
+
+    def validate_table_parallel(
+            self,
+            nome_tabela: str,
+            df: Optional[pd.DataFrame],
+            n_workers: Optional[int] = None,
+            chunk_size: int = 200_000,
+            executor: Optional[Executor] = None,
+        ) -> pd.DataFrame:
+        """
+        Valida um DataFrame grande em chunks de linhas, em um pool de processos.
+
+        Cada chunk é validado com o schema da tabela sem as checagens `unique`, que
+        são feitas uma única vez sobre as colunas inteiras no processo principal.
+        Os erros de todos os chunks (que mantêm o índice original) são reunidos em
+        um único `SchemaErrors`, com o mesmo formato da validação `lazy=True` atual.
+        Os schemas não convertem tipos, então o DataFrame validado é o próprio `df`.
+
+        Args:
+            nome_tabela (str): Tabela do schema (ex.: 'raw_producao').
+            df (Optional[DataFrame]): DataFrame para validação.
+            n_workers (Optional[int]): Processos do pool. Se None, usa a quantidade de CPUs.
+            chunk_size (int): Linhas por chunk. DataFrames menores são validados no próprio processo.
+            executor (Optional[Executor]): Pool já criado, reaproveitado entre chamadas (ex.: um
+                pool `forkserver` criado antes de iniciar threads). Se None, um pool é criado
+                e encerrado nesta chamada.
+
+        Returns:
+            DataFrame: O DataFrame validado.
+
+        Raises:
+            ValueError: Se o DataFrame estiver vazio ou a tabela não tiver schema.
+            SchemaErrors: Com todos os erros encontrados, se a validação falhar.
+
+        Example:
+            >>> validador.validate_table_parallel('raw_producao', df_producao, n_workers=8)
+        """
+        try:
+            if df is None or df.empty:
+                raise ValueError("Erro: Não será possível validar os dados, nenhum DataFrame foi passado.")
+
+            schema = self.SCHEMAS.get(nome_tabela)
+            if schema is None:
+                raise ValueError(f"Nenhum schema para a tabela {nome_tabela}")
+
+            print(f"{len(df)} registros para serem validados.")
+
+            if len(df) <= chunk_size:
+                validated_data = schema.validate(df, lazy=True)
+                print(f"{len(validated_data)} registros validados com sucesso.")
+                return validated_data
+
+            erros = []
+
+            unicas = [coluna for coluna in _colunas_unicas(schema) if coluna in df.columns]
+            if unicas:
+                schema_unicidade = pa.DataFrameSchema(
+                    {coluna: pa.Column(unique=True, nullable=True) for coluna in unicas}
+                )
+                try:
+                    schema_unicidade.validate(df[unicas], lazy=True)
+                except SchemaErrors as e:
+                    erros.extend(e.schema_errors)
+
+            tarefas = [
+                (nome_tabela, df.iloc[inicio:inicio + chunk_size])
+                for inicio in range(0, len(df), chunk_size)
+            ]
+            pool = nullcontext(executor) if executor is not None else ProcessPoolExecutor(max_workers=n_workers)
+            with pool as pool_ativo:
+                erros_chunks = [erro for erros_chunk in pool_ativo.map(_validar_chunk, tarefas) for erro in erros_chunk]
+            erros.extend(_consolidar_erros(schema, erros_chunks))
+
+            if erros:
+                raise SchemaErrors(schema=schema, schema_errors=erros, data=df)
+
+            print(f"{len(df)} registros validados com sucesso ({len(tarefas)} chunks).")
+            return df
+
+        except SchemaErrors as e:
+            print(f"Erro de validação:\n{str(e)}")
+            raise
+
+        except Exception as e:
+            print(f"Erro crítico em validate_table_parallel: {str(e)}")
+            raise
+
+    def validate_sampled(
+            self,
+            nome_tabela: str,
+            df: Optional[pd.DataFrame],
+            tamanho_amostra: int = 10_000,
+            estratificar_por: Optional[str] = None,
+            taxa_maxima_falhas: float = 0.0,
+            seed: Optional[int] = None,
+        ) -> Tuple[pd.DataFrame, Dict[str, any]]:
+        """
+        Validação em camadas para cargas muito grandes.
+
+        1. Invariantes vetorizadas (colunas, dtype, nulos, unicidade, faixas e domínios)
+           sobre todas as linhas, com máscaras NumPy: qualquer violação reprova a carga.
+        2. Validação Pandera completa sobre uma amostra aleatória (ou estratificada por
+           `estratificar_por`) de `tamanho_amostra` linhas, que cobre as regras que as
+           invariantes não cobrem.
+
+        Args:
+            nome_tabela (str): Tabela do schema (ex.: 'raw_producao').
+            df (Optional[DataFrame]): DataFrame para validação.
+            tamanho_amostra (int): Linhas validadas com Pandera.
+            estratificar_por (Optional[str]): Coluna usada na estratificação (ex.: 'cod_poco'):
+                cada grupo contribui com a mesma fração de linhas.
+            taxa_maxima_falhas (float): Fração de linhas reprovadas tolerada na amostra.
+            seed (Optional[int]): Semente da amostragem.
+
+        Returns:
+            Tuple[DataFrame, Dict]: O DataFrame validado e o relatório
+                {'linhas', 'amostra', 'linhas_reprovadas', 'taxa_falhas', 'invariantes'}.
+
+        Raises:
+            ValueError: Se o DataFrame estiver vazio ou alguma invariante for violada.
+            SchemaErrors: Se a taxa de falhas da amostra passar de `taxa_maxima_falhas`.
+
+        Example:
+            >>> df, relatorio = validador.validate_sampled('raw_producao', df_producao, tamanho_amostra=50_000)
+            >>> relatorio['taxa_falhas']
+            0.0
+        """
+        try:
+            if df is None or df.empty:
+                raise ValueError("Erro: Não será possível validar os dados, nenhum DataFrame foi passado.")
+
+            schema = self.SCHEMAS.get(nome_tabela)
+            if schema is None:
+                raise ValueError(f"Nenhum schema para a tabela {nome_tabela}")
+
+            print(f"{len(df)} registros para serem validados ({tamanho_amostra} na amostra).")
+
+            violacoes = _verificar_invariantes(schema, df)
+            if violacoes:
+                detalhes = "\n".join(
+                    f"  {v['coluna']}: {v['invariante']} em {v['linhas']} linha(s) {v['exemplos']}" for v in violacoes
+                )
+                raise ValueError(f"Invariantes violadas em {nome_tabela}:\n{detalhes}")
+
+            if len(df) <= tamanho_amostra:
+                amostra = df
+            elif estratificar_por is not None:
+                amostra = df.groupby(estratificar_por, group_keys=False, observed=True).sample(
+                    frac=tamanho_amostra / len(df), random_state=seed
+                )
+            else:
+                amostra = df.sample(n=tamanho_amostra, random_state=seed)
+
+            linhas_reprovadas = 0
+            try:
+                _schema_sem_unicidade(nome_tabela).validate(amostra, lazy=True)
+            except SchemaErrors as e:
+                linhas_reprovadas = e.failure_cases['index'].dropna().nunique()
+                if linhas_reprovadas / len(amostra) > taxa_maxima_falhas or e.failure_cases['index'].isna().any():
+                    raise
+
+            relatorio = {
+                'linhas': len(df),
+                'amostra': len(amostra),
+                'linhas_reprovadas': int(linhas_reprovadas),
+                'taxa_falhas': linhas_reprovadas / len(amostra) if len(amostra) else 0.0,
+                'invariantes': 'ok',
+            }
+            print(f"{len(df)} registros validados (amostra de {len(amostra)}, "
+                  f"taxa de falhas {relatorio['taxa_falhas']:.4%}).")
+
+            return df, relatorio
+
+        except SchemaErrors as e:
+            print(f"Erro de validação na amostra:\n{str(e)}")
+            raise
+
+        except Exception as e:
+            print(f"Erro crítico em validate_sampled: {str(e)}")
+            raise
+
+    def validate_relationships(self, dados: Dict[str, Optional[pd.DataFrame]]) -> pd.DataFrame:
+        """
+        Checagens entre tabelas da mesma carga, sem acessar o Banco de Dados.
+
+        Verifica as FKs (`RELACIONAMENTOS`) com `isin` sobre as colunas inteiras e a
+        ordem das datas (`ORDEM_TEMPORAL`) com a menor data referenciada por poço
+        (ex.: incidente anterior à primeira produção do poço). Relações cuja tabela
+        referenciada não está na carga são ignoradas (ficam para as FKs do Postgres).
+
+        Args:
+            dados (Dict[str, DataFrame]): {nome_tabela: DataFrame} da carga.
+
+        Returns:
+            DataFrame: Failure cases no formato do Pandera (`schema_context`, `column`,
+                `check`, `check_number`, `failure_case`, `index`), mais a coluna `tabela`.
+                Vazio se tudo estiver consistente.
+
+        Example:
+            >>> falhas = validador.validate_relationships(dfs)
+            >>> falhas.groupby(['tabela', 'check']).size()
+            tabela          check
+            raw_incidentes  data_incidente >= min(raw_producao.data_producao)    3
+        """
+        falhas = []
+
+        def registrar(nome_tabela: str, coluna: str, check: str, mascara: np.ndarray, valores: pd.Series) -> None:
+            if mascara.any():
+                falhas.append(pd.DataFrame({
+                    'tabela': nome_tabela,
+                    'schema_context': 'DataFrameSchema',
+                    'column': coluna,
+                    'check': check,
+                    'check_number': None,
+                    'failure_case': valores[mascara].to_numpy(),
+                    'index': valores.index[mascara],
+                }))
+
+        def presente(nome_tabela: str) -> bool:
+            return dados.get(nome_tabela) is not None and not dados[nome_tabela].empty
+
+        for nome_tabela, colunas, referenciada, colunas_referenciadas in RELACIONAMENTOS:
+            if not (presente(nome_tabela) and presente(referenciada)):
+                continue
+            df, df_ref = dados[nome_tabela], dados[referenciada]
+
+            if len(colunas) == 1:
+                valores = df[colunas[0]]
+                mascara = ~valores.isin(df_ref[colunas_referenciadas[0]]).to_numpy()
+            else:
+                chaves = pd.MultiIndex.from_frame(df[list(colunas)])
+                mascara = ~chaves.isin(pd.MultiIndex.from_frame(df_ref[list(colunas_referenciadas)]))
+                valores = pd.Series(chaves.to_flat_index(), index=df.index)
+
+            registrar(
+                nome_tabela, ", ".join(colunas),
+                f"fk {referenciada}({', '.join(colunas_referenciadas)})", mascara, valores
+            )
+
+        for nome_tabela, coluna_data, chave, referenciada, chave_referenciada, data_referenciada in ORDEM_TEMPORAL:
+            if not (presente(nome_tabela) and presente(referenciada)):
+                continue
+            df, df_ref = dados[nome_tabela], dados[referenciada]
+
+            limite = pd.to_datetime(df_ref[data_referenciada]).groupby(df_ref[chave_referenciada].to_numpy()).min()
+            minimos = df[chave].map(limite)
+            datas = pd.to_datetime(df[coluna_data])
+            mascara = (datas < minimos).to_numpy()
+
+            registrar(
+                nome_tabela, coluna_data,
+                f"{coluna_data} >= min({referenciada}.{data_referenciada})", mascara, df[coluna_data]
+            )
+
+        if not falhas:
+            return pd.DataFrame(columns=['tabela', 'schema_context', 'column', 'check', 'check_number', 'failure_case', 'index'])
+        return pd.concat(falhas, ignore_index=True)
+
+    def split_valid_invalid(
+            self,
+            nome_tabela: str,
+            df: Optional[pd.DataFrame],
+        ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Separa as linhas válidas das inválidas a partir dos failure cases do Pandera.
+
+        Em vez de reprovar o DataFrame inteiro, cada linha com falha vai para o
+        DataFrame de rejeitados com a lista de motivos. Em códigos duplicados, a
+        primeira ocorrência é mantida e as repetições são rejeitadas. Falhas que não
+        apontam para linhas (ex.: coluna ausente ou dtype da coluna inteira) não
+        permitem a separação e continuam reprovando a carga.
+
+        Args:
+            nome_tabela (str): Tabela do schema (ex.: 'raw_producao').
+            df (Optional[DataFrame]): DataFrame para validação.
+
+        Returns:
+            Tuple[DataFrame, DataFrame]: (válidos, rejeitados). Os rejeitados têm as
+                colunas originais mais `motivos` (lista de textos).
+
+        Raises:
+            ValueError: Se o DataFrame estiver vazio ou a tabela não tiver schema.
+            SchemaErrors: Se houver falhas que não são de linhas específicas.
+
+        Example:
+            >>> validos, rejeitados = validador.split_valid_invalid('raw_producao', df_producao)
+            >>> rejeitados[['cod_producao', 'motivos']].head(1)
+              cod_producao                                 motivos
+            0      PROD-17  [pressao_bar: in_range(150, 450) (9999)]
+        """
+        try:
+            if df is None or df.empty:
+                raise ValueError("Erro: Não será possível validar os dados, nenhum DataFrame foi passado.")
+
+            schema = self.SCHEMAS.get(nome_tabela)
+            if schema is None:
+                raise ValueError(f"Nenhum schema para a tabela {nome_tabela}")
+
+            falhas = []
+            try:
+                _schema_sem_unicidade(nome_tabela).validate(df, lazy=True)
+            except SchemaErrors as e:
+                if e.failure_cases['index'].isna().any():
+                    raise
+                casos = e.failure_cases
+                falhas.append(pd.DataFrame({
+                    'index': casos['index'].to_numpy(),
+                    'motivo': [
+                        f"{coluna}: {check} ({caso})"
+                        for coluna, check, caso in zip(casos['column'], casos['check'], casos['failure_case'])
+                    ],
+                }))
+
+            for coluna in _colunas_unicas(schema):
+                repetidos = df[coluna].duplicated(keep='first').to_numpy()
+                if repetidos.any():
+                    falhas.append(pd.DataFrame({
+                        'index': df.index[repetidos],
+                        'motivo': [f"{coluna}: duplicado ({valor})" for valor in df.loc[repetidos, coluna]],
+                    }))
+
+            if not falhas:
+                return df, df.iloc[0:0].assign(motivos=pd.Series(dtype=object))
+
+            motivos = pd.concat(falhas, ignore_index=True).groupby('index', sort=False)['motivo'].agg(list)
+            reprovadas = df.index.isin(motivos.index)
+
+            validos = df[~reprovadas]
+            rejeitados = df[reprovadas].assign(motivos=motivos)
+
+            print(f"{nome_tabela}: {len(validos)} registros válidos, {len(rejeitados)} em quarentena.")
+            return validos, rejeitados
+
+        except SchemaErrors as e:
+            print(f"Erro de validação:\n{str(e)}")
+            raise
+
+        except Exception as e:
+            print(f"Erro crítico em split_valid_invalid: {str(e)}")
+            raise